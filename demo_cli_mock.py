@@ -4,15 +4,19 @@ Mock Injective CLI for demonstration purposes.
 This simulates the injectived CLI to show how governance tests would work.
 """
 
+import base64
+import fcntl
 import json
+import os
 import sys
 import time
 import random
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
 # Mock blockchain state
 MOCK_BLOCK_HEIGHT = 1000000
-MOCK_STATE_FILE = "/tmp/mock_injective_state.json"
+MOCK_STATE_FILE = os.getenv("MOCK_INJECTIVE_STATE_FILE", "/tmp/mock_injective_state.json")
 
 # Load persistent state
 def load_state():
@@ -22,7 +26,7 @@ def load_state():
                 return json.load(f)
     except:
         pass
-    return {"proposals": {}, "markets": {}}
+    return {"proposals": {}, "markets": {}, "txs": {}, "sequences": {}}
 
 def save_state(state):
     try:
@@ -31,25 +35,127 @@ def save_state(state):
     except:
         pass
 
-# Initialize state
+# Initialize state; the lock is held until exit so concurrent invocations do not lose updates
+_state_lock = open(f"{MOCK_STATE_FILE}.lock", "a")
+fcntl.flock(_state_lock, fcntl.LOCK_EX)
 _state = load_state()
 MOCK_PROPOSALS = _state.get("proposals", {})
 MOCK_MARKETS = _state.get("markets", {})
+MOCK_TXS = _state.get("txs", {})
+MOCK_SEQUENCES = _state.get("sequences", {})
+MOCK_KEYS = _state.get("keys", {})
+# Authz grants as [granter address, grantee address, message type URL]
+MOCK_GRANTS = _state.get("grants", [])
+# Gas each message type uses when executed
+MOCK_GAS_USED = {
+    "MsgSubmitProposal": 180000,
+    "MsgVote": 60000,
+    "MsgAdminUpdatePerpetualMarket": 110000,
+    "MsgMultiSend": 90000,
+    "MsgGrant": 50000,
+    "MsgExec": 40000
+}
+COMMAND_MSG_TYPES = {
+    "submit-proposal": "MsgSubmitProposal",
+    "vote": "MsgVote",
+    "admin-update-perpetual-market": "MsgAdminUpdatePerpetualMarket",
+    "multi-send": "MsgMultiSend",
+    "grant": "MsgGrant",
+    "exec": "MsgExec"
+}
+MOCK_VOTING_PERIOD = int(os.getenv("MOCK_VOTING_PERIOD", "10"))
+# Each validator key votes with the same power out of MOCK_BONDED_TOKENS
+MOCK_VOTING_POWER = 1000000
+MOCK_BONDED_TOKENS = 3 * MOCK_VOTING_POWER
 MOCK_ACCOUNTS = {
     "testcandidate": "inj1testcandidate123456789",
-    "val": "inj1validator123456789"
+    "val": "inj1validator123456789",
+    **MOCK_KEYS
 }
 
+def mock_height():
+    """Current block height; every recorded tx is included in a block of its own."""
+    return MOCK_BLOCK_HEIGHT + len(MOCK_TXS)
+
 def mock_query_block():
     """Mock query block command."""
     return {
         "block": {
             "header": {
-                "height": str(MOCK_BLOCK_HEIGHT + random.randint(0, 10))
+                "height": str(mock_height())
             }
         }
     }
 
+def record_tx(result):
+    """Record a broadcast tx so `query tx` can find it, and persist state."""
+    MOCK_TXS[result["txhash"]] = dict(result, height=str(mock_height() + 1))
+    persist()
+    return result
+
+def persist():
+    """Save the mock chain and keyring state."""
+    save_state({"proposals": MOCK_PROPOSALS, "markets": MOCK_MARKETS, "txs": MOCK_TXS,
+                "sequences": MOCK_SEQUENCES, "keys": MOCK_KEYS, "grants": MOCK_GRANTS})
+
+def requested_gas(args, gas_used):
+    """Gas limit requested with --gas ("auto" simulates), or None for the default."""
+    if "--gas" not in args:
+        return None
+    value = args[args.index("--gas") + 1]
+    if value == "auto":
+        adjustment = float(args[args.index("--gas-adjustment") + 1]) if "--gas-adjustment" in args else 1.0
+        return int(gas_used * adjustment)
+    return int(value)
+
+def out_of_gas(gas_limit, gas_used):
+    """Record a tx that ran out of gas during execution."""
+    return record_tx({
+        "txhash": f"0x{random.randint(100000, 999999)}",
+        "code": 11,
+        "raw_log": f"out of gas in location: WriteFlat; gasWanted: {gas_limit}, gasUsed: {gas_used}: out of gas",
+        "gas_wanted": str(gas_limit),
+        "gas_used": str(gas_limit)
+    })
+
+def check_sequence(from_key, args):
+    """Reject a tx signed with the wrong --sequence, like CheckTx does; else consume one."""
+    expected = MOCK_SEQUENCES.get(from_key, 0)
+    if "--sequence" in args:
+        got = int(args[args.index("--sequence") + 1])
+        if got != expected:
+            return {
+                "txhash": f"0x{random.randint(100000, 999999)}",
+                "code": 32,
+                "raw_log": f"account sequence mismatch, expected {expected}, got {got}: incorrect account sequence"
+            }
+    MOCK_SEQUENCES[from_key] = expected + 1
+    return None
+
+def mock_query_account(address):
+    """Mock query auth account command."""
+    for index, (key_name, key_address) in enumerate(MOCK_ACCOUNTS.items()):
+        if key_address == address:
+            return {
+                "account": {
+                    "@type": "/injective.types.v1beta1.EthAccount",
+                    "base_account": {
+                        "address": address,
+                        "account_number": str(index + 1),
+                        "sequence": str(MOCK_SEQUENCES.get(key_name, 0))
+                    }
+                }
+            }
+    print(f"Error: rpc error: code = NotFound desc = account {address} not found", file=sys.stderr)
+    sys.exit(1)
+
+def mock_query_tx(txhash):
+    """Mock query tx command."""
+    if txhash in MOCK_TXS:
+        return MOCK_TXS[txhash]
+    print(f"Error: tx ({txhash}) not found", file=sys.stderr)
+    sys.exit(1)
+
 def mock_query_proposal(proposal_id):
     """Mock query proposal command."""
     if proposal_id in MOCK_PROPOSALS:
@@ -66,29 +172,64 @@ def mock_query_proposal(proposal_id):
             }
         }
 
+def mock_query_tally(proposal_id):
+    """Mock query gov tally command."""
+    voters = MOCK_PROPOSALS.get(proposal_id, {}).get("voters", [])
+    return {
+        "tally": {
+            "yes_count": str(len(voters) * MOCK_VOTING_POWER),
+            "abstain_count": "0",
+            "no_count": "0",
+            "no_with_veto_count": "0"
+        }
+    }
+
+def mock_query_staking_pool():
+    """Mock query staking pool command."""
+    return {"pool": {"not_bonded_tokens": "0", "bonded_tokens": str(MOCK_BONDED_TOKENS)}}
+
+def mock_query_gov_params():
+    """Mock query gov params command."""
+    voting_period = f"{MOCK_VOTING_PERIOD}s"
+    return {
+        "voting_params": {"voting_period": voting_period},
+        "params": {
+            "min_deposit": [{"denom": "inj", "amount": "1000000000000000000"}],
+            "max_deposit_period": "60s",
+            "voting_period": voting_period,
+            "quorum": "0.334000000000000000",
+            "threshold": "0.500000000000000000"
+        }
+    }
+
 def mock_submit_proposal(proposal_file, from_key):
     """Mock submit proposal command."""
-    proposal_id = str(random.randint(1, 1000))
-    
     # Read proposal to extract market info
     with open(proposal_file, 'r') as f:
         proposal_data = json.load(f)
+    return record_tx(submit_proposal(proposal_data))
+
+def submit_proposal(proposal_data):
+    """Store a proposal and the markets it launches; return the tx result."""
+    proposal_id = str(random.randint(1, 1000))
+    now = datetime.now(timezone.utc)
     
     # Store mock proposal
     MOCK_PROPOSALS[proposal_id] = {
         "proposal": {
             "id": proposal_id,
             "status": "PROPOSAL_STATUS_VOTING_PERIOD",
-            "content": proposal_data
+            "content": proposal_data,
+            "voting_start_time": now.strftime("%Y-%m-%dT%H:%M:%S.%fZ"),
+            "voting_end_time": (now + timedelta(seconds=MOCK_VOTING_PERIOD)).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
         }
     }
     
     # Extract market info to store in mock markets when proposal passes
     messages = proposal_data.get("messages", [])
-    if messages:
-        market_info = messages[0]
+    for index, market_info in enumerate(messages):
         ticker = market_info.get("ticker", "")
-        market_id = f"market_{proposal_id}"
+        market_id = f"market_{proposal_id}" if index == 0 else f"market_{proposal_id}_{index}"
         
         # Store market for later retrieval
         MOCK_MARKETS[market_id] = {
@@ -100,9 +241,6 @@ def mock_submit_proposal(proposal_file, from_key):
             "status": "ACTIVE"
         }
     
-    # Save state to file
-    save_state({"proposals": MOCK_PROPOSALS, "markets": MOCK_MARKETS})
-    
     return {
         "txhash": f"0x{random.randint(100000, 999999)}",
         "code": 0,
@@ -117,27 +255,44 @@ def mock_submit_proposal(proposal_file, from_key):
         "raw_log": f'[{{"msg_index":0,"events":[{{"type":"submit_proposal","attributes":[{{"key":"proposal_id","value":"{proposal_id}"}}]}}]}}]'
     }
 
-def mock_vote_proposal(proposal_id, vote, from_key):
-    """Mock vote on proposal."""
+def record_vote(proposal_id, voter):
+    """Count a yes vote; a mock proposal passes on its first one."""
     if proposal_id in MOCK_PROPOSALS:
+        voters = MOCK_PROPOSALS[proposal_id].setdefault("voters", [])
+        if voter not in voters:
+            voters.append(voter)
         MOCK_PROPOSALS[proposal_id]["proposal"]["status"] = "PROPOSAL_STATUS_PASSED"
-        # Save state to file
-        save_state({"proposals": MOCK_PROPOSALS, "markets": MOCK_MARKETS})
+
+def mock_vote_proposal(proposal_id, vote, from_key):
+    """Mock vote on proposal."""
+    record_vote(proposal_id, from_key)
     
-    return {
+    return record_tx({
         "txhash": f"0x{random.randint(100000, 999999)}",
         "code": 0
-    }
+    })
 
-def mock_query_perpetual_markets():
-    """Mock query all perpetual markets."""
+def mock_query_perpetual_markets(args):
+    """Mock query all perpetual markets, paged with --limit/--offset when given."""
     markets = []
     for market_id, market_data in MOCK_MARKETS.items():
         markets.append({
             "market": market_data
         })
+    if "--limit" not in args:
+        return {
+            "markets": markets
+        }
+    
+    limit = int(args[args.index("--limit") + 1])
+    offset = int(args[args.index("--offset") + 1]) if "--offset" in args else 0
+    end = offset + limit
     return {
-        "markets": markets
+        "markets": markets[offset:end],
+        "pagination": {
+            "next_key": base64.b64encode(str(end).encode()).decode() if end < len(markets) else None,
+            "total": "0"
+        }
     }
 
 def mock_query_market(market_id):
@@ -150,14 +305,152 @@ def mock_query_market(market_id):
 def mock_update_market(market_id, rmr, from_key):
     """Mock update market admin command."""
     if market_id in MOCK_MARKETS:
-        MOCK_MARKETS[market_id]["reduce_margin_ratio"] = rmr
-        return {
+        market = MOCK_MARKETS[market_id]
+        if float(rmr) < float(market["initial_margin_ratio"]):
+            # The chain includes the tx but the message fails validation
+            return record_tx({
+                "txhash": f"0x{random.randint(100000, 999999)}",
+                "code": 5,
+                "raw_log": "failed to execute message; message index: 0: reduce margin ratio must be >= initial margin ratio: invalid request"
+            })
+        market["reduce_margin_ratio"] = rmr
+        return record_tx({
             "txhash": f"0x{random.randint(100000, 999999)}",
             "code": 0
-        }
+        })
     else:
         return {"code": 1, "error": "Market not found"}
 
+def mock_generate_tx(filtered_args, args):
+    """Mock any supported tx with --generate-only: print the unsigned tx."""
+    from_key = args[args.index("--from") + 1]
+    sender = MOCK_ACCOUNTS.get(from_key, from_key)
+    
+    if filtered_args[1:3] == ["gov", "submit-proposal"]:
+        with open(filtered_args[3], 'r') as f:
+            proposal_data = json.load(f)
+        message = {"@type": "/cosmos.gov.v1.MsgSubmitProposal", "proposer": sender, "proposal": proposal_data}
+    elif filtered_args[1:3] == ["gov", "vote"]:
+        message = {"@type": "/cosmos.gov.v1.MsgVote", "voter": sender,
+                   "proposal_id": filtered_args[3], "option": filtered_args[4]}
+    elif filtered_args[1:3] == ["authz", "grant"]:
+        message = {"@type": "/cosmos.authz.v1beta1.MsgGrant", "granter": sender, "grantee": filtered_args[3],
+                   "grant": {"authorization": {"@type": "/cosmos.authz.v1beta1.GenericAuthorization",
+                                               "msg": args[args.index("--msg-type") + 1]}}}
+    else:
+        message = {
+            "@type": "/injective.exchange.v1beta1.MsgAdminUpdatePerpetualMarket",
+            "sender": sender,
+            "market_id": filtered_args[3],
+            "new_reduce_margin_ratio": args[args.index("--reduce-margin-ratio") + 1]
+        }
+    gas_limit = requested_gas(args, MOCK_GAS_USED[message["@type"].rsplit(".", 1)[1]]) or 200000
+    
+    return {
+        "body": {"messages": [message], "memo": ""},
+        "auth_info": {"signer_infos": [], "fee": {"amount": [], "gas_limit": str(gas_limit)}},
+        "signatures": []
+    }
+
+def mock_sign_batch(tx_file, from_key, args):
+    """Mock tx sign-batch: sign each tx in the file with consecutive sequences, one per line."""
+    with open(tx_file, 'r') as f:
+        txs = [json.loads(line) for line in f if line.strip()]
+    if "--offline" in args:
+        sequence = int(args[args.index("--sequence") + 1])
+    else:
+        sequence = MOCK_SEQUENCES.get(from_key, 0)
+    
+    lines = []
+    for offset, tx in enumerate(txs):
+        tx["auth_info"]["signer_infos"] = [{"mock_key": from_key, "sequence": str(sequence + offset)}]
+        tx["signatures"] = ["bW9jaw=="]
+        lines.append(json.dumps(tx))
+    return "\n".join(lines)
+
+def mock_encode_tx(tx_file):
+    """Mock tx encode: print the signed tx as base64."""
+    with open(tx_file, 'rb') as f:
+        return base64.b64encode(f.read()).decode()
+
+def mock_broadcast_tx(tx_file):
+    """Mock tx broadcast: apply every message atomically."""
+    with open(tx_file, 'r') as f:
+        tx = json.load(f)
+    signer = tx["auth_info"]["signer_infos"][0]
+    rejected = check_sequence(signer["mock_key"], ["--sequence", signer["sequence"]])
+    if rejected:
+        return rejected
+    
+    messages = tx["body"]["messages"]
+    gas_limit = int(tx["auth_info"]["fee"]["gas_limit"])
+    gas_used = sum(MOCK_GAS_USED[msg["@type"].rsplit(".", 1)[1]] for msg in messages)
+    if gas_limit < gas_used:
+        return out_of_gas(gas_limit, gas_used)
+    
+    return execute_messages(messages, gas_limit, gas_used)
+
+def execute_messages(messages, gas_limit, gas_used):
+    """Apply a tx's messages atomically and record the tx."""
+    for index, msg in enumerate(messages):
+        if not msg["@type"].endswith("MsgAdminUpdatePerpetualMarket"):
+            continue
+        market = MOCK_MARKETS.get(msg["market_id"])
+        if market is None or float(msg["new_reduce_margin_ratio"]) < float(market["initial_margin_ratio"]):
+            return record_tx({
+                "txhash": f"0x{random.randint(100000, 999999)}",
+                "code": 5,
+                "raw_log": f"failed to execute message; message index: {index}: invalid market update: invalid request"
+            })
+    
+    result = {"txhash": f"0x{random.randint(100000, 999999)}", "code": 0}
+    for msg in messages:
+        if msg["@type"].endswith("MsgSubmitProposal"):
+            result = dict(submit_proposal(msg["proposal"]), txhash=result["txhash"])
+        elif msg["@type"].endswith("MsgVote"):
+            record_vote(msg["proposal_id"], msg["voter"])
+        elif msg["@type"].endswith("MsgGrant"):
+            MOCK_GRANTS.append([msg["granter"], msg["grantee"], msg["grant"]["authorization"]["msg"]])
+        elif msg["@type"].endswith("MsgMultiSend"):
+            # Balances are not tracked
+            continue
+        else:
+            MOCK_MARKETS[msg["market_id"]]["reduce_margin_ratio"] = msg["new_reduce_margin_ratio"]
+    return record_tx(dict(result, gas_wanted=str(gas_limit), gas_used=str(gas_used)))
+
+def exec_gas_used(tx_file):
+    """Gas a MsgExec of the tx's messages uses."""
+    with open(tx_file, 'r') as f:
+        messages = json.load(f)["body"]["messages"]
+    return MOCK_GAS_USED["MsgExec"] + sum(MOCK_GAS_USED[msg["@type"].rsplit(".", 1)[1]] for msg in messages)
+
+def mock_authz_exec(tx_file, from_key, gas_limit, gas_used):
+    """Mock tx authz exec: run another account's messages if it granted them to the signer."""
+    with open(tx_file, 'r') as f:
+        messages = json.load(f)["body"]["messages"]
+    grantee = MOCK_ACCOUNTS.get(from_key, from_key)
+    
+    for index, msg in enumerate(messages):
+        granter = msg.get("sender") or msg.get("voter") or msg.get("proposer")
+        if [granter, grantee, msg["@type"]] not in MOCK_GRANTS:
+            return record_tx({
+                "txhash": f"0x{random.randint(100000, 999999)}",
+                "code": 4,
+                "raw_log": f"failed to execute message; message index: {index}: authorization not found: unauthorized"
+            })
+    
+    return execute_messages(messages, gas_limit or 200000, gas_used)
+
+def mock_keys_add(key_name):
+    """Mock keys add command."""
+    if key_name in MOCK_ACCOUNTS:
+        print(f"Error: {key_name} already exists", file=sys.stderr)
+        sys.exit(1)
+    address = f"inj1{key_name.replace('_', '')}{random.randint(100000, 999999)}"
+    MOCK_KEYS[key_name] = MOCK_ACCOUNTS[key_name] = address
+    persist()
+    return {"name": key_name, "type": "local", "address": address}
+
 def mock_keys_show(key_name):
     """Mock keys show command."""
     if key_name in MOCK_ACCOUNTS:
@@ -180,11 +473,21 @@ def main():
         if filtered_args[0] == "query":
             if filtered_args[1] == "block":
                 result = mock_query_block()
+            elif filtered_args[1] == "tx":
+                result = mock_query_tx(filtered_args[2])
+            elif filtered_args[1] == "auth" and filtered_args[2] == "account":
+                result = mock_query_account(filtered_args[3])
             elif filtered_args[1] == "gov" and filtered_args[2] == "proposal":
                 result = mock_query_proposal(filtered_args[3])
+            elif filtered_args[1] == "gov" and filtered_args[2] == "params":
+                result = mock_query_gov_params()
+            elif filtered_args[1] == "gov" and filtered_args[2] == "tally":
+                result = mock_query_tally(filtered_args[3])
+            elif filtered_args[1] == "staking" and filtered_args[2] == "pool":
+                result = mock_query_staking_pool()
             elif filtered_args[1] == "exchange":
                 if filtered_args[2] == "perpetual-markets":
-                    result = mock_query_perpetual_markets()
+                    result = mock_query_perpetual_markets(args)
                 elif filtered_args[2] == "perpetual-market-info":
                     result = mock_query_market(filtered_args[3])
                 else:
@@ -192,8 +495,32 @@ def main():
             else:
                 result = {"error": "Unknown query command"}
         
+        elif filtered_args[0] == "tx" and filtered_args[1] == "sign-batch":
+            # Signed txs are printed one per line, not as one JSON document
+            print(mock_sign_batch(filtered_args[2], args[args.index("--from") + 1], args))
+            return
+        
+        elif filtered_args[0] == "tx" and filtered_args[1] == "encode":
+            print(mock_encode_tx(filtered_args[2]))
+            return
+        
+        elif filtered_args[0] == "tx" and filtered_args[1] == "broadcast":
+            result = mock_broadcast_tx(filtered_args[2])
+        
+        elif filtered_args[0] == "tx" and "--generate-only" in args:
+            result = mock_generate_tx(filtered_args, args)
+        
         elif filtered_args[0] == "tx":
-            if filtered_args[1] == "gov":
+            rejected = check_sequence(args[args.index("--from") + 1], args)
+            gas_used = MOCK_GAS_USED.get(COMMAND_MSG_TYPES.get(filtered_args[2]), 100000)
+            if filtered_args[1:3] == ["authz", "exec"]:
+                gas_used = exec_gas_used(filtered_args[3])
+            gas_limit = requested_gas(args, gas_used)
+            if rejected:
+                result = rejected
+            elif gas_limit is not None and gas_limit < gas_used:
+                result = out_of_gas(gas_limit, gas_used)
+            elif filtered_args[1] == "gov":
                 if filtered_args[2] == "submit-proposal":
                     from_idx = args.index("--from") + 1
                     result = mock_submit_proposal(filtered_args[3], args[from_idx])
@@ -202,6 +529,14 @@ def main():
                     result = mock_vote_proposal(filtered_args[3], filtered_args[4], args[from_idx])
                 else:
                     result = {"error": "Unknown gov tx command"}
+            elif filtered_args[1:3] == ["bank", "multi-send"]:
+                result = record_tx({"txhash": f"0x{random.randint(100000, 999999)}", "code": 0})
+            elif filtered_args[1:3] == ["authz", "grant"]:
+                granter = MOCK_ACCOUNTS.get(args[args.index("--from") + 1])
+                MOCK_GRANTS.append([granter, filtered_args[3], args[args.index("--msg-type") + 1]])
+                result = record_tx({"txhash": f"0x{random.randint(100000, 999999)}", "code": 0})
+            elif filtered_args[1:3] == ["authz", "exec"]:
+                result = mock_authz_exec(filtered_args[3], args[args.index("--from") + 1], gas_limit, gas_used)
             elif filtered_args[1] == "exchange":
                 if filtered_args[2] == "admin-update-perpetual-market":
                     rmr_idx = args.index("--reduce-margin-ratio") + 1
@@ -211,10 +546,14 @@ def main():
                     result = {"error": "Unknown exchange tx command"}
             else:
                 result = {"error": "Unknown tx command"}
+            if result.get("txhash") in MOCK_TXS and "gas_used" not in result:
+                result = record_tx(dict(result, gas_wanted=str(gas_limit or 200000), gas_used=str(gas_used)))
         
         elif filtered_args[0] == "keys":
             if filtered_args[1] == "show":
                 result = mock_keys_show(filtered_args[2])
+            elif filtered_args[1] == "add":
+                result = mock_keys_add(filtered_args[2])
             else:
                 result = {"error": "Unknown keys command"}
         
@@ -0,0 +1,110 @@
+"""
+On-disk cache of keyring addresses.
+
+`injectived keys show` spawns a process (and, for the file backend, decrypts
+the keyring) just to print an address that only changes when the keyring
+does. AddressCache keeps addresses in a JSON file shared by every process in
+a session (including pytest-xdist workers), keyed by keyring backend,
+keyring directory and the directory's mtime, so adding or replacing a key
+invalidates the entries. Lookups are served from memory after the first.
+"""
+
+import fcntl
+import json
+import logging
+import os
+import tempfile
+import threading
+from typing import Dict, Optional
+
+from test_config import config
+
+
+logger = logging.getLogger(__name__)
+
+
+class AddressCache:
+    """Key name -> address cache persisted to a shared JSON file."""
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        keyring_dir: Optional[str] = None,
+        keyring_backend: Optional[str] = None,
+    ):
+        """
+        Initialize the cache; the file is read on first use.
+
+        Args:
+            path: Cache file, shared across processes; "" disables caching
+                (defaults to config.address_cache_file)
+            keyring_dir: Directory holding the keyring (defaults to config.keyring_dir)
+            keyring_backend: Keyring backend (defaults to config.keyring_backend)
+        """
+        self.path = path if path is not None else config.address_cache_file
+        self.keyring_dir = os.path.abspath(keyring_dir or config.keyring_dir)
+        self.keyring_backend = keyring_backend or config.keyring_backend
+        self._entries: Optional[Dict[str, Dict[str, str]]] = None
+        self._lock = threading.Lock()
+
+    @property
+    def _scope(self) -> str:
+        return f"{self.keyring_backend}:{self.keyring_dir}"
+
+    def _fingerprint(self) -> Optional[str]:
+        """Identify the current keyring state, or None if it cannot be checked."""
+        try:
+            mtime = os.stat(self.keyring_dir).st_mtime_ns
+        except OSError:
+            return None
+        return f"{self._scope}:{mtime}"
+
+    def _load(self) -> Dict[str, Dict[str, str]]:
+        try:
+            with open(self.path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def get(self, key_name: str) -> Optional[str]:
+        """
+        Look up a key's address.
+
+        Returns:
+            The cached address, or None if it is unknown or the keyring changed
+        """
+        fingerprint = self._fingerprint() if self.path else None
+        if fingerprint is None:
+            return None
+
+        with self._lock:
+            if self._entries is None:
+                self._entries = self._load()
+            address = self._entries.get(fingerprint, {}).get(key_name)
+            if address is None:
+                # Another worker may have looked it up since the file was read
+                self._entries = self._load()
+                address = self._entries.get(fingerprint, {}).get(key_name)
+        return address
+
+    def put(self, key_name: str, address: str) -> None:
+        """Store a key's address for the current keyring state."""
+        fingerprint = self._fingerprint() if self.path else None
+        if fingerprint is None:
+            return
+
+        with self._lock, open(self.path + ".lock", "w") as lock_file:
+            # Serialize read-modify-write across processes
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            entries = self._load()
+            # Entries for an older state of the same keyring are stale
+            for stale in [f for f in entries if f.startswith(self._scope + ":") and f != fingerprint]:
+                del entries[stale]
+            entries.setdefault(fingerprint, {})[key_name] = address
+
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(self.path) or None, suffix=".tmp")
+            with os.fdopen(fd, "w") as f:
+                json.dump(entries, f)
+            os.replace(tmp_path, self.path)
+            self._entries = entries
+        logger.debug(f"Cached address of {key_name}")
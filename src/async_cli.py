@@ -0,0 +1,454 @@
+"""
+Asyncio wrapper for injectived commands.
+
+AsyncInjectiveCLI mirrors InjectiveCLI method for method, but runs commands
+through asyncio.create_subprocess_exec (or the native query transport) so
+independent queries and transactions can overlap. A semaphore bounds how
+many commands are in flight at once.
+"""
+
+import asyncio
+import logging
+from typing import AsyncIterator, Dict, List, Any, Optional, Tuple
+
+from test_config import config
+from injective_cli import (
+    InjectiveCLIError, DeadlineExceeded, clip_to_deadline, parse_command_output, proposal_file
+)
+from query_transport import QueryTransport, QueryTransportError, create_query_transport
+from block_waiter import BlockWaiter, BlockWaitError, BlockWaitTimeout
+from retry_policy import RetryPolicy, RetryBudget, retry_budget as session_retry_budget
+from address_cache import AddressCache
+from deadline import Deadline
+from clock import current_clock
+
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncInjectiveCLI:
+    """Asyncio wrapper for injectived CLI commands with bounded concurrency."""
+
+    def __init__(
+        self,
+        binary_path: str = "injectived",
+        transport: Optional[QueryTransport] = None,
+        max_concurrency: Optional[int] = None,
+        block_waiter: Optional[BlockWaiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        retry_budget: Optional[RetryBudget] = None,
+        address_cache: Optional[AddressCache] = None,
+    ):
+        """
+        Initialize async CLI wrapper.
+
+        Args:
+            binary_path: Path to the injectived binary
+            transport: Native query transport; defaults to the one selected by config
+            max_concurrency: Maximum commands in flight (defaults to config.max_concurrency)
+            block_waiter: Block waiter for the node's RPC; defaults to config.node_url
+            retry_policy: Failure classification and backoff; defaults to RetryPolicy()
+            retry_budget: Retry budget; defaults to the session-wide budget
+            address_cache: Persistent key address cache; defaults to the shared file
+                from config.address_cache_file
+        """
+        self.binary_path = binary_path
+        self.base_args = config.get_cli_base_args()
+        self.transport = transport if transport is not None else create_query_transport()
+        self.max_concurrency = max_concurrency or config.max_concurrency
+        self.block_waiter = block_waiter if block_waiter is not None else BlockWaiter()
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.retry_budget = retry_budget if retry_budget is not None else session_retry_budget
+        self.address_cache = address_cache or AddressCache()
+        # Cleared if injectived does not accept pagination flags for market listings
+        self._paginate_markets = True
+        self._gov_params: Optional[Dict[str, Any]] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """Return the concurrency semaphore for the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._semaphore_loop is not loop:
+            # Semaphores bind to a loop; the global instance may outlive several
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._semaphore_loop = loop
+        return self._semaphore
+
+    async def _exec(self, full_cmd: List[str], timeout: float) -> Tuple[int, str, str]:
+        """
+        Spawn one command and wait for it, killing it on timeout or cancellation.
+
+        Returns:
+            (exit code, stdout, stderr)
+
+        Raises:
+            asyncio.TimeoutError: If the command does not finish in time
+        """
+        async with self._get_semaphore():
+            process = await asyncio.create_subprocess_exec(
+                *full_cmd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+            try:
+                stdout, stderr = await asyncio.wait_for(process.communicate(), timeout)
+            except (asyncio.TimeoutError, asyncio.CancelledError):
+                # Don't leave orphaned injectived processes behind a timeout or cancelled task
+                process.kill()
+                await process.wait()
+                raise
+
+        return process.returncode, stdout.decode(), stderr.decode()
+
+    async def _run_command(
+        self,
+        cmd: List[str],
+        retry_count: Optional[int] = None,
+        timeout: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """
+        Execute a CLI command with retry logic.
+
+        Permanent failures are raised at once; transient ones are retried with
+        jittered backoff while the session's retry budget lasts. Timeouts and
+        backoffs are clipped to the current deadline, if one is active.
+
+        Args:
+            cmd: Command arguments list
+            retry_count: Maximum attempts; defaults to the policy for this command
+            timeout: Per-attempt timeout in seconds (defaults to config.test_timeout)
+
+        Returns:
+            Parsed JSON response
+
+        Raises:
+            InjectiveCLIError: On command failure
+        """
+        full_cmd = [self.binary_path] + cmd + self.base_args
+        timeout = timeout if timeout is not None else config.test_timeout
+        policy = self.retry_policy.for_command(cmd)
+        attempts = retry_count if retry_count is not None else policy.max_attempts
+
+        for attempt in range(attempts):
+            attempt_timeout = clip_to_deadline(timeout)
+            try:
+                logger.info(f"Executing command (attempt {attempt + 1}): {' '.join(full_cmd)}")
+                returncode, stdout, stderr = await self._exec(full_cmd, attempt_timeout)
+
+                if returncode == 0:
+                    return parse_command_output(stdout)
+
+                error_msg = f"Command failed with code {returncode}: {stderr}"
+                retryable = policy.is_transient(stderr, returncode)
+
+            except asyncio.TimeoutError:
+                if attempt_timeout < timeout:
+                    raise DeadlineExceeded(f"Deadline exceeded after {attempt_timeout:.1f}s: {' '.join(cmd)}")
+                error_msg = f"Command timed out after {timeout} seconds"
+                retryable = policy.retry_on_timeout
+
+            except OSError as e:
+                error_msg = f"Unexpected error: {e}"
+                retryable = False
+
+            logger.error(error_msg)
+
+            if not retryable or attempt == attempts - 1:
+                raise InjectiveCLIError(error_msg)
+            if not self.retry_budget.consume():
+                logger.warning("Retry budget exhausted; not retrying")
+                raise InjectiveCLIError(error_msg)
+
+            # Back off outside the semaphore so other calls can proceed
+            await current_clock().async_sleep(clip_to_deadline(policy.backoff(attempt)))
+
+        raise InjectiveCLIError("All retry attempts failed")
+
+    async def _query(
+        self, cmd: List[str], timeout: Optional[float] = None, retry_count: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Execute a read-only query, preferring the native transport.
+
+        Commands the transport cannot answer fall back to spawning injectived.
+        """
+        if self.transport is not None and self.transport.supports(cmd):
+            timeout = clip_to_deadline(timeout if timeout is not None else config.test_timeout)
+            async with self._get_semaphore():
+                try:
+                    return await asyncio.wait_for(
+                        asyncio.to_thread(self.transport.query, cmd, timeout), timeout
+                    )
+                except asyncio.TimeoutError:
+                    raise InjectiveCLIError(f"Query timed out after {timeout} seconds")
+                except QueryTransportError as e:
+                    logger.error(str(e))
+                    raise InjectiveCLIError(str(e)) from e
+
+        return await self._run_command(cmd, retry_count=retry_count, timeout=timeout)
+
+    async def query_market(self, market_id: str, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """Query perpetual market by ID."""
+        cmd = ["query", "exchange", "perpetual-market-info", market_id]
+        return await self._query(cmd, timeout=timeout)
+
+    async def query_all_markets(self, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """Query all perpetual markets."""
+        cmd = ["query", "exchange", "perpetual-markets"]
+        return await self._query(cmd, timeout=timeout)
+
+    async def iter_markets(
+        self, page_limit: Optional[int] = None, timeout: Optional[float] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Yield perpetual markets page by page, fetching each page only when needed.
+
+        Pages by key over the native transport and by offset through injectived,
+        like InjectiveCLI.iter_markets.
+
+        Args:
+            page_limit: Markets per page (defaults to config.markets_page_limit)
+            timeout: Timeout in seconds for each page
+
+        Yields:
+            Market entries in the same shape as query_all_markets()["markets"]
+        """
+        page_limit = page_limit or config.markets_page_limit
+        base_cmd = ["query", "exchange", "perpetual-markets"]
+        native = self.transport is not None and self.transport.supports(base_cmd + ["--limit", "1"])
+        offset, page_key = 0, None
+
+        while True:
+            if not self._paginate_markets:
+                for market in (await self.query_all_markets(timeout=timeout)).get("markets", []):
+                    yield market
+                return
+
+            cmd = base_cmd + ["--limit", str(page_limit)]
+            if native:
+                cmd += ["--page-key", page_key] if page_key else []
+            else:
+                cmd += ["--offset", str(offset)]
+
+            try:
+                page = await self._query(cmd, timeout=timeout)
+            except InjectiveCLIError as e:
+                if offset or page_key or "unknown flag" not in str(e):
+                    raise
+                logger.warning("injectived does not paginate perpetual-markets; listing all at once")
+                self._paginate_markets = False
+                continue
+
+            markets = page.get("markets", [])
+            for market in markets:
+                yield market
+
+            page_key = (page.get("pagination") or {}).get("next_key")
+            # A native page can be empty after dropping non-perpetual markets;
+            # an empty offset page means the listing shrank underneath us
+            if not page_key or (not native and not markets):
+                return
+            offset += len(markets)
+
+    async def query_markets(
+        self, market_ids: List[str], timeout: Optional[float] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Query several perpetual markets by ID at once, like InjectiveCLI.query_markets.
+
+        Args:
+            market_ids: Market IDs to fetch
+            timeout: Timeout in seconds for each query
+
+        Returns:
+            Market ID -> market in the {"market": {...}} shape; unknown IDs are absent
+        """
+        wanted = set(market_ids)
+        found: Dict[str, Dict[str, Any]] = {}
+        if not wanted:
+            return found
+
+        cmd = ["query", "exchange", "perpetual-markets", "--market-ids", ",".join(sorted(wanted))]
+        if self.transport is not None and self.transport.supports(cmd):
+            for market in (await self._query(cmd, timeout=timeout)).get("markets", []):
+                if market.get("market", {}).get("market_id") in wanted:
+                    found[market["market"]["market_id"]] = market
+            return found
+
+        async for market in self.iter_markets(timeout=timeout):
+            market_id = market.get("market", {}).get("market_id")
+            if market_id in wanted:
+                found[market_id] = market
+                if len(found) == len(wanted):
+                    break
+        return found
+
+    async def create_market_proposal(
+        self, proposal_json: str, from_key: str, timeout: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """
+        Submit a governance proposal to create a perpetual market.
+
+        Args:
+            proposal_json: JSON string or file path containing proposal
+            from_key: Key name to submit proposal from
+            timeout: Per-attempt timeout in seconds
+
+        Returns:
+            Transaction result
+        """
+        with proposal_file(proposal_json) as path:
+            cmd = ["tx", "gov", "submit-proposal", path, "--from", from_key]
+            return await self._run_command(cmd, timeout=timeout)
+
+    async def vote_proposal(
+        self, proposal_id: str, vote: str, from_key: str, timeout: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """Vote on a governance proposal."""
+        cmd = ["tx", "gov", "vote", proposal_id, vote, "--from", from_key]
+        return await self._run_command(cmd, timeout=timeout)
+
+    async def query_proposal(self, proposal_id: str, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """Query governance proposal status."""
+        cmd = ["query", "gov", "proposal", proposal_id]
+        return await self._query(cmd, timeout=timeout)
+
+    async def query_gov_params(self, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """Query governance params, once per session; they only change through governance."""
+        if self._gov_params is None:
+            self._gov_params = await self._query(["query", "gov", "params"], timeout=timeout)
+        return self._gov_params
+
+    async def update_market_admin(
+        self, market_id: str, rmr: str, from_key: str, timeout: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """
+        Update market parameters via admin message.
+
+        Args:
+            market_id: Market ID to update
+            rmr: New RMR value as string (e.g., "0.1")
+            from_key: Admin key name
+            timeout: Per-attempt timeout in seconds
+
+        Returns:
+            Transaction result
+        """
+        cmd = [
+            "tx", "exchange", "admin-update-perpetual-market",
+            market_id,
+            "--reduce-margin-ratio", rmr,
+            "--from", from_key
+        ]
+        return await self._run_command(cmd, timeout=timeout)
+
+    async def query_tx(self, txhash: str, timeout: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """
+        Look up an included transaction by hash.
+
+        Returns:
+            The tx result, or None if the tx is not (yet) included
+        """
+        cmd = ["query", "tx", txhash]
+        try:
+            result = await self._query(cmd, timeout=timeout, retry_count=1)
+        except InjectiveCLIError as e:
+            logger.debug(f"Tx {txhash} not found yet: {e}")
+            return None
+
+        return result if result.get("txhash") else None
+
+    async def wait_for_tx(self, txhash: str, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Wait until a broadcast transaction is included in a block.
+
+        Args:
+            txhash: Hash returned in the broadcast result
+            timeout: Maximum seconds to wait (defaults to config.test_timeout)
+
+        Returns:
+            Included tx result with height, code, raw_log and events
+        """
+        return (await self.wait_for_txs([txhash], timeout))[txhash]
+
+    async def wait_for_txs(self, txhashes: List[str], timeout: Optional[float] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Wait until a batch of broadcast transactions are all included.
+
+        Still-pending hashes are looked up together every config.tx_poll_interval
+        seconds, like the polling fallback of InjectiveCLI's tx tracker.
+
+        Args:
+            txhashes: Hashes returned in the broadcast results
+            timeout: Maximum seconds to wait for the whole batch
+
+        Returns:
+            Mapping of each hash to its included tx result
+        """
+        timeout = clip_to_deadline(timeout if timeout is not None else config.test_timeout)
+        wait_deadline = Deadline(timeout)
+        results: Dict[str, Dict[str, Any]] = {}
+
+        while True:
+            pending = [txhash for txhash in txhashes if txhash not in results]
+            for txhash, result in zip(pending, await asyncio.gather(*(self.query_tx(h) for h in pending))):
+                if result is not None:
+                    result["code"] = int(result.get("code", 0))
+                    results[txhash] = result
+            if len(results) == len(txhashes):
+                return results
+
+            if wait_deadline.expired():
+                missing = [txhash for txhash in txhashes if txhash not in results]
+                raise InjectiveCLIError(f"Transactions not included within {timeout}s: {', '.join(missing)}")
+            await current_clock().async_sleep(wait_deadline.clip(config.tx_poll_interval))
+
+    async def get_account_info(self, key_name: str, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """Get account information for a key, from the address cache when possible."""
+        address = self.address_cache.get(key_name)
+        if address is not None:
+            return {"output": address}
+
+        cmd = ["keys", "show", key_name, "--address"]
+        result = await self._run_command(cmd, timeout=timeout)
+        if result.get("output"):
+            self.address_cache.put(key_name, result["output"])
+        return result
+
+    async def wait_for_next_block(self, blocks: int = 1, timeout: Optional[float] = None) -> int:
+        """
+        Wait for specified number of blocks.
+
+        Args:
+            blocks: Number of blocks to wait for
+            timeout: Maximum seconds to wait (defaults to config.test_timeout)
+
+        Returns:
+            The observed block height
+        """
+        logger.info(f"Waiting for {blocks} block(s)...")
+        timeout = clip_to_deadline(timeout if timeout is not None else config.test_timeout)
+
+        try:
+            start_height = await asyncio.to_thread(self.block_waiter.current_height)
+            return await asyncio.to_thread(
+                self.block_waiter.wait_for_height, start_height + blocks, timeout
+            )
+        except BlockWaitTimeout as e:
+            raise InjectiveCLIError(str(e)) from e
+        except BlockWaitError as e:
+            # No RPC endpoint to watch (e.g. the mock CLI): fall back to the block time estimate
+            logger.warning(f"{e}; assuming ~3 second block time")
+            await current_clock().async_sleep(clip_to_deadline(blocks * 3))
+            return await self.get_latest_block_height()
+
+    async def get_latest_block_height(self, timeout: Optional[float] = None) -> int:
+        """Get the current block height."""
+        cmd = ["query", "block"]
+        result = await self._query(cmd, timeout=timeout)
+        return int(result.get("block", {}).get("header", {}).get("height", 0))
+
+
+# Global async CLI instance
+async_cli = AsyncInjectiveCLI()
@@ -0,0 +1,316 @@
+"""
+Asyncio counterparts of the market utilities for RMR testing.
+
+Each helper mirrors the MarketUtils method of the same name, so independent
+market flows can be awaited together with asyncio.gather.
+"""
+
+import asyncio
+import logging
+from typing import Dict, List, Any, Optional
+from decimal import Decimal, ROUND_DOWN
+
+from async_cli import async_cli
+from injective_cli import InjectiveCLIError
+from market_utils import MarketUtils
+from test_config import config
+from deadline import Deadline, deadline_scope
+from gov_schedule import DEPOSIT_PERIOD, GovParams, poll_delay
+from query_cache import TERMINAL_PROPOSAL_STATUSES
+from clock import current_clock
+
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncMarketUtils:
+    """Async utilities for perpetual market operations."""
+
+    # Proposal JSON construction is pure and shared with the sync helpers
+    create_market_proposal_json = staticmethod(MarketUtils.create_market_proposal_json)
+
+    @staticmethod
+    async def submit_and_pass_proposal(proposal_json: str, timeout: int = 60,
+                                       deadline: Optional[Deadline] = None,
+                                       voter_keys: Optional[List[str]] = None) -> str:
+        """
+        Submit a governance proposal and vote to pass it.
+
+        Args:
+            proposal_json: Proposal JSON string
+            timeout: Timeout in seconds for the whole flow
+            deadline: Enclosing deadline; the earlier of the two applies
+            voter_keys: Keys voting yes, concurrently (defaults to config.voter_keys)
+
+        Returns:
+            Proposal ID
+        """
+        with deadline_scope(timeout, deadline) as flow_deadline:
+            return await AsyncMarketUtils._submit_and_pass_proposal(
+                proposal_json, flow_deadline, voter_keys or config.voter_keys
+            )
+
+    @staticmethod
+    async def _submit_and_pass_proposal(proposal_json: str, flow_deadline: Deadline,
+                                        voter_keys: List[str]) -> str:
+        """Submit, vote and wait for the proposal to pass before flow_deadline."""
+        gov_params = GovParams(await async_cli.query_gov_params())
+        MarketUtils._check_voting_period(gov_params, flow_deadline)
+
+        # Submit proposal
+        logger.info("Submitting governance proposal...")
+        result = await async_cli.create_market_proposal(proposal_json, config.admin_key)
+
+        if "code" in result and result["code"] != 0:
+            raise InjectiveCLIError(f"Failed to submit proposal: {result}")
+
+        # Wait for the submission to be included; the proposal is then in its voting period
+        included = await AsyncMarketUtils.wait_for_inclusion(result)
+        if included.get("code", 0) != 0:
+            raise InjectiveCLIError(f"Proposal submission failed in block: {included}")
+
+        # Extract proposal ID from transaction events
+        proposal_id = MarketUtils._extract_proposal_id(included)
+        logger.info(f"Proposal submitted with ID: {proposal_id}")
+
+        proposal = await AsyncMarketUtils._wait_for_voting_period(proposal_id, flow_deadline)
+        voting_end = gov_params.voting_end(proposal, current_clock().time())
+
+        if proposal.get("status") not in TERMINAL_PROPOSAL_STATUSES:
+            # Vote on proposal
+            logger.info(f"Voting on proposal {proposal_id} with {len(voter_keys)} key(s)...")
+            error = await AsyncMarketUtils._cast_votes(proposal_id, voter_keys)
+            if error is not None:
+                raise InjectiveCLIError(f"Failed to vote on proposal {proposal_id}: {error}")
+
+        # Wait for proposal to pass
+        while not flow_deadline.expired():
+            proposal_status = await async_cli.query_proposal(proposal_id)
+            status = proposal_status.get("proposal", {}).get("status", "")
+
+            if status == "PROPOSAL_STATUS_PASSED":
+                logger.info(f"Proposal {proposal_id} passed successfully")
+                return proposal_id
+            elif status in ["PROPOSAL_STATUS_REJECTED", "PROPOSAL_STATUS_FAILED"]:
+                raise InjectiveCLIError(f"Proposal {proposal_id} failed with status: {status}")
+
+            delay = poll_delay(voting_end, current_clock().time())
+            if delay is not None:
+                await current_clock().async_sleep(flow_deadline.clip(delay))
+                continue
+
+            # Voting has ended; the outcome is set when the next block is processed
+            try:
+                await async_cli.wait_for_next_block(1)
+            except InjectiveCLIError:
+                if not flow_deadline.expired():
+                    raise
+
+        raise InjectiveCLIError(f"Proposal {proposal_id} did not pass within {flow_deadline.timeout}s")
+
+    @staticmethod
+    async def _cast_votes(proposal_id: str, voter_keys: List[str]) -> Optional[str]:
+        """
+        Vote yes from every voter key at once and wait for the votes to be included.
+
+        Returns:
+            None if at least one vote was included successfully, else the error
+        """
+        async def send(voter_key: str) -> Dict[str, Any]:
+            try:
+                return await async_cli.vote_proposal(proposal_id, "yes", voter_key)
+            except InjectiveCLIError as e:
+                return {"code": 1, "raw_log": str(e)}
+
+        results = await asyncio.gather(*(send(key) for key in voter_keys))
+        broadcast = [result["txhash"] for result in results
+                     if int(result.get("code", 0)) == 0 and result.get("txhash")]
+        included = await async_cli.wait_for_txs(broadcast) if broadcast else {}
+
+        # One included vote is enough to carry on; the tally decides the rest
+        errors = []
+        for result in results:
+            final = included.get(result.get("txhash"), result)
+            if final is not result and int(final.get("code", 0)) == 0:
+                return None
+            errors.append(final.get("raw_log") or f"code {final.get('code')}")
+        return "; ".join(errors) or "no vote was cast"
+
+    @staticmethod
+    async def _wait_for_voting_period(proposal_id: str, flow_deadline: Deadline) -> Dict[str, Any]:
+        """Return the proposal once it has left its deposit period, checking once per block."""
+        while True:
+            proposal = (await async_cli.query_proposal(proposal_id)).get("proposal", {})
+            if proposal.get("status") != DEPOSIT_PERIOD:
+                return proposal
+
+            if flow_deadline.expired():
+                raise InjectiveCLIError(
+                    f"Proposal {proposal_id} did not reach its voting period within {flow_deadline.timeout}s"
+                )
+            await async_cli.wait_for_next_block(1)
+
+    @staticmethod
+    async def wait_for_inclusion(tx_result: Dict[str, Any], timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Wait for a broadcast transaction to be included in a block.
+
+        Args:
+            tx_result: Broadcast result returned by an AsyncInjectiveCLI tx method
+            timeout: Maximum seconds to wait (defaults to config.test_timeout)
+
+        Returns:
+            The included tx result (height, code, raw_log, events)
+        """
+        txhash = tx_result.get("txhash")
+        if not txhash:
+            # Nothing to track; give the chain a block to process it
+            await async_cli.wait_for_next_block(1)
+            return tx_result
+
+        return await async_cli.wait_for_tx(txhash, timeout)
+
+    @staticmethod
+    async def get_market_by_ticker(ticker: str) -> Optional[Dict[str, Any]]:
+        """
+        Find a market by its ticker, stopping at the first match.
+
+        Args:
+            ticker: Market ticker to search for
+
+        Returns:
+            Market information or None if not found
+        """
+        async for market in async_cli.iter_markets():
+            if market.get("market", {}).get("ticker") == ticker:
+                return market
+
+        return None
+
+    @staticmethod
+    async def wait_for_market(ticker: str, timeout: float = 60,
+                              deadline: Optional[Deadline] = None) -> Optional[Dict[str, Any]]:
+        """
+        Wait for a market launched by governance to become queryable.
+
+        Checks once per block instead of sleeping a fixed time.
+
+        Args:
+            ticker: Market ticker to wait for
+            timeout: Maximum seconds to wait
+            deadline: Enclosing deadline; the earlier of the two applies
+
+        Returns:
+            Market information or None if it did not appear in time
+        """
+        with deadline_scope(timeout, deadline) as wait_deadline:
+            while True:
+                market = await AsyncMarketUtils.get_market_by_ticker(ticker)
+                if market:
+                    return market
+
+                if wait_deadline.expired():
+                    return None
+
+                try:
+                    await async_cli.wait_for_next_block(1)
+                except InjectiveCLIError:
+                    return None
+
+    @staticmethod
+    async def verify_rmr_value(market_id: str, expected_rmr: float, tolerance: float = 0.000001) -> bool:
+        """
+        Verify that a market has the expected RMR value.
+
+        Args:
+            market_id: Market ID to check
+            expected_rmr: Expected RMR value
+            tolerance: Tolerance for floating point comparison
+
+        Returns:
+            True if RMR matches expected value
+        """
+        market_info = await async_cli.query_market(market_id)
+        return MarketUtils._check_rmr(market_id, market_info, expected_rmr, tolerance)
+
+    @staticmethod
+    async def verify_rmr_values(expected: Dict[str, float]) -> Dict[str, Dict[str, Any]]:
+        """
+        Verify the RMR of many markets with one market query.
+
+        Args:
+            expected: Market ID -> expected RMR value
+
+        Returns:
+            Market ID -> {"expected", "actual", "error"} for each market that
+            does not match; empty if all of them do
+        """
+        markets = await async_cli.query_markets(list(expected))
+        return MarketUtils._rmr_mismatches(expected, markets)
+
+    @staticmethod
+    async def update_market_rmr(market_id: str, new_rmr: float, deadline: Optional[Deadline] = None) -> bool:
+        """
+        Update market RMR via admin message.
+
+        Args:
+            market_id: Market ID to update
+            new_rmr: New RMR value
+            deadline: Deadline for the update, inclusion and verification
+
+        Returns:
+            True if update was successful
+        """
+        rmr_str = str(Decimal(str(new_rmr)).quantize(Decimal('0.000001'), rounding=ROUND_DOWN))
+
+        try:
+            with deadline_scope(deadline=deadline):
+                result = await async_cli.update_market_admin(market_id, rmr_str, config.admin_key)
+
+                if "code" in result and result["code"] != 0:
+                    logger.error(f"Failed to update market RMR: {result}")
+                    return False
+
+                # Wait for the update tx to be included before verifying
+                included = await AsyncMarketUtils.wait_for_inclusion(result)
+                if included.get("code", 0) != 0:
+                    logger.error(f"Market RMR update failed in block: {included}")
+                    return False
+
+                # Verify the update
+                return await AsyncMarketUtils.verify_rmr_value(market_id, new_rmr)
+
+        except InjectiveCLIError as e:
+            logger.error(f"Exception during market RMR update: {e}")
+            return False
+
+
+# Convenience functions
+async def create_test_market(ticker: str, rmr: float, timeout: float = 120,
+                             deadline: Optional[Deadline] = None, **kwargs) -> str:
+    """
+    Create a test market with specified RMR and return market ID.
+
+    The proposal flow and the wait for the market share one deadline.
+    """
+    proposal_json = AsyncMarketUtils.create_market_proposal_json(
+        ticker=ticker,
+        base_denom="tst",
+        quote_denom="usdt",
+        rmr=rmr,
+        **kwargs
+    )
+
+    with deadline_scope(timeout, deadline) as flow_deadline:
+        await AsyncMarketUtils.submit_and_pass_proposal(
+            proposal_json, timeout=flow_deadline.remaining(), deadline=flow_deadline
+        )
+
+        # Wait for market to be created
+        market = await AsyncMarketUtils.wait_for_market(ticker, timeout=flow_deadline.remaining(),
+                                                        deadline=flow_deadline)
+
+    if not market:
+        raise InjectiveCLIError(f"Market {ticker} not found after creation")
+
+    return market.get("market", {}).get("market_id", "")
@@ -0,0 +1,134 @@
+"""
+Event-driven block waiting against the node's Tendermint RPC.
+
+BlockWaiter subscribes to NewBlock events on the RPC websocket and returns
+as soon as the target height is committed. If the websocket is not
+available it polls /status instead.
+"""
+
+import logging
+import socket
+import time
+from typing import Optional
+from urllib.parse import urlparse
+
+import requests
+
+from test_config import config
+from tendermint_ws import TendermintWebSocket, WebSocketError
+
+
+logger = logging.getLogger(__name__)
+
+
+class BlockWaitError(Exception):
+    """Raised when the RPC endpoint cannot be reached at all."""
+    pass
+
+
+class BlockWaitTimeout(BlockWaitError):
+    """Raised when the target height is not reached in time."""
+    pass
+
+
+def rpc_http_url(node_url: str) -> str:
+    """Convert a CLI --node URL (tcp://host:port) into an HTTP RPC URL."""
+    parsed = urlparse(node_url)
+    if parsed.scheme in ("http", "https"):
+        return node_url.rstrip("/")
+    return f"http://{parsed.hostname or 'localhost'}:{parsed.port or 26657}"
+
+
+class BlockWaiter:
+    """Waits for block heights using NewBlock events, falling back to polling /status."""
+
+    def __init__(self, node_url: Optional[str] = None, poll_interval: Optional[float] = None):
+        """
+        Initialize the block waiter.
+
+        Args:
+            node_url: Node RPC address (defaults to config.node_url)
+            poll_interval: Seconds between /status polls in fallback mode
+        """
+        self.rpc_url = rpc_http_url(node_url or config.node_url)
+        self.poll_interval = poll_interval if poll_interval is not None else config.block_poll_interval
+        self.session = requests.Session()
+
+    def current_height(self) -> int:
+        """
+        Return the latest committed height from /status.
+
+        Raises:
+            BlockWaitError: If the RPC endpoint is unreachable or answers garbage
+        """
+        try:
+            response = self.session.get(f"{self.rpc_url}/status", timeout=10)
+            response.raise_for_status()
+            sync_info = response.json()["result"]["sync_info"]
+            return int(sync_info["latest_block_height"])
+        except (requests.RequestException, KeyError, ValueError) as e:
+            raise BlockWaitError(f"Failed to read height from {self.rpc_url}/status: {e}") from e
+
+    def wait_for_height(self, target: int, timeout: float) -> int:
+        """
+        Block until the chain reaches the target height.
+
+        Args:
+            target: Height to wait for
+            timeout: Maximum seconds to wait
+
+        Returns:
+            The first observed height >= target
+
+        Raises:
+            BlockWaitTimeout: If the height is not reached in time
+            BlockWaitError: If the RPC endpoint is unreachable
+        """
+        deadline = time.monotonic() + timeout
+
+        try:
+            return self._wait_websocket(target, deadline)
+        except (WebSocketError, OSError) as e:
+            logger.warning(f"NewBlock subscription unavailable ({e}); polling /status instead")
+            return self._wait_polling(target, deadline)
+
+    def _wait_websocket(self, target: int, deadline: float) -> int:
+        """Wait for the target height via a NewBlock subscription."""
+        with TendermintWebSocket(self.rpc_url, timeout=max(deadline - time.monotonic(), 0.1)) as ws:
+            # Subscribe before reading the height so no block slips between the two
+            ws.subscribe("tm.event='NewBlock'")
+
+            height = self.current_height()
+            while height < target:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise BlockWaitTimeout(f"Height {target} not reached; last seen {height}")
+                ws.set_timeout(remaining)
+
+                try:
+                    message = ws.receive()
+                except socket.timeout:
+                    raise BlockWaitTimeout(f"Height {target} not reached; last seen {height}")
+
+                header = (message.get("result", {}).get("data", {}).get("value", {})
+                          .get("block", {}).get("header", {}))
+                if "height" in header:
+                    height = int(header["height"])
+                    logger.debug(f"NewBlock at height {height}")
+
+            return height
+
+    def _wait_polling(self, target: int, deadline: float) -> int:
+        """Wait for the target height by polling /status."""
+        while True:
+            height = self.current_height()
+            if height >= target:
+                return height
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise BlockWaitTimeout(f"Height {target} not reached; last seen {height}")
+            time.sleep(min(self.poll_interval, remaining))
+
+    def close(self) -> None:
+        self.session.close()
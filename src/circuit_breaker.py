@@ -0,0 +1,115 @@
+"""
+Circuit breaker for the node connection.
+
+After a run of consecutive connection or timeout failures the breaker opens
+and callers fail fast instead of each waiting out its own timeouts and
+retries. Once the reset timeout has passed, one caller is let through as a
+half-open probe; its outcome closes the breaker again or re-opens it.
+"""
+
+import logging
+import re
+import threading
+from typing import Callable, Optional
+
+from test_config import config
+from clock import current_clock
+
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# Decisions returned by CircuitBreaker.acquire
+ALLOW = "allow"
+PROBE = "probe"
+REJECT = "reject"
+
+# Failures that mean the node itself is unreachable or stalled
+CONNECTION_FAILURE_PATTERNS = re.compile(
+    r"connection refused|connection reset|newconnectionerror|max retries exceeded"
+    r"|timed out|timeout|deadline exceeded|\beof\b|code = unavailable|post failed|no such host",
+    re.IGNORECASE,
+)
+
+
+def is_connection_failure(error: str) -> bool:
+    """Return True if an error message says the node could not be reached."""
+    return bool(CONNECTION_FAILURE_PATTERNS.search(error))
+
+
+class CircuitBreaker:
+    """Tracks consecutive node failures and decides whether calls may proceed."""
+
+    def __init__(
+        self,
+        failure_threshold: Optional[int] = None,
+        reset_timeout: Optional[float] = None,
+        clock: Optional[Callable[[], float]] = None,
+    ):
+        """
+        Initialize the breaker in the closed state.
+
+        Args:
+            failure_threshold: Consecutive failures that open the circuit (defaults to config)
+            reset_timeout: Seconds to stay open before allowing a probe (defaults to config)
+            clock: Monotonic time source (defaults to whichever clock is installed when read)
+        """
+        self.failure_threshold = (failure_threshold if failure_threshold is not None
+                                  else config.circuit_failure_threshold)
+        self.reset_timeout = reset_timeout if reset_timeout is not None else config.circuit_reset_timeout
+        self.clock = clock or (lambda: current_clock().monotonic())
+        self.state = CLOSED
+        self.consecutive_failures = 0
+        self.opened_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    @property
+    def is_open(self) -> bool:
+        """True unless the breaker is closed."""
+        return self.state != CLOSED
+
+    def retry_in(self) -> float:
+        """Seconds until the next probe is allowed (0 when closed)."""
+        with self._lock:
+            if self.state == CLOSED or self.opened_at is None:
+                return 0.0
+            return max(self.opened_at + self.reset_timeout - self.clock(), 0.0)
+
+    def acquire(self) -> str:
+        """
+        Decide whether a call may proceed.
+
+        Returns:
+            ALLOW when closed; PROBE for the single caller that should check
+            whether the node recovered; REJECT while open or a probe is running
+        """
+        with self._lock:
+            if self.state == CLOSED:
+                return ALLOW
+            if self.state == OPEN and self.clock() - self.opened_at >= self.reset_timeout:
+                self.state = HALF_OPEN
+                logger.info("Circuit half-open; probing node")
+                return PROBE
+            return REJECT
+
+    def record_success(self) -> None:
+        """Record that the node answered; closes the circuit."""
+        with self._lock:
+            if self.state != CLOSED:
+                logger.info("Node reachable again; circuit closed")
+            self.state = CLOSED
+            self.consecutive_failures = 0
+            self.opened_at = None
+
+    def record_failure(self) -> None:
+        """Record a connection or timeout failure; may open the circuit."""
+        with self._lock:
+            self.consecutive_failures += 1
+            if self.state == HALF_OPEN or (
+                    self.state == CLOSED and self.consecutive_failures >= self.failure_threshold):
+                logger.error(f"Circuit opened after {self.consecutive_failures} consecutive node failures")
+                self.state = OPEN
+                self.opened_at = self.clock()
@@ -0,0 +1,95 @@
+"""
+Injectable clock for every sleep and timeout in the test flows.
+
+Flows and tests sleep, read the wall clock and build deadlines through
+current_clock() rather than the time module. Against a live node that is the
+SystemClock. Against the mock injectived nothing happens while a flow
+sleeps, so the session installs a VirtualClock instead: sleeping advances
+its time at once, deadlines expire on that same time, and a run that would
+spend minutes waiting on block times and voting periods finishes in seconds.
+
+Waits on real external events (BlockWaiter, TxTracker) keep the real clock:
+a virtual timeout there would expire before the node could answer.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+
+
+logger = logging.getLogger(__name__)
+
+
+class SystemClock:
+    """Real time: sleeps block for the full duration."""
+
+    def time(self) -> float:
+        """Wall-clock seconds since the epoch."""
+        return time.time()
+
+    def monotonic(self) -> float:
+        return time.monotonic()
+
+    def sleep(self, seconds: float) -> None:
+        if seconds > 0:
+            time.sleep(seconds)
+
+    async def async_sleep(self, seconds: float) -> None:
+        await asyncio.sleep(max(seconds, 0))
+
+
+class VirtualClock(SystemClock):
+    """Real time plus an offset that every sleep advances instead of blocking."""
+
+    def __init__(self):
+        self.slept = 0.0
+        self.sleeps = 0
+        self._offset = 0.0
+        self._lock = threading.Lock()
+
+    def time(self) -> float:
+        with self._lock:
+            return time.time() + self._offset
+
+    def monotonic(self) -> float:
+        with self._lock:
+            return time.monotonic() + self._offset
+
+    def advance(self, seconds: float) -> None:
+        """Move time forward without sleeping."""
+        if seconds > 0:
+            with self._lock:
+                self._offset += seconds
+                self.slept += seconds
+                self.sleeps += 1
+
+    def sleep(self, seconds: float) -> None:
+        self.advance(seconds)
+        # Still yield, so threads polling each other make progress
+        time.sleep(0)
+
+    async def async_sleep(self, seconds: float) -> None:
+        self.advance(seconds)
+        await asyncio.sleep(0)
+
+
+_clock: SystemClock = SystemClock()
+
+
+def current_clock() -> SystemClock:
+    """Return the clock flows sleep and time themselves on."""
+    return _clock
+
+
+def set_clock(clock: SystemClock) -> SystemClock:
+    """
+    Install a clock for the whole process.
+
+    Returns:
+        The previously installed clock, so callers can restore it
+    """
+    global _clock
+    previous, _clock = _clock, clock
+    logger.debug(f"Using {type(clock).__name__}")
+    return previous
@@ -0,0 +1,107 @@
+"""
+Deadlines for multi-step test flows.
+
+A Deadline is an absolute point in time. deadline_scope makes one current
+for everything called inside it (via a context variable, so it follows the
+call stack and asyncio tasks without extra parameters); nested scopes can
+only shorten it. InjectiveCLI clips subprocess timeouts and retry sleeps to
+whatever is left, which gives each flow a hard latency ceiling.
+"""
+
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Callable, Iterable, Iterator, List, Optional, TypeVar
+
+from clock import current_clock
+
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class Deadline:
+    """An absolute deadline on a monotonic clock."""
+
+    def __init__(self, timeout: float, clock: Optional[Callable[[], float]] = None):
+        """
+        Initialize a deadline timeout seconds from now.
+
+        Args:
+            timeout: Budget in seconds
+            clock: Monotonic time source (defaults to the installed clock)
+        """
+        self.timeout = timeout
+        self.clock = clock or current_clock().monotonic
+        self.expires_at = self.clock() + timeout
+
+    def remaining(self) -> float:
+        """Seconds left, never negative."""
+        return max(self.expires_at - self.clock(), 0.0)
+
+    def expired(self) -> bool:
+        return self.clock() >= self.expires_at
+
+    def clip(self, timeout: float) -> float:
+        """Return timeout shortened to the time left."""
+        return min(timeout, self.remaining())
+
+    def __repr__(self) -> str:
+        return f"Deadline(timeout={self.timeout}, remaining={self.remaining():.2f})"
+
+
+_current: contextvars.ContextVar[Optional[Deadline]] = contextvars.ContextVar("deadline", default=None)
+
+
+def current_deadline() -> Optional[Deadline]:
+    """Return the innermost active deadline, if any."""
+    return _current.get()
+
+
+@contextmanager
+def deadline_scope(timeout: Optional[float] = None, deadline: Optional[Deadline] = None) -> Iterator[Optional[Deadline]]:
+    """
+    Make a deadline current for the duration of the block.
+
+    The effective deadline is the earliest of the enclosing one, the given
+    deadline and timeout seconds from now. With neither argument, the
+    enclosing deadline (possibly None) stays in effect.
+
+    Args:
+        timeout: Budget in seconds for this block
+        deadline: Explicit deadline handed down by a caller
+
+    Yields:
+        The effective deadline, or None if no deadline applies
+    """
+    effective = current_deadline()
+    for candidate in (deadline, Deadline(timeout) if timeout is not None else None):
+        if candidate is not None and (effective is None or candidate.expires_at < effective.expires_at):
+            effective = candidate
+
+    token = _current.set(effective)
+    try:
+        yield effective
+    finally:
+        _current.reset(token)
+
+
+def map_in_context(fn: Callable[[T], R], items: Iterable[T], max_workers: int) -> List[R]:
+    """
+    Call fn on every item in a thread pool and return the results in order.
+
+    Each call runs in a copy of the caller's context, so the current
+    deadline still applies inside the worker threads.
+
+    Args:
+        fn: Function to call once per item
+        items: Arguments for fn
+        max_workers: Upper bound on concurrent calls
+
+    Returns:
+        fn(item) for each item, in order; the first exception raised is re-raised
+    """
+    items = list(items)
+    with ThreadPoolExecutor(max_workers=max(min(len(items), max_workers), 1)) as executor:
+        futures = [executor.submit(contextvars.copy_context().run, fn, item) for item in items]
+        return [future.result() for future in futures]
@@ -0,0 +1,111 @@
+"""
+Gas estimation cache for transactions.
+
+Txs are grouped by message type and payload-size bucket. A tx read from a
+file (a proposal, an authz exec of N messages, a signed tx) is sized by the
+file, so batches of different lengths never share a gas limit. Until a group
+has a few measurements its txs are sent with ``--gas auto`` (a simulation
+round trip); after that, the gas limit is the largest observed gas use
+times the adjustment, and simulation is skipped. An out-of-gas failure
+drops the group's measurements so the next tx simulates again.
+"""
+
+import logging
+import math
+import os
+import threading
+from typing import Dict, List, Optional, Tuple
+
+from test_config import config
+
+
+logger = logging.getLogger(__name__)
+
+# sdkerrors.ErrOutOfGas
+OUT_OF_GAS_CODE = 11
+
+GasKey = Tuple[str, int]
+
+# Txs that read their messages from a file, and the position of its path in the command
+FILE_TXS = {("gov", "submit-proposal"): 3, ("authz", "exec"): 3, ("broadcast",): 2}
+
+
+def gas_key(cmd: List[str]) -> GasKey:
+    """
+    Classify a tx command by message type and payload-size bucket.
+
+    Args:
+        cmd: Tx command arguments, e.g. ["tx", "gov", "submit-proposal", path, "--from", key]
+
+    Returns:
+        (message type, power-of-two size bucket)
+    """
+    msg_type = " ".join(cmd[1:3])
+    size = sum(len(arg) for arg in cmd)
+    for prefix, position in FILE_TXS.items():
+        if tuple(cmd[1:1 + len(prefix)]) == prefix and len(cmd) > position:
+            msg_type = " ".join(prefix)
+            # Temp file paths all have the same length; their contents carry the messages
+            size += os.path.getsize(cmd[position]) - len(cmd[position])
+            break
+    return msg_type, size.bit_length()
+
+
+class GasEstimator:
+    """Caches gas measurements per (message type, size bucket)."""
+
+    def __init__(self, adjustment: Optional[float] = None, samples: Optional[int] = None):
+        """
+        Initialize the estimator.
+
+        Args:
+            adjustment: Safety multiplier on simulated or observed gas (defaults to config.gas_adjustment)
+            samples: Measurements needed before simulation is skipped (defaults to config.gas_samples)
+        """
+        self.adjustment = adjustment if adjustment is not None else config.gas_adjustment
+        self.samples = samples if samples is not None else config.gas_samples
+        self._measurements: Dict[GasKey, List[int]] = {}
+        self.simulations = 0
+        self._lock = threading.Lock()
+
+    def estimate(self, key: GasKey) -> Optional[int]:
+        """Return the cached gas limit for a key, or None if it still needs simulating."""
+        with self._lock:
+            measurements = self._measurements.get(key, [])
+            if len(measurements) < self.samples:
+                return None
+            return math.ceil(max(measurements) * self.adjustment)
+
+    def gas_args(self, key: GasKey) -> List[str]:
+        """
+        Gas and fee flags for a tx.
+
+        Returns:
+            ["--gas", <limit>] from the cache, or --gas auto with the adjustment;
+            plus --gas-prices when config.gas_prices is set
+        """
+        limit = self.estimate(key)
+        if limit is None:
+            with self._lock:
+                self.simulations += 1
+            args = ["--gas", "auto", "--gas-adjustment", str(self.adjustment)]
+        else:
+            args = ["--gas", str(limit)]
+
+        if config.gas_prices:
+            args += ["--gas-prices", config.gas_prices]
+        return args
+
+    def record(self, key: GasKey, gas_used: int) -> None:
+        """Record the gas an included tx used."""
+        with self._lock:
+            measurements = self._measurements.setdefault(key, [])
+            measurements.append(gas_used)
+            # Only the most recent measurements describe current chain behaviour
+            del measurements[:-self.samples]
+
+    def reset(self, key: GasKey) -> None:
+        """Forget a key's measurements after an out-of-gas failure."""
+        logger.warning(f"Out of gas for {key[0]} (size bucket {key[1]}); re-simulating")
+        with self._lock:
+            self._measurements.pop(key, None)
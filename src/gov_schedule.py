@@ -0,0 +1,170 @@
+"""
+Governance timing derived from the chain's gov params.
+
+A proposal's outcome is decided in the EndBlocker of the first block at or
+after its voting_end_time, so polling long before then is wasted and, once
+it has passed, one poll per block is all that is needed. These helpers turn
+`query gov params` and a proposal's timestamps into that schedule.
+"""
+
+import logging
+import re
+from datetime import datetime
+from decimal import Decimal
+from typing import Dict, Any, Optional, Union
+
+
+logger = logging.getLogger(__name__)
+
+DEPOSIT_PERIOD = "PROPOSAL_STATUS_DEPOSIT_PERIOD"
+VOTING_PERIOD = "PROPOSAL_STATUS_VOTING_PERIOD"
+
+# Shortest sleep between status polls before voting ends
+MIN_POLL_INTERVAL = 0.5
+
+_DURATION_UNITS = {"h": 3600.0, "m": 60.0, "s": 1.0, "ms": 1e-3, "us": 1e-6, "µs": 1e-6, "ns": 1e-9}
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(h|ms|us|µs|ns|m|s)")
+_TIMESTAMP = re.compile(r"(\d{4}-\d\d-\d\dT\d\d:\d\d:\d\d)(?:\.(\d+))?(Z|[+-]\d\d:\d\d)")
+
+
+def parse_duration(value: Union[str, Dict[str, Any]]) -> float:
+    """
+    Parse a protobuf duration into seconds.
+
+    Args:
+        value: "172800s" (JSON), "48h0m0s" (Go) or {"seconds", "nanos"}
+
+    Returns:
+        Duration in seconds
+
+    Raises:
+        ValueError: If the value is not a duration
+    """
+    if isinstance(value, dict):
+        return int(value.get("seconds", 0)) + int(value.get("nanos", 0)) / 1e9
+
+    text = str(value).strip()
+    parts = _DURATION_PART.findall(text)
+    if not parts or "".join(number + unit for number, unit in parts) != text:
+        raise ValueError(f"Invalid duration: {value!r}")
+    return sum(float(number) * _DURATION_UNITS[unit] for number, unit in parts)
+
+
+def parse_timestamp(value: Optional[str]) -> Optional[float]:
+    """
+    Parse an RFC 3339 timestamp (nanosecond precision allowed) into epoch seconds.
+
+    Returns:
+        Epoch seconds, or None for missing, unparseable or zero ("0001-01-01") times
+    """
+    match = _TIMESTAMP.fullmatch(value or "")
+    if not match:
+        return None
+
+    offset = "+00:00" if match.group(3) == "Z" else match.group(3)
+    moment = datetime.fromisoformat(match.group(1) + offset)
+    if moment.year <= 1:
+        return None
+    return moment.timestamp() + (float("0." + match.group(2)) if match.group(2) else 0.0)
+
+
+class GovParams:
+    """Voting timing from a `query gov params` response."""
+
+    def __init__(self, data: Dict[str, Any]):
+        """
+        Initialize from a gov params response.
+
+        Args:
+            data: Response with v1 "params" and/or legacy "voting_params"
+        """
+        params = data.get("params") or {}
+        voting_params = data.get("voting_params") or {}
+        tally_params = data.get("tally_params") or {}
+        self.voting_period = parse_duration(
+            params.get("voting_period") or voting_params.get("voting_period") or "0s"
+        )
+        # Cosmos SDK defaults, for responses that omit the tally params
+        self.quorum = Decimal(params.get("quorum") or tally_params.get("quorum") or "0.334")
+        self.threshold = Decimal(params.get("threshold") or tally_params.get("threshold") or "0.5")
+        self.veto_threshold = Decimal(
+            params.get("veto_threshold") or tally_params.get("veto_threshold") or "0.334"
+        )
+
+    def voting_end(self, proposal: Dict[str, Any], now: float) -> float:
+        """
+        Return when a proposal's voting ends, in epoch seconds.
+
+        Uses the proposal's voting_end_time, or now + voting_period if the
+        proposal does not report one.
+        """
+        return parse_timestamp(proposal.get("voting_end_time")) or now + self.voting_period
+
+
+def tally_outcome(tally: Dict[str, Any], bonded_tokens: Decimal, params: GovParams) -> Optional[bool]:
+    """
+    Decide a proposal from its current tally, if no remaining vote can change it.
+
+    Follows the gov EndBlocker: a proposal fails without quorum, or if
+    NoWithVeto exceeds veto_threshold of the votes; otherwise it passes if
+    Yes exceeds threshold of the non-abstaining votes.
+
+    Args:
+        tally: Tally result with yes_count, abstain_count, no_count, no_with_veto_count
+        bonded_tokens: Total bonded tokens, i.e. the voting power still to vote at most
+        params: Gov params with the tally thresholds
+
+    Returns:
+        True if the proposal passes however the rest vote, False if it cannot
+        pass, None while undecided
+    """
+    yes, abstain, no, veto = (
+        Decimal(tally.get(field) or "0")
+        for field in ("yes_count", "abstain_count", "no_count", "no_with_veto_count")
+    )
+    voted = yes + abstain + no + veto
+    remaining = max(bonded_tokens - voted, Decimal(0))
+    if bonded_tokens <= 0 or voted <= 0:
+        return None
+
+    # Vetoed even if everyone else votes, or short of the threshold even if they all vote yes
+    if veto / bonded_tokens > params.veto_threshold:
+        return False
+    if yes + remaining <= params.threshold * (voted + remaining - abstain):
+        return False
+
+    # Quorum is met, a veto is impossible and yes stays above the threshold if everyone else votes no
+    quorum_met = voted / bonded_tokens >= params.quorum
+    veto_safe = max(veto / voted, (veto + remaining) / bonded_tokens) <= params.veto_threshold
+    non_abstaining = bonded_tokens - abstain
+    if quorum_met and veto_safe and non_abstaining > 0 and yes / non_abstaining > params.threshold:
+        return True
+    return None
+
+
+def poll_delay(voting_end: float, now: float, min_interval: float = MIN_POLL_INTERVAL,
+               decided: bool = False) -> Optional[float]:
+    """
+    Return how long to sleep before the next proposal status poll.
+
+    Before voting ends each delay covers half the remaining time (at least
+    min_interval), converging on voting_end_time in a few polls. Once the
+    tally has decided the outcome nothing changes before voting ends, so
+    the delay covers all of the remaining time.
+
+    Args:
+        voting_end: When voting ends, in epoch seconds
+        now: Current time, in epoch seconds
+        min_interval: Shortest delay before voting ends
+        decided: Whether the tally already decides the outcome
+
+    Returns:
+        Seconds to sleep, or None once voting has ended and the next poll
+        should follow the next block
+    """
+    remaining = voting_end - now
+    if remaining <= 0:
+        return None
+    if decided:
+        return remaining
+    return min(remaining, max(remaining / 2, min_interval))
@@ -6,48 +6,257 @@ with proper error handling, JSON parsing, and retry logic.
 """
 
 import json
+import os
 import subprocess
-import time
+import tempfile
+import threading
 import logging
-from typing import Dict, List, Any, Optional, Union
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from contextlib import contextmanager
+from typing import Dict, List, Any, Callable, Iterator, Optional, Set, Tuple, Union
 from pathlib import Path
 
 from test_config import config
+from query_transport import QueryTransport, QueryTransportError, create_query_transport
+from query_cache import QueryCache, TERMINAL_PROPOSAL_STATUSES
+from single_flight import SingleFlight
+from block_waiter import BlockWaiter, BlockWaitError, BlockWaitTimeout
+from tx_tracker import TxTracker, TxTimeout
+from retry_policy import RetryPolicy, RetryBudget, retry_budget as session_retry_budget
+from circuit_breaker import CircuitBreaker, PROBE, REJECT, is_connection_failure
+from deadline import current_deadline, map_in_context
+from clock import current_clock
+from sequence_manager import SequenceManager, SEQUENCE_MISMATCH_CODE, parse_expected_sequence
+from tx_batch import merge_unsigned_txs
+from tx_pipeline import TxPipeline, TxPipelineError
+from gas_estimator import GasEstimator, GasKey, OUT_OF_GAS_CODE, gas_key
+from address_cache import AddressCache
+from market_index import MarketIndex
+from shared_store import SharedStore
 
 
 logger = logging.getLogger(__name__)
 
+# Broadcast attempts per tx when the node keeps reporting a different sequence
+SEQUENCE_RETRIES = 3
+
+# Proposal payloads go to tmpfs when available so they never touch disk
+PROPOSAL_TMP_DIR = "/dev/shm" if os.path.isdir("/dev/shm") else None
+
 
 class InjectiveCLIError(Exception):
     """Custom exception for CLI command errors."""
     pass
 
 
+class CircuitOpenError(InjectiveCLIError):
+    """Raised without contacting the node while the circuit breaker is open."""
+    pass
+
+
+class DeadlineExceeded(InjectiveCLIError):
+    """Raised when the current flow's deadline leaves no time for a command."""
+    pass
+
+
+def clip_to_deadline(timeout: Optional[float]) -> Optional[float]:
+    """
+    Shorten a timeout to what is left of the current deadline.
+    
+    Args:
+        timeout: Timeout in seconds, or None for no limit
+        
+    Returns:
+        The clipped timeout (unchanged when no deadline is active)
+        
+    Raises:
+        DeadlineExceeded: If the current deadline has already passed
+    """
+    deadline = current_deadline()
+    if deadline is None:
+        return timeout
+    if deadline.expired():
+        raise DeadlineExceeded(f"Deadline of {deadline.timeout}s exceeded")
+    return deadline.remaining() if timeout is None else deadline.clip(timeout)
+
+
+def parse_command_output(stdout: str) -> Dict[str, Any]:
+    """Parse the stdout of a successful injectived command."""
+    if stdout.strip():
+        try:
+            return json.loads(stdout)
+        except json.JSONDecodeError:
+            # Some commands return plain text
+            return {"output": stdout.strip()}
+    else:
+        return {"success": True}
+
+
+@contextmanager
+def proposal_file(proposal_json: str, prefix: str = "market_proposal_") -> Iterator[str]:
+    """
+    Provide a file path for a proposal given as a path or as a JSON string.
+    
+    JSON strings are written to a file unique to this call, which is removed
+    when the block exits, so concurrent submissions never see each other's
+    payloads.
+    
+    Args:
+        proposal_json: JSON string or file path containing proposal
+        prefix: Temporary file name prefix
+        
+    Yields:
+        Path to pass to `tx gov submit-proposal`
+    """
+    if not proposal_json.lstrip().startswith("{") and Path(proposal_json).exists():
+        yield proposal_json
+        return
+    
+    fd, path = tempfile.mkstemp(prefix=prefix, suffix=".json", dir=PROPOSAL_TMP_DIR)
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(proposal_json)
+        yield path
+    finally:
+        os.unlink(path)
+
+
 class InjectiveCLI:
     """Wrapper for injectived CLI commands."""
     
-    def __init__(self, binary_path: str = "injectived"):
-        """Initialize CLI wrapper."""
+    def __init__(
+        self,
+        binary_path: str = "injectived",
+        transport: Optional[QueryTransport] = None,
+        cache: Optional[QueryCache] = None,
+        block_waiter: Optional[BlockWaiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        retry_budget: Optional[RetryBudget] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        sequence_manager: Optional[SequenceManager] = None,
+        tx_pipeline: Optional[TxPipeline] = None,
+        gas_estimator: Optional[GasEstimator] = None,
+        address_cache: Optional[AddressCache] = None,
+        market_index: Optional[MarketIndex] = None,
+        shared_store: Optional[SharedStore] = None,
+    ):
+        """
+        Initialize CLI wrapper.
+        
+        Args:
+            binary_path: Path to the injectived binary
+            transport: Native query transport; defaults to the one selected by config
+            cache: Query response cache; defaults to a fresh one if config.query_cache
+            block_waiter: Block waiter for the node's RPC; defaults to config.node_url
+            retry_policy: Failure classification and backoff; defaults to RetryPolicy()
+            retry_budget: Retry budget; defaults to the session-wide budget
+            circuit_breaker: Breaker for an unreachable node; defaults to a fresh one
+            sequence_manager: Local account sequences for pipelined txs; defaults to
+                one if config.pipeline_txs, else injectived looks sequences up itself
+            tx_pipeline: Batched generate/sign/broadcast stages for txs; defaults to
+                one if config.batch_signing, else each tx is one injectived call
+            gas_estimator: Cached gas limits per message type; defaults to one if
+                config.gas_estimation, else injectived's default gas is used
+            address_cache: Persistent key address cache; defaults to the shared file
+                from config.address_cache_file
+            market_index: Ticker -> market index; defaults to a fresh one
+            shared_store: Store sharing cached query results with other processes of
+                the session; defaults to config.shared_store_dir (disabled if unset)
+        """
         self.binary_path = binary_path
         self.base_args = config.get_cli_base_args()
+        self.transport = transport if transport is not None else create_query_transport()
+        self.cache = cache if cache is not None else (QueryCache() if config.query_cache else None)
+        self._height_checked_at: Optional[float] = None
+        self.single_flight = SingleFlight()
+        self.block_waiter = block_waiter if block_waiter is not None else BlockWaiter()
+        self.tx_tracker = TxTracker(self.query_tx, rpc_url=self.block_waiter.rpc_url)
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.retry_budget = retry_budget if retry_budget is not None else session_retry_budget
+        self.circuit_breaker = circuit_breaker or CircuitBreaker()
+        self._probe_state = threading.local()
+        if sequence_manager is None and config.pipeline_txs:
+            sequence_manager = SequenceManager(self.query_account_sequence)
+        self.sequence_manager = sequence_manager
+        if tx_pipeline is None and config.batch_signing:
+            tx_pipeline = TxPipeline(self)
+        self.tx_pipeline = tx_pipeline
+        if gas_estimator is None and config.gas_estimation:
+            gas_estimator = GasEstimator()
+        self.gas_estimator = gas_estimator
+        # Broadcast txs whose gas use is learned when they are included
+        self._gas_pending: Dict[str, GasKey] = {}
+        self._gas_lock = threading.Lock()
+        self.address_cache = address_cache or AddressCache()
+        # Cleared if injectived does not accept pagination flags for market listings
+        self._paginate_markets = True
+        self.market_index = market_index if market_index is not None else MarketIndex()
+        self.shared_store = shared_store if shared_store is not None else SharedStore()
+        # Tags this client invalidated, and the height it did so at; other workers'
+        # shared results for them predate the tx until the height moves on
+        self._dirty_tags: Set[str] = set()
+        self._dirty_height: Optional[int] = None
+        self._dirty_lock = threading.Lock()
+        self._gov_params: Optional[Dict[str, Any]] = None
     
-    def _run_command(self, cmd: List[str], retry_count: int = 3) -> Dict[str, Any]:
+    def _check_circuit(self) -> None:
+        """
+        Fail fast while the node is known to be down.
+        
+        When the breaker allows a half-open probe, this thread runs
+        get_latest_block_height first; its outcome closes or re-opens the circuit.
+        
+        Raises:
+            CircuitOpenError: If the circuit is open or the probe fails
+        """
+        if getattr(self._probe_state, "active", False):
+            return
+        
+        decision = self.circuit_breaker.acquire()
+        if decision == REJECT:
+            raise CircuitOpenError(
+                f"Node {config.node_url} is unreachable: circuit open after "
+                f"{self.circuit_breaker.consecutive_failures} consecutive connection/timeout failures; "
+                f"next probe in {self.circuit_breaker.retry_in():.1f}s"
+            )
+        if decision == PROBE:
+            self._probe_state.active = True
+            try:
+                self.get_latest_block_height()
+                self.circuit_breaker.record_success()
+            except InjectiveCLIError as e:
+                self.circuit_breaker.record_failure()
+                raise CircuitOpenError(f"Node {config.node_url} is still unreachable: {e}") from e
+            finally:
+                self._probe_state.active = False
+    
+    def _run_command(self, cmd: List[str], retry_count: Optional[int] = None) -> Dict[str, Any]:
         """
         Execute a CLI command with retry logic.
         
+        Failures the retry policy classifies as permanent are raised at once;
+        transient ones are retried with jittered backoff while the session's
+        retry budget lasts. Each attempt's timeout and each backoff are clipped
+        to the current deadline, if one is active.
+        
         Args:
             cmd: Command arguments list
-            retry_count: Number of retries on failure
+            retry_count: Maximum attempts; defaults to the policy for this command
             
         Returns:
             Parsed JSON response
             
         Raises:
             InjectiveCLIError: On command failure
+            DeadlineExceeded: If the current deadline runs out first
         """
         full_cmd = [self.binary_path] + cmd + self.base_args
+        policy = self.retry_policy.for_command(cmd)
+        attempts = retry_count if retry_count is not None else policy.max_attempts
         
-        for attempt in range(retry_count):
+        for attempt in range(attempts):
+            self._check_circuit()
+            timeout = clip_to_deadline(config.test_timeout)
             try:
                 logger.info(f"Executing command (attempt {attempt + 1}): {' '.join(full_cmd)}")
                 
@@ -55,60 +264,270 @@ class InjectiveCLI:
                     full_cmd,
                     capture_output=True,
                     text=True,
-                    timeout=config.test_timeout,
+                    timeout=timeout,
                     check=False
                 )
                 
                 if result.returncode == 0:
-                    if result.stdout.strip():
-                        try:
-                            return json.loads(result.stdout)
-                        except json.JSONDecodeError:
-                            # Some commands return plain text
-                            return {"output": result.stdout.strip()}
-                    else:
-                        return {"success": True}
+                    self.circuit_breaker.record_success()
+                    return parse_command_output(result.stdout)
+                
+                error_msg = f"Command failed with code {result.returncode}: {result.stderr}"
+                retryable = policy.is_transient(result.stderr, result.returncode)
+                if is_connection_failure(result.stderr):
+                    self.circuit_breaker.record_failure()
                 else:
-                    error_msg = f"Command failed with code {result.returncode}: {result.stderr}"
-                    logger.error(error_msg)
-                    
-                    if attempt < retry_count - 1:
-                        time.sleep(2 ** attempt)  # Exponential backoff
-                        continue
-                    else:
-                        raise InjectiveCLIError(error_msg)
+                    # The node answered, if only to reject the command
+                    self.circuit_breaker.record_success()
                         
             except subprocess.TimeoutExpired:
+                if timeout < config.test_timeout:
+                    # Cut short by our own deadline, which says nothing about the node
+                    raise DeadlineExceeded(f"Deadline exceeded after {timeout:.1f}s: {' '.join(cmd)}")
                 error_msg = f"Command timed out after {config.test_timeout} seconds"
-                logger.error(error_msg)
-                
-                if attempt < retry_count - 1:
-                    time.sleep(2 ** attempt)
-                    continue
-                else:
-                    raise InjectiveCLIError(error_msg)
+                retryable = policy.retry_on_timeout
+                self.circuit_breaker.record_failure()
             
             except Exception as e:
+                # Missing binary, bad arguments: another attempt would fail the same way
                 error_msg = f"Unexpected error: {str(e)}"
-                logger.error(error_msg)
-                
-                if attempt < retry_count - 1:
-                    time.sleep(2 ** attempt)
-                    continue
-                else:
-                    raise InjectiveCLIError(error_msg)
+                retryable = False
+            
+            logger.error(error_msg)
+            
+            if not retryable or attempt == attempts - 1:
+                raise InjectiveCLIError(error_msg)
+            if not self.retry_budget.consume():
+                logger.warning("Retry budget exhausted; not retrying")
+                raise InjectiveCLIError(error_msg)
+            
+            current_clock().sleep(clip_to_deadline(policy.backoff(attempt)))
         
         raise InjectiveCLIError("All retry attempts failed")
     
-    def query_market(self, market_id: str) -> Dict[str, Any]:
+    def _query(self, cmd: List[str], retry_count: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Execute a read-only query, preferring the native transport.
+        
+        Concurrent identical queries share one execution and one parsed result.
+        Commands the transport cannot answer fall back to spawning injectived.
+        """
+        try:
+            # A follower waits for the leader no longer than its own deadline allows
+            return self.single_flight.do(tuple(cmd), lambda: self._execute_query(cmd, retry_count),
+                                         timeout=clip_to_deadline(None))
+        except TimeoutError as e:
+            raise DeadlineExceeded(f"Deadline exceeded waiting for a shared query: {' '.join(cmd)}") from e
+    
+    def _execute_query(self, cmd: List[str], retry_count: Optional[int] = None) -> Dict[str, Any]:
+        """Execute a read-only query once, without coalescing."""
+        if self.transport is not None and self.transport.supports(cmd):
+            self._check_circuit()
+            timeout = clip_to_deadline(None)
+            try:
+                result = self.transport.query(cmd, timeout=timeout)
+            except QueryTransportError as e:
+                logger.error(str(e))
+                # A deadline-clipped request timing out says nothing about the node
+                clip_to_deadline(None)
+                if is_connection_failure(str(e)):
+                    self.circuit_breaker.record_failure()
+                else:
+                    self.circuit_breaker.record_success()
+                raise InjectiveCLIError(str(e)) from e
+            self.circuit_breaker.record_success()
+            return result
+        
+        return self._run_command(cmd, retry_count)
+    
+    def _cached_query(self, cmd: List[str], tags: List[str], use_cache: bool = True) -> Dict[str, Any]:
+        """
+        Execute a read-only query through the block-height-aware cache.
+        
+        Args:
+            cmd: Query command arguments
+            tags: Invalidation tags for the response
+            use_cache: Set False to bypass the cache for this call
+            
+        Returns:
+            Parsed JSON response
+        """
+        if not use_cache or self.cache is None:
+            return self._query(cmd)
+        
+        self._check_cache_height()
+        key = tuple(cmd)
+        
+        result = self.cache.get(key)
+        if result is not None:
+            return result
+        
+        with self._dirty_lock:
+            if self._dirty_height != self.cache.height:
+                self._dirty_tags.clear()
+            dirty = not self._dirty_tags.isdisjoint(tags)
+        
+        if dirty:
+            result = self._query(cmd)
+        else:
+            # State at a height is the same for every worker, so one of them queries it
+            result = self.shared_store.get_or_compute(
+                "query:" + " ".join(cmd), lambda: self._query(cmd), scope=str(self.cache.height)
+            )
+        status = result.get("proposal", {}).get("status")
+        self.cache.put(key, result, tags=tags, permanent=status in TERMINAL_PROPOSAL_STATUSES)
+        return result
+    
+    def _check_cache_height(self) -> None:
+        """Re-read the block height if the last check is older than the check interval."""
+        now = current_clock().monotonic()
+        if (self._height_checked_at is not None
+                and now - self._height_checked_at < config.cache_height_check_interval):
+            return
+        
+        # get_latest_block_height feeds the observed height into the cache
+        self.get_latest_block_height()
+        self._height_checked_at = now
+    
+    def _invalidate(self, *tags: str) -> None:
+        """Drop cached queries touched by a tx this client just sent."""
+        if self.cache is None:
+            return
+        for tag in tags:
+            self.cache.invalidate_tag(tag)
+        with self._dirty_lock:
+            if self._dirty_height != self.cache.height:
+                self._dirty_tags.clear()
+            self._dirty_tags.update(tags)
+            self._dirty_height = self.cache.height
+        # The tx lands in a later block; make the next cached query re-check the height
+        self._height_checked_at = None
+    
+    def cache_stats(self) -> Dict[str, Any]:
+        """Return query cache hit/miss counters (empty if caching is disabled)."""
+        if self.cache is None:
+            return {}
+        stats = self.cache.stats()
+        if self.shared_store.enabled:
+            stats["shared"] = self.shared_store.stats()
+        return stats
+    
+    def query_market(self, market_id: str, use_cache: bool = True) -> Dict[str, Any]:
         """Query perpetual market by ID."""
         cmd = ["query", "exchange", "perpetual-market-info", market_id]
-        return self._run_command(cmd)
+        result = self._cached_query(cmd, [f"market:{market_id}"], use_cache)
+        self.market_index.observe(result)
+        return result
     
-    def query_all_markets(self) -> Dict[str, Any]:
+    def query_all_markets(self, use_cache: bool = True) -> Dict[str, Any]:
         """Query all perpetual markets."""
         cmd = ["query", "exchange", "perpetual-markets"]
-        return self._run_command(cmd)
+        return self._cached_query(cmd, ["markets"], use_cache)
+    
+    def iter_markets(self, page_limit: Optional[int] = None, use_cache: bool = True) -> Iterator[Dict[str, Any]]:
+        """
+        Yield perpetual markets page by page.
+        
+        Pages are fetched only as the caller consumes them, so a caller that
+        stops early (e.g. at the first match) never loads the rest. The native
+        transport pages by key; injectived pages by offset, since --page-key
+        takes raw bytes while responses return the next key base64-encoded.
+        
+        Args:
+            page_limit: Markets per page (defaults to config.markets_page_limit)
+            use_cache: Set False to bypass the cache for this call
+            
+        Yields:
+            Market entries in the same shape as query_all_markets()["markets"]
+        """
+        page_limit = page_limit or config.markets_page_limit
+        base_cmd = ["query", "exchange", "perpetual-markets"]
+        native = self.transport is not None and self.transport.supports(base_cmd + ["--limit", "1"])
+        offset, page_key = 0, None
+        
+        while True:
+            if not self._paginate_markets:
+                markets = self.query_all_markets(use_cache).get("markets", [])
+                for entry in markets:
+                    self.market_index.observe(entry)
+                yield from markets
+                return
+            
+            cmd = base_cmd + ["--limit", str(page_limit)]
+            if native:
+                cmd += ["--page-key", page_key] if page_key else []
+            else:
+                cmd += ["--offset", str(offset)]
+            
+            try:
+                page = self._cached_query(cmd, ["markets"], use_cache)
+            except InjectiveCLIError as e:
+                if offset or page_key or "unknown flag" not in str(e):
+                    raise
+                logger.warning("injectived does not paginate perpetual-markets; listing all at once")
+                self._paginate_markets = False
+                continue
+            
+            markets = page.get("markets", [])
+            # Index the whole page, including markets past where the caller stops
+            for entry in markets:
+                self.market_index.observe(entry)
+            yield from markets
+            
+            page_key = (page.get("pagination") or {}).get("next_key")
+            # A native page can be empty after dropping non-perpetual markets;
+            # an empty offset page means the listing shrank underneath us
+            if not page_key or (not native and not markets):
+                return
+            offset += len(markets)
+    
+    def query_markets(self, market_ids: List[str], use_cache: bool = True) -> Dict[str, Dict[str, Any]]:
+        """
+        Query several perpetual markets by ID at once.
+        
+        The native transport filters by ID in one request; injectived has no
+        such filter, so the listing is streamed until every market is found.
+        
+        Args:
+            market_ids: Market IDs to fetch
+            use_cache: Set False to bypass the cache for this call
+        
+        Returns:
+            Market ID -> market in the {"market": {...}} shape; unknown IDs are absent
+        """
+        wanted = set(market_ids)
+        if not wanted:
+            return {}
+        
+        cmd = ["query", "exchange", "perpetual-markets", "--market-ids", ",".join(sorted(wanted))]
+        if self.transport is not None and self.transport.supports(cmd):
+            tags = ["markets"] + [f"market:{market_id}" for market_id in wanted]
+            markets = self._cached_query(cmd, tags, use_cache).get("markets", [])
+            for entry in markets:
+                self.market_index.observe(entry)
+        else:
+            markets = self.iter_markets(use_cache=use_cache)
+        
+        found: Dict[str, Dict[str, Any]] = {}
+        for entry in markets:
+            market_id = entry.get("market", {}).get("market_id")
+            if market_id in wanted:
+                found[market_id] = entry
+                if len(found) == len(wanted):
+                    break
+        return found
+    
+    def find_market(self, ticker: str) -> Optional[Dict[str, Any]]:
+        """
+        Find a perpetual market by ticker through the session's market index.
+        
+        Indexed tickers cost no queries; others stream the market listing
+        until found, at most once per block height for tickers that do not exist.
+        
+        Returns:
+            Last-known market state in the {"market": {...}} shape, or None
+        """
+        return self.market_index.find(ticker, self.iter_markets, self.get_latest_block_height)
     
     def create_market_proposal(self, proposal_json: str, from_key: str) -> Dict[str, Any]:
         """
@@ -121,26 +540,86 @@ class InjectiveCLI:
         Returns:
             Transaction result
         """
-        # Check if it's a file path or JSON string
-        if Path(proposal_json).exists():
-            cmd = ["tx", "gov", "submit-proposal", proposal_json, "--from", from_key]
-        else:
-            # Write JSON to temporary file
-            temp_file = Path("/tmp/market_proposal.json")
-            temp_file.write_text(proposal_json)
-            cmd = ["tx", "gov", "submit-proposal", str(temp_file), "--from", from_key]
-        
-        return self._run_command(cmd)
+        try:
+            with proposal_file(proposal_json) as path:
+                cmd = ["tx", "gov", "submit-proposal", path, "--from", from_key]
+                return self._broadcast_tx(cmd, from_key)
+        finally:
+            self._invalidate("markets")
     
     def vote_proposal(self, proposal_id: str, vote: str, from_key: str) -> Dict[str, Any]:
         """Vote on a governance proposal."""
         cmd = ["tx", "gov", "vote", proposal_id, vote, "--from", from_key]
-        return self._run_command(cmd)
+        try:
+            return self._broadcast_tx(cmd, from_key)
+        finally:
+            self._invalidate(f"proposal:{proposal_id}")
     
-    def query_proposal(self, proposal_id: str) -> Dict[str, Any]:
+    def vote_proposals(
+        self, proposal_ids: List[str], vote: str, from_key: str, gas_per_message: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Vote on several governance proposals in a single multi-message tx.
+        
+        Args:
+            proposal_ids: Proposals to vote on, in message order
+            vote: Vote option for every proposal
+            from_key: Voter key name
+            gas_per_message: Gas budgeted per message (defaults to config.batch_gas_per_message)
+        
+        Returns:
+            Broadcast result of the combined tx
+        """
+        gas_per_message = gas_per_message or config.batch_gas_per_message
+        unsigned = [
+            self.generate_tx(["tx", "gov", "vote", proposal_id, vote, "--from", from_key])
+            for proposal_id in proposal_ids
+        ]
+        tx = merge_unsigned_txs(unsigned, gas_limit=gas_per_message * len(unsigned))
+        
+        try:
+            return self.broadcast_unsigned_tx(tx, from_key)
+        finally:
+            self._invalidate(*[f"proposal:{proposal_id}" for proposal_id in proposal_ids])
+    
+    def query_proposal(self, proposal_id: str, use_cache: bool = True) -> Dict[str, Any]:
         """Query governance proposal status."""
         cmd = ["query", "gov", "proposal", proposal_id]
-        return self._run_command(cmd)
+        return self._cached_query(cmd, [f"proposal:{proposal_id}"], use_cache)
+    
+    def query_proposals(self, proposal_ids: List[str], use_cache: bool = True) -> Dict[str, Dict[str, Any]]:
+        """
+        Query several governance proposals concurrently.
+        
+        The gov module has no query by proposal IDs, so one round of status
+        polling is one concurrent query per proposal.
+        
+        Returns:
+            Proposal ID -> query_proposal result
+        """
+        return self._query_each(lambda proposal_id: self.query_proposal(proposal_id, use_cache), proposal_ids)
+    
+    def query_tally(self, proposal_id: str) -> Dict[str, Any]:
+        """Query the current tally of a proposal's votes."""
+        return self._query(["query", "gov", "tally", proposal_id])
+    
+    def query_tallies(self, proposal_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Query the current tallies of several proposals concurrently."""
+        return self._query_each(self.query_tally, proposal_ids)
+    
+    def query_staking_pool(self) -> Dict[str, Any]:
+        """Query the staking pool (bonded and not bonded tokens)."""
+        return self._query(["query", "staking", "pool"])
+    
+    def _query_each(self, query: Callable[[str], Dict[str, Any]], keys: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Run one query per key concurrently, returning key -> result."""
+        return dict(zip(keys, map_in_context(query, keys, config.max_concurrency)))
+    
+    def query_gov_params(self) -> Dict[str, Any]:
+        """Query governance params, once per session; they only change through governance."""
+        if self._gov_params is None:
+            self._gov_params = self._query(["query", "gov", "params"])
+        return self._gov_params
     
     def update_market_admin(self, market_id: str, rmr: str, from_key: str) -> Dict[str, Any]:
         """
@@ -160,23 +639,515 @@ class InjectiveCLI:
             "--reduce-margin-ratio", rmr,
             "--from", from_key
         ]
-        return self._run_command(cmd)
+        granter = self._admin_granter(from_key)
+        try:
+            if granter is not None:
+                return self.exec_authz(self.generate_update_market_admin(market_id, rmr, granter), from_key)
+            return self._broadcast_tx(cmd, from_key)
+        finally:
+            self._invalidate(f"market:{market_id}", "markets")
+    
+    @staticmethod
+    def _admin_granter(from_key: str) -> Optional[str]:
+        """Key whose exchange-admin rights from_key exercises through authz, if any."""
+        granter = config.admin_granter
+        return granter if granter and granter != from_key else None
+    
+    def query_tx(self, txhash: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up an included transaction by hash.
+        
+        Returns:
+            The tx result, or None if the tx is not (yet) included
+        """
+        cmd = ["query", "tx", txhash]
+        try:
+            result = self._query(cmd, retry_count=1)
+        except InjectiveCLIError as e:
+            logger.debug(f"Tx {txhash} not found yet: {e}")
+            return None
+        
+        return result if result.get("txhash") else None
+    
+    def wait_for_tx(self, txhash: str, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Wait until a broadcast transaction is included in a block.
+        
+        Args:
+            txhash: Hash returned in the broadcast result
+            timeout: Maximum seconds to wait (defaults to config.test_timeout)
+            
+        Returns:
+            Included tx result with height, code, raw_log and events
+        """
+        return self.wait_for_txs([txhash], timeout)[txhash]
+    
+    def wait_for_txs(self, txhashes: List[str], timeout: Optional[float] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Wait until a batch of broadcast transactions are all included.
+        
+        Args:
+            txhashes: Hashes returned in the broadcast results
+            timeout: Maximum seconds to wait for the whole batch
+            
+        Returns:
+            Mapping of each hash to its included tx result
+        """
+        timeout = clip_to_deadline(timeout if timeout is not None else config.test_timeout)
+        try:
+            results = self.tx_tracker.wait_all(txhashes, timeout)
+        except TxTimeout as e:
+            raise InjectiveCLIError(str(e)) from e
+        
+        # Included txs changed state at their height; make cached queries re-check
+        self._height_checked_at = None
+        self._observe_gas(results)
+        return results
     
     def get_account_info(self, key_name: str) -> Dict[str, Any]:
-        """Get account information for a key."""
+        """Get account information for a key, from the address cache when possible."""
+        address = self.address_cache.get(key_name)
+        if address is not None:
+            return {"output": address}
+        
         cmd = ["keys", "show", key_name, "--address"]
+        result = self._run_command(cmd)
+        if result.get("output"):
+            self.address_cache.put(key_name, result["output"])
+        return result
+    
+    def add_key(self, key_name: str) -> str:
+        """
+        Create a key in the keyring unless it already exists.
+        
+        Returns:
+            The key's address
+        """
+        address = self.address_cache.get(key_name)
+        if address is None:
+            try:
+                address = self._run_command(["keys", "show", key_name, "--address"], retry_count=1).get("output")
+            except InjectiveCLIError:
+                address = None
+        if not address:
+            logger.info(f"Adding key {key_name} to the keyring")
+            address = self._run_command(["keys", "add", key_name], retry_count=1).get("address")
+            if not address:
+                raise InjectiveCLIError(f"Failed to add key {key_name}")
+        self.address_cache.put(key_name, address)
+        return address
+    
+    def query_account_sequence(self, key_name: str) -> Tuple[int, int]:
+        """
+        Look up a key's account number and current sequence on chain.
+        
+        Returns:
+            (account_number, sequence)
+        """
+        address = self.get_account_info(key_name).get("output", "")
+        result = self._query(["query", "auth", "account", address])
+        
+        account = result.get("account", result)
+        # Injective accounts (EthAccount) wrap the BaseAccount fields
+        account = account.get("base_account", account)
+        
+        return int(account.get("account_number", 0)), int(account.get("sequence", 0))
+    
+    def _broadcast_tx(self, cmd: List[str], from_key: str) -> Dict[str, Any]:
+        """
+        Sign and broadcast a tx with a gas limit from the gas estimator.
+        
+        A tx sent with a cached limit that runs out of gas before inclusion
+        is sent once more with a fresh simulation.
+        
+        Args:
+            cmd: Tx command arguments including --from
+            from_key: Signing key name
+            
+        Returns:
+            Broadcast result
+        """
+        if self.gas_estimator is None:
+            return self._send_tx(cmd, from_key)
+        
+        key = gas_key(cmd)
+        for attempt in range(2):
+            gas_args = self.gas_estimator.gas_args(key)
+            result = self._send_tx(cmd + gas_args, from_key)
+            
+            code = int(result.get("code", 0))
+            if code == OUT_OF_GAS_CODE:
+                self.gas_estimator.reset(key)
+                if "auto" not in gas_args:
+                    continue
+            elif code == 0 and result.get("txhash"):
+                with self._gas_lock:
+                    self._gas_pending[result["txhash"]] = key
+            return result
+        return result
+    
+    def _observe_gas(self, results: Dict[str, Dict[str, Any]]) -> None:
+        """Feed the gas use of included txs back into the gas estimator."""
+        if self.gas_estimator is None:
+            return
+        
+        for txhash, result in results.items():
+            with self._gas_lock:
+                key = self._gas_pending.pop(txhash, None)
+            if key is None:
+                continue
+            
+            code = int(result.get("code", 0))
+            if code == OUT_OF_GAS_CODE:
+                self.gas_estimator.reset(key)
+            elif code == 0 and result.get("gas_used"):
+                self.gas_estimator.record(key, int(result["gas_used"]))
+    
+    def _send_tx(self, cmd: List[str], from_key: str) -> Dict[str, Any]:
+        """
+        Sign and broadcast a tx, assigning its sequence locally when pipelining.
+        
+        With a tx pipeline the tx is generated here and signed and broadcast
+        by the pipeline, batched with txs submitted concurrently.
+        
+        With a sequence manager the tx is broadcast in sync mode (returning
+        after CheckTx) with an explicit account number and sequence, so the
+        next tx from the same key can follow before this one is included.
+        
+        Args:
+            cmd: Tx command arguments including --from
+            from_key: Signing key name
+            
+        Returns:
+            Broadcast result
+        """
+        if self.tx_pipeline is not None:
+            future = self.tx_pipeline.submit(cmd, from_key)
+            try:
+                return future.result(timeout=clip_to_deadline(config.test_timeout))
+            except FutureTimeoutError:
+                raise InjectiveCLIError(f"No broadcast result within the timeout: {' '.join(cmd)}")
+            except TxPipelineError as e:
+                raise InjectiveCLIError(str(e)) from e
+        
+        if self.sequence_manager is None:
+            return self._run_command(cmd)
+        
+        # A retry would reuse the same sequence; mismatches are handled by _with_sequence
+        return self._with_sequence(from_key, lambda sequence_args: self._run_command(
+            cmd + sequence_args + ["--broadcast-mode", "sync"], retry_count=1
+        ))
+    
+    def _with_sequence(self, from_key: str, send: Callable[[List[str]], Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Run a signing broadcast with the key's next sequence from the sequence manager.
+        
+        A sequence mismatch resyncs to the sequence the node expects and
+        re-signs; an accepted tx advances the local sequence.
+        
+        Args:
+            from_key: Signing key name
+            send: Signs and broadcasts given --account-number/--sequence arguments
+            
+        Returns:
+            Broadcast result
+        """
+        for attempt in range(SEQUENCE_RETRIES):
+            with self.sequence_manager.account(from_key) as account:
+                sequence_args = [
+                    "--account-number", str(account.account_number),
+                    "--sequence", str(account.sequence),
+                ]
+                
+                try:
+                    result = send(sequence_args)
+                except InjectiveCLIError as e:
+                    expected = parse_expected_sequence(str(e))
+                    if expected is None:
+                        # Unknown whether the sequence was used; re-query before the next tx
+                        account.resync(None)
+                        raise
+                    account.resync(expected)
+                    continue
+                
+                code = int(result.get("code", 0))
+                if code == SEQUENCE_MISMATCH_CODE:
+                    account.resync(parse_expected_sequence(result.get("raw_log", "")))
+                    continue
+                
+                # A tx rejected in CheckTx does not consume its sequence
+                if code == 0:
+                    account.advance()
+                return result
+        
+        raise InjectiveCLIError(
+            f"Sequence for {from_key} still mismatched after {SEQUENCE_RETRIES} attempts"
+        )
+    
+    def generate_update_market_admin(self, market_id: str, rmr: str, from_key: str) -> Dict[str, Any]:
+        """
+        Build (but do not sign or broadcast) an admin market update tx.
+        
+        Returns:
+            Unsigned tx JSON as printed by --generate-only
+        """
+        cmd = [
+            "tx", "exchange", "admin-update-perpetual-market",
+            market_id,
+            "--reduce-margin-ratio", rmr,
+            "--from", from_key,
+            "--generate-only",
+        ]
         return self._run_command(cmd)
     
-    def wait_for_next_block(self, blocks: int = 1) -> None:
-        """Wait for specified number of blocks."""
+    def generate_tx(self, cmd: List[str]) -> Dict[str, Any]:
+        """
+        Build (but do not sign or broadcast) a tx.
+        
+        Args:
+            cmd: Tx command arguments including --from
+            
+        Returns:
+            Unsigned tx JSON as printed by --generate-only
+        """
+        return self._run_command(cmd + ["--generate-only"])
+    
+    def sign_txs(
+        self,
+        txs: List[Dict[str, Any]],
+        from_key: str,
+        account_number: Optional[int] = None,
+        sequence: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Sign several unsigned txs in one injectived invocation.
+        
+        Given an account number and sequence the txs are signed offline with
+        consecutive sequences; otherwise injectived looks them up.
+        
+        Args:
+            txs: Unsigned txs, in broadcast order
+            from_key: Signing key name
+            account_number: Signer's account number
+            sequence: Sequence for the first tx
+            
+        Returns:
+            Signed txs in the same order
+        """
+        offline = []
+        if sequence is not None:
+            offline = ["--offline", "--account-number", str(account_number), "--sequence", str(sequence)]
+        
+        # sign-batch reads one tx per line and prints one signed tx per line
+        lines = "\n".join(json.dumps(tx) for tx in txs)
+        with proposal_file(lines, prefix="unsigned_txs_") as path:
+            result = self._run_command(["tx", "sign-batch", path, "--from", from_key] + offline)
+        
+        if "output" not in result:
+            return [result]
+        return [json.loads(line) for line in result["output"].splitlines() if line.strip()]
+    
+    @property
+    def native_broadcast(self) -> bool:
+        """True if signed txs are broadcast through the native transport."""
+        return self.transport is not None and self.transport.supports_broadcast
+    
+    def encode_txs(self, txs: List[Dict[str, Any]]) -> List[str]:
+        """
+        Encode signed txs to base64 protobuf bytes for the native transport.
+        
+        Encoding is offline and independent per tx, so the txs are encoded
+        in parallel.
+        """
+        def encode(tx: Dict[str, Any]) -> str:
+            with proposal_file(json.dumps(tx), prefix="signed_tx_") as path:
+                return self._run_command(["tx", "encode", path])["output"]
+        
+        return map_in_context(encode, txs, config.max_concurrency)
+    
+    def broadcast_signed_tx(self, tx: Union[Dict[str, Any], str]) -> Dict[str, Any]:
+        """
+        Broadcast a signed tx in sync mode.
+        
+        Args:
+            tx: Signed tx JSON, or its base64 bytes from encode_txs
+            
+        Returns:
+            Broadcast result
+        """
+        if not isinstance(tx, str):
+            # A timed-out broadcast may still land, so it is attempted once
+            with proposal_file(json.dumps(tx), prefix="signed_tx_") as path:
+                return self._run_command(["tx", "broadcast", path, "--broadcast-mode", "sync"], retry_count=1)
+        
+        self._check_circuit()
+        try:
+            result = self.transport.broadcast(tx, timeout=clip_to_deadline(None))
+        except QueryTransportError as e:
+            logger.error(str(e))
+            clip_to_deadline(None)
+            if is_connection_failure(str(e)):
+                self.circuit_breaker.record_failure()
+            else:
+                self.circuit_breaker.record_success()
+            raise InjectiveCLIError(str(e)) from e
+        self.circuit_breaker.record_success()
+        return result
+    
+    def broadcast_unsigned_tx(self, tx: Dict[str, Any], from_key: str) -> Dict[str, Any]:
+        """
+        Sign an unsigned tx with a local key and broadcast it.
+        
+        Args:
+            tx: Unsigned tx JSON, e.g. from merge_unsigned_txs
+            from_key: Signing key name
+            
+        Returns:
+            Broadcast result
+        """
+        def send(sequence_args: List[str]) -> Dict[str, Any]:
+            if sequence_args:
+                signed = self.sign_txs([tx], from_key, account_number=int(sequence_args[1]),
+                                       sequence=int(sequence_args[3]))
+            else:
+                signed = self.sign_txs([tx], from_key)
+            payload = self.encode_txs(signed)[0] if self.native_broadcast else signed[0]
+            return self.broadcast_signed_tx(payload)
+        
+        if self.sequence_manager is None:
+            return send([])
+        return self._with_sequence(from_key, send)
+    
+    def update_markets_admin(
+        self, updates: Dict[str, str], from_key: str, gas_per_message: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Update the RMR of several markets in a single multi-message tx.
+        
+        Args:
+            updates: Market ID -> new RMR value as string, in message order
+            from_key: Admin key name
+            gas_per_message: Gas budgeted per message (defaults to config.batch_gas_per_message)
+            
+        Returns:
+            Broadcast result of the combined tx
+        """
+        gas_per_message = gas_per_message or config.batch_gas_per_message
+        granter = self._admin_granter(from_key)
+        unsigned = [
+            self.generate_update_market_admin(market_id, rmr, granter or from_key)
+            for market_id, rmr in updates.items()
+        ]
+        tx = merge_unsigned_txs(unsigned, gas_limit=gas_per_message * len(unsigned))
+        
+        try:
+            if granter is not None:
+                return self.exec_authz(tx, from_key)
+            return self.broadcast_unsigned_tx(tx, from_key)
+        finally:
+            self._invalidate(*[f"market:{market_id}" for market_id in updates], "markets")
+    
+    def exec_authz(self, tx: Dict[str, Any], from_key: str) -> Dict[str, Any]:
+        """
+        Execute the messages of an unsigned tx on behalf of their signer, through an authz grant.
+        
+        Args:
+            tx: Unsigned tx whose messages are signed by the granter
+            from_key: Grantee key name, which signs and pays for the MsgExec
+            
+        Returns:
+            Broadcast result
+        """
+        with proposal_file(json.dumps(tx), prefix="authz_exec_") as path:
+            return self._broadcast_tx(["tx", "authz", "exec", path, "--from", from_key], from_key)
+    
+    def grant_authz(
+        self, granter_key: str, grantees: List[str], msg_type: str, gas_per_message: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Grant several addresses a generic authorization for one message type, in a single tx.
+        
+        Args:
+            granter_key: Granter key name
+            grantees: Grantee addresses
+            msg_type: Authorized message type URL
+            gas_per_message: Gas budgeted per grant (defaults to config.batch_gas_per_message)
+            
+        Returns:
+            Broadcast result of the combined tx
+        """
+        gas_per_message = gas_per_message or config.batch_gas_per_message
+        unsigned = [
+            self.generate_tx(["tx", "authz", "grant", grantee, "generic", "--msg-type", msg_type,
+                              "--from", granter_key])
+            for grantee in grantees
+        ]
+        tx = merge_unsigned_txs(unsigned, gas_limit=gas_per_message * len(unsigned))
+        return self.broadcast_unsigned_tx(tx, granter_key)
+    
+    def multi_send(self, from_key: str, addresses: List[str], amount: str) -> Dict[str, Any]:
+        """
+        Send the same amount to several addresses in one MsgMultiSend tx.
+        
+        Args:
+            from_key: Sender key name
+            addresses: Recipient addresses
+            amount: Amount each recipient gets, e.g. "1000000000000000000inj"
+            
+        Returns:
+            Broadcast result
+        """
+        cmd = ["tx", "bank", "multi-send", from_key] + list(addresses) + [amount, "--from", from_key]
+        return self._broadcast_tx(cmd, from_key)
+    
+    def wait_for_next_block(self, blocks: int = 1, timeout: Optional[float] = None) -> int:
+        """
+        Wait for specified number of blocks.
+        
+        Returns as soon as the target height is committed, using NewBlock
+        events (or /status polling) on the node's RPC endpoint.
+        
+        Args:
+            blocks: Number of blocks to wait for
+            timeout: Maximum seconds to wait (defaults to config.test_timeout)
+            
+        Returns:
+            The observed block height
+        """
         logger.info(f"Waiting for {blocks} block(s)...")
-        time.sleep(blocks * 3)  # Assume ~3 second block time
+        timeout = clip_to_deadline(timeout if timeout is not None else config.test_timeout)
+        
+        try:
+            start_height = self.block_waiter.current_height()
+            height = self.block_waiter.wait_for_height(start_height + blocks, timeout)
+        except BlockWaitTimeout as e:
+            raise InjectiveCLIError(str(e)) from e
+        except BlockWaitError as e:
+            # No RPC endpoint to watch (e.g. the mock CLI): fall back to the block time estimate
+            logger.warning(f"{e}; assuming ~3 second block time")
+            current_clock().sleep(clip_to_deadline(blocks * 3))
+            return self.get_latest_block_height()
+        
+        if self.cache is not None:
+            self.cache.observe_height(height)
+        
+        return height
     
     def get_latest_block_height(self) -> int:
         """Get the current block height."""
         cmd = ["query", "block"]
-        result = self._run_command(cmd)
-        return int(result.get("block", {}).get("header", {}).get("height", 0))
+        if getattr(self._probe_state, "active", False):
+            # A circuit probe makes one attempt, and may run inside a coalesced
+            # "query block" call that it must not wait on
+            result = self._execute_query(cmd, retry_count=1)
+        else:
+            result = self._query(cmd)
+        height = int(result.get("block", {}).get("header", {}).get("height", 0))
+        
+        if self.cache is not None:
+            self.cache.observe_height(height)
+        
+        return height
 
 
 # Global CLI instance
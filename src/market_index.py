@@ -0,0 +1,99 @@
+"""
+Ticker -> market ID -> last-known market state index.
+
+Markets never change ticker or ID, so once seen they can be found again
+without listing the chain's markets. Misses are resolved by streaming the
+listing (stopping at the first match) and indexing every market seen on
+the way. A complete listing records the block height it reflects, and a
+miss at that same height is answered locally, since no market can have
+been created in between.
+"""
+
+import logging
+import threading
+from typing import Dict, Any, Callable, Iterator, Optional
+
+
+logger = logging.getLogger(__name__)
+
+
+class MarketIndex:
+    """Session-wide index of markets by ticker and market ID."""
+
+    def __init__(self):
+        self._ids: Dict[str, str] = {}
+        self._markets: Dict[str, Dict[str, Any]] = {}
+        self.synced_height: Optional[int] = None
+        self.hits = 0
+        self.scans = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._markets)
+
+    def observe(self, entry: Dict[str, Any]) -> None:
+        """
+        Record a market's current state.
+
+        Args:
+            entry: Market in the {"market": {...}} shape the market queries return
+        """
+        market = entry.get("market", {})
+        market_id, ticker = market.get("market_id"), market.get("ticker")
+        if not market_id:
+            return
+        with self._lock:
+            self._markets[market_id] = entry
+            if ticker:
+                self._ids[ticker] = market_id
+
+    def get(self, ticker: str) -> Optional[Dict[str, Any]]:
+        """Return the last-known state of a market by ticker, without any queries."""
+        with self._lock:
+            market_id = self._ids.get(ticker)
+            return self._markets.get(market_id) if market_id else None
+
+    def market_id(self, ticker: str) -> Optional[str]:
+        with self._lock:
+            return self._ids.get(ticker)
+
+    def find(
+        self,
+        ticker: str,
+        iter_markets: Callable[[], Iterator[Dict[str, Any]]],
+        current_height: Callable[[], int],
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Look up a market by ticker, listing markets only when it is not indexed.
+
+        Args:
+            ticker: Market ticker
+            iter_markets: Streams the chain's markets
+            current_height: Returns the latest block height
+
+        Returns:
+            Last-known market state, or None if the chain has no such market
+        """
+        entry = self.get(ticker)
+        if entry is not None:
+            with self._lock:
+                self.hits += 1
+            return entry
+
+        height = current_height()
+        with self._lock:
+            # Any other height, even a lower one after a node restart, may list new markets
+            if height == self.synced_height:
+                return None
+            self.scans += 1
+
+        for entry in iter_markets():
+            self.observe(entry)
+            if entry.get("market", {}).get("ticker") == ticker:
+                return entry
+
+        with self._lock:
+            # Every market that existed at this height is now indexed
+            self.synced_height = height
+        logger.debug(f"Indexed {len(self)} markets at height {height}; {ticker} not among them")
+        return None
@@ -0,0 +1,148 @@
+"""
+Pool of pre-launched test markets leased to tests one at a time.
+
+Launching a market takes a full governance voting period, while most tests
+only need "a market at the baseline RMR". The pool launches markets in
+batches through one set of proposals, hands each to one test at a time and,
+on release, puts the market back at its baseline RMR with a single admin
+update. When every market is leased the pool launches another batch.
+
+Each pytest-xdist worker runs its own pool; the worker ID is part of every
+ticker, so workers never launch or lease the same market.
+"""
+
+import logging
+import threading
+import time
+from typing import Dict, Any, List
+
+from injective_cli import InjectiveCLIError
+from market_utils import MarketUtils
+
+
+logger = logging.getLogger(__name__)
+
+
+class MarketPool:
+    """Leases pre-launched markets at a baseline RMR."""
+
+    def __init__(self, baseline_rmr: float, size: int = 4, worker: str = "",
+                 prefix: str = "POOL", timeout: float = 300):
+        """
+        Initialize the pool; no markets are launched until the first lease.
+
+        Args:
+            baseline_rmr: RMR every market is launched with and reset to on release
+            size: Markets launched per batch
+            worker: pytest-xdist worker ID, made part of every ticker
+            prefix: Ticker prefix
+            timeout: Timeout in seconds for launching one batch
+        """
+        self.baseline_rmr = baseline_rmr
+        self.size = max(1, size)
+        self.timeout = timeout
+        self.launches = 0
+        self.resets = 0
+        # Tickers must be unique on a chain that outlives the session
+        self._ticker_prefix = f"{prefix}{int(time.time())}{worker.upper()}"
+        self._free: List[Dict[str, Any]] = []
+        self._leased: Dict[str, Dict[str, Any]] = {}
+        self._launched = 0
+        self._growing = False
+        self._condition = threading.Condition()
+
+    def __len__(self) -> int:
+        with self._condition:
+            return len(self._free) + len(self._leased)
+
+    @property
+    def available(self) -> int:
+        with self._condition:
+            return len(self._free)
+
+    def lease(self) -> Dict[str, Any]:
+        """
+        Take a market for exclusive use, launching a batch if none is free.
+
+        Returns:
+            {"market_id", "ticker", "rmr", "proposal_id"} with rmr at the baseline
+        """
+        while True:
+            with self._condition:
+                while not self._free and self._growing:
+                    self._condition.wait()
+                if self._free:
+                    market = self._free.pop()
+                    self._leased[market["market_id"]] = market
+                    return dict(market)
+                # Nobody is launching markets; this caller grows the pool
+                self._growing = True
+
+            try:
+                self._grow()
+            finally:
+                with self._condition:
+                    self._growing = False
+                    self._condition.notify_all()
+
+    def release(self, market: Dict[str, Any]) -> None:
+        """
+        Return a leased market, resetting its RMR to the baseline if a test changed it.
+
+        A market that cannot be reset is dropped from the pool rather than
+        handed to the next test in an unknown state.
+        """
+        market_id = market["market_id"]
+        with self._condition:
+            pooled = self._leased.pop(market_id, None)
+        if pooled is None:
+            raise InjectiveCLIError(f"Market {market_id} is not leased from this pool")
+
+        try:
+            clean = MarketUtils.verify_rmr_value(market_id, self.baseline_rmr)
+        except InjectiveCLIError as e:
+            logger.warning(f"Could not read RMR of pooled market {market_id}: {e}")
+            clean = False
+        if not clean:
+            clean = MarketUtils.update_market_rmr(market_id, self.baseline_rmr)
+            with self._condition:
+                self.resets += 1
+        if not clean:
+            logger.warning(f"Dropping pooled market {market_id}: RMR could not be reset to {self.baseline_rmr}")
+            return
+
+        with self._condition:
+            self._free.append(pooled)
+            self._condition.notify()
+
+    def _grow(self) -> None:
+        """Launch one batch of markets through governance and add them to the free list."""
+        with self._condition:
+            start = self._launched
+            self._launched += self.size
+        specs = [
+            {
+                "ticker": f"{self._ticker_prefix}{start + index}/USDT PERP",
+                "base_denom": "tst",
+                "quote_denom": "usdt",
+                "rmr": self.baseline_rmr,
+            }
+            for index in range(self.size)
+        ]
+
+        logger.info(f"Growing market pool by {len(specs)} market(s)")
+        results = MarketUtils.launch_markets(specs, timeout=self.timeout)
+        with self._condition:
+            self.launches += 1
+        launched = [
+            {"market_id": result["market_id"], "ticker": ticker, "rmr": self.baseline_rmr,
+             "proposal_id": result["proposal_id"]}
+            for ticker, result in results.items() if result["success"]
+        ]
+        if not launched:
+            errors = {result["error"] for result in results.values()}
+            raise InjectiveCLIError(f"Failed to launch pooled markets: {sorted(errors)}")
+
+        with self._condition:
+            self._free.extend(launched)
+        logger.info(f"Market pool holds {len(self)} market(s)")
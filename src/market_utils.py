@@ -3,13 +3,17 @@ Market-related utilities for RMR testing.
 """
 
 import json
-import time
 import logging
 from typing import Dict, List, Any, Optional
-from decimal import Decimal, ROUND_DOWN
+from decimal import Decimal, InvalidOperation, ROUND_DOWN
 
 from injective_cli import cli, InjectiveCLIError
+from tx_batch import plan_batches, message_results
 from test_config import config
+from deadline import Deadline, deadline_scope, map_in_context
+from gov_schedule import DEPOSIT_PERIOD, GovParams, poll_delay, tally_outcome
+from query_cache import TERMINAL_PROPOSAL_STATUSES
+from clock import current_clock
 
 
 logger = logging.getLogger(__name__)
@@ -43,6 +47,56 @@ class MarketUtils:
         Returns:
             JSON string for governance proposal
         """
+        message = MarketUtils._market_launch_message(ticker, base_denom, quote_denom, rmr, imr, mmr, **kwargs)
+        rmr_str = message["reduce_margin_ratio"]
+        
+        proposal = {
+            "messages": [message],
+            "metadata": kwargs.get("metadata", "ipfs://CID"),
+            "deposit": kwargs.get("deposit", "1000000000000000000inj"),  # 1 INJ
+            "title": f"Launch {ticker} Perpetual Market with RMR",
+            "summary": f"Proposal to launch {ticker} perpetual market with RMR={rmr_str}",
+        }
+        
+        return json.dumps(proposal, indent=2)
+    
+    @staticmethod
+    def create_markets_proposal_json(markets: List[Dict[str, Any]], **kwargs) -> str:
+        """
+        Create one JSON proposal launching several perpetual markets.
+        
+        Args:
+            markets: One dict per market with the create_market_proposal_json
+                arguments (ticker, base_denom, quote_denom, rmr, optional imr/mmr/...)
+            **kwargs: Proposal-level fields (metadata, deposit)
+            
+        Returns:
+            JSON string for governance proposal
+        """
+        messages = [MarketUtils._market_launch_message(**market) for market in markets]
+        tickers = ", ".join(message["ticker"] for message in messages)
+        
+        proposal = {
+            "messages": messages,
+            "metadata": kwargs.get("metadata", "ipfs://CID"),
+            "deposit": kwargs.get("deposit", "1000000000000000000inj"),  # 1 INJ
+            "title": f"Launch {len(messages)} Perpetual Markets with RMR",
+            "summary": f"Proposal to launch perpetual markets: {tickers}",
+        }
+        
+        return json.dumps(proposal, indent=2)
+    
+    @staticmethod
+    def _market_launch_message(
+        ticker: str,
+        base_denom: str,
+        quote_denom: str,
+        rmr: float,
+        imr: float = None,
+        mmr: float = None,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """Build and validate one MsgInstantPerpetualMarketLaunch."""
         if imr is None:
             imr = config.margin_ratios["imr"]
         if mmr is None:
@@ -57,47 +111,67 @@ class MarketUtils:
         imr_str = str(Decimal(str(imr)).quantize(Decimal('0.000001'), rounding=ROUND_DOWN))
         mmr_str = str(Decimal(str(mmr)).quantize(Decimal('0.000001'), rounding=ROUND_DOWN))
         
-        proposal = {
-            "messages": [
-                {
-                    "@type": "/injective.exchange.v1beta1.MsgInstantPerpetualMarketLaunch",
-                    "sender": kwargs.get("sender", "inj1..."),  # Will be replaced with actual sender
-                    "ticker": ticker,
-                    "base_denom": base_denom,
-                    "quote_denom": quote_denom,
-                    "oracle_base": kwargs.get("oracle_base", base_denom),
-                    "oracle_quote": kwargs.get("oracle_quote", quote_denom),
-                    "oracle_scale_factor": kwargs.get("oracle_scale_factor", 6),
-                    "oracle_type": kwargs.get("oracle_type", "Band"),
-                    "maker_fee_rate": kwargs.get("maker_fee_rate", "0.001"),
-                    "taker_fee_rate": kwargs.get("taker_fee_rate", "0.002"),
-                    "initial_margin_ratio": imr_str,
-                    "maintenance_margin_ratio": mmr_str,
-                    "reduce_margin_ratio": rmr_str,  # The key field we're testing
-                    "min_price_tick_size": kwargs.get("min_price_tick_size", "0.000001"),
-                    "min_quantity_tick_size": kwargs.get("min_quantity_tick_size", "0.001"),
-                }
-            ],
-            "metadata": kwargs.get("metadata", "ipfs://CID"),
-            "deposit": kwargs.get("deposit", "1000000000000000000inj"),  # 1 INJ
-            "title": f"Launch {ticker} Perpetual Market with RMR",
-            "summary": f"Proposal to launch {ticker} perpetual market with RMR={rmr_str}",
+        return {
+            "@type": "/injective.exchange.v1beta1.MsgInstantPerpetualMarketLaunch",
+            "sender": kwargs.get("sender", "inj1..."),  # Will be replaced with actual sender
+            "ticker": ticker,
+            "base_denom": base_denom,
+            "quote_denom": quote_denom,
+            "oracle_base": kwargs.get("oracle_base", base_denom),
+            "oracle_quote": kwargs.get("oracle_quote", quote_denom),
+            "oracle_scale_factor": kwargs.get("oracle_scale_factor", 6),
+            "oracle_type": kwargs.get("oracle_type", "Band"),
+            "maker_fee_rate": kwargs.get("maker_fee_rate", "0.001"),
+            "taker_fee_rate": kwargs.get("taker_fee_rate", "0.002"),
+            "initial_margin_ratio": imr_str,
+            "maintenance_margin_ratio": mmr_str,
+            "reduce_margin_ratio": rmr_str,  # The key field we're testing
+            "min_price_tick_size": kwargs.get("min_price_tick_size", "0.000001"),
+            "min_quantity_tick_size": kwargs.get("min_quantity_tick_size", "0.001"),
         }
-        
-        return json.dumps(proposal, indent=2)
     
     @staticmethod
-    def submit_and_pass_proposal(proposal_json: str, timeout: int = 60) -> str:
+    def submit_and_pass_proposal(proposal_json: str, timeout: int = 60,
+                                 deadline: Optional[Deadline] = None,
+                                 voter_keys: Optional[List[str]] = None) -> str:
         """
         Submit a governance proposal and vote to pass it.
         
+        Every CLI call in the flow is clipped to the same deadline, so the
+        whole submit/vote/pass sequence finishes (or fails) within timeout.
+        The votes are cast as soon as the proposal is in its voting period, and
+        the outcome is polled on a schedule aligned to its voting_end_time,
+        so the flow takes as long as the chain's voting period requires.
+        
         Args:
             proposal_json: Proposal JSON string
-            timeout: Timeout in seconds
+            timeout: Timeout in seconds for the whole flow
+            deadline: Enclosing deadline; the earlier of the two applies
+            voter_keys: Keys voting yes, concurrently (defaults to config.voter_keys)
             
         Returns:
             Proposal ID
         """
+        with deadline_scope(timeout, deadline) as flow_deadline:
+            return MarketUtils._submit_and_pass_proposal(
+                proposal_json, flow_deadline, voter_keys or config.voter_keys
+            )
+    
+    @staticmethod
+    def _check_voting_period(gov_params: GovParams, flow_deadline: Deadline) -> None:
+        """Fail before submitting anything if voting cannot end before flow_deadline."""
+        if gov_params.voting_period > flow_deadline.remaining():
+            raise InjectiveCLIError(
+                f"Voting period of {gov_params.voting_period:.0f}s does not fit in the "
+                f"{flow_deadline.remaining():.0f}s left of the {flow_deadline.timeout}s timeout"
+            )
+    
+    @staticmethod
+    def _submit_and_pass_proposal(proposal_json: str, flow_deadline: Deadline, voter_keys: List[str]) -> str:
+        """Submit, vote and wait for the proposal to pass before flow_deadline."""
+        gov_params = GovParams(cli.query_gov_params())
+        MarketUtils._check_voting_period(gov_params, flow_deadline)
+        
         # Submit proposal
         logger.info("Submitting governance proposal...")
         result = cli.create_market_proposal(proposal_json, config.admin_key)
@@ -105,24 +179,33 @@ class MarketUtils:
         if "code" in result and result["code"] != 0:
             raise InjectiveCLIError(f"Failed to submit proposal: {result}")
         
+        # Wait for the submission to be included; the proposal is then in its voting period
+        included = MarketUtils.wait_for_inclusion(result)
+        if included.get("code", 0) != 0:
+            raise InjectiveCLIError(f"Proposal submission failed in block: {included}")
+        
         # Extract proposal ID from transaction events
-        proposal_id = MarketUtils._extract_proposal_id(result)
+        proposal_id = MarketUtils._extract_proposal_id(included)
         logger.info(f"Proposal submitted with ID: {proposal_id}")
         
-        # Wait for proposal to be in voting period
-        time.sleep(5)
+        proposal = MarketUtils._wait_for_voting_period(proposal_id, flow_deadline)
+        voting_end = gov_params.voting_end(proposal, current_clock().time())
         
-        # Vote on proposal
-        logger.info(f"Voting on proposal {proposal_id}...")
-        vote_result = cli.vote_proposal(proposal_id, "yes", config.validator_key)
-        
-        if "code" in vote_result and vote_result["code"] != 0:
-            raise InjectiveCLIError(f"Failed to vote on proposal: {vote_result}")
+        decided = None
+        if proposal.get("status") not in TERMINAL_PROPOSAL_STATUSES:
+            # Vote on proposal
+            logger.info(f"Voting on proposal {proposal_id} with {len(voter_keys)} key(s)...")
+            error = MarketUtils._cast_votes([proposal_id], voter_keys)[proposal_id]
+            if error is not None:
+                raise InjectiveCLIError(f"Failed to vote on proposal {proposal_id}: {error}")
+            
+            decided = MarketUtils._tally_outcomes([proposal_id], gov_params)[proposal_id]
+            if decided is False:
+                raise InjectiveCLIError(f"Proposal {proposal_id} cannot pass with the votes cast")
         
         # Wait for proposal to pass
-        start_time = time.time()
-        while time.time() - start_time < timeout:
-            proposal_status = cli.query_proposal(proposal_id)
+        while not flow_deadline.expired():
+            proposal_status = cli.query_proposal(proposal_id, use_cache=False)
             status = proposal_status.get("proposal", {}).get("status", "")
             
             if status == "PROPOSAL_STATUS_PASSED":
@@ -131,9 +214,249 @@ class MarketUtils:
             elif status in ["PROPOSAL_STATUS_REJECTED", "PROPOSAL_STATUS_FAILED"]:
                 raise InjectiveCLIError(f"Proposal {proposal_id} failed with status: {status}")
             
-            time.sleep(3)
+            delay = poll_delay(voting_end, current_clock().time(), decided=bool(decided))
+            if delay is not None:
+                current_clock().sleep(flow_deadline.clip(delay))
+                continue
+            
+            # Voting has ended; the outcome is set when the next block is processed
+            try:
+                cli.wait_for_next_block(1)
+            except InjectiveCLIError:
+                if not flow_deadline.expired():
+                    raise
+        
+        raise InjectiveCLIError(f"Proposal {proposal_id} did not pass within {flow_deadline.timeout}s")
+    
+    @staticmethod
+    def _cast_votes(proposal_ids: List[str], voter_keys: List[str]) -> Dict[str, Optional[str]]:
+        """
+        Vote yes on proposals from every voter key at once, one tx per key.
+        
+        The keys are separate accounts, so their txs never contend for a
+        sequence; they are broadcast concurrently and awaited together.
+        
+        Returns:
+            Proposal ID -> None if at least one vote on it was included, else the error
+        """
+        def send(voter_key: str) -> Dict[str, Any]:
+            try:
+                if len(proposal_ids) == 1:
+                    return cli.vote_proposal(proposal_ids[0], "yes", voter_key)
+                return cli.vote_proposals(proposal_ids, "yes", voter_key)
+            except InjectiveCLIError as e:
+                return {"code": 1, "raw_log": str(e)}
+        
+        results = map_in_context(send, voter_keys, len(voter_keys))
         
-        raise InjectiveCLIError(f"Proposal {proposal_id} did not pass within timeout")
+        broadcast = [result["txhash"] for result in results
+                     if int(result.get("code", 0)) == 0 and result.get("txhash")]
+        included = cli.wait_for_txs(broadcast) if broadcast else {}
+        
+        errors: Dict[str, Optional[str]] = {proposal_id: "no vote was cast" for proposal_id in proposal_ids}
+        for result in results:
+            final = included.get(result.get("txhash"), result)
+            for proposal_id, vote in message_results(proposal_ids, final).items():
+                if vote["success"]:
+                    errors[proposal_id] = None
+                elif errors[proposal_id] is not None:
+                    errors[proposal_id] = vote["error"]
+        return errors
+    
+    @staticmethod
+    def _tally_outcomes(proposal_ids: List[str], gov_params: GovParams) -> Dict[str, Optional[bool]]:
+        """Decide proposals from their tallies where the remaining votes cannot change them."""
+        try:
+            pool = cli.query_staking_pool()
+            tallies = cli.query_tallies(proposal_ids)
+        except InjectiveCLIError as e:
+            logger.debug(f"Tally unavailable, polling until voting ends: {e}")
+            return {proposal_id: None for proposal_id in proposal_ids}
+        
+        bonded_tokens = Decimal(pool.get("pool", pool).get("bonded_tokens") or "0")
+        return {
+            proposal_id: tally_outcome(tallies[proposal_id].get("tally", {}), bonded_tokens, gov_params)
+            for proposal_id in proposal_ids
+        }
+    
+    @staticmethod
+    def submit_and_pass_proposals(proposal_jsons: List[str], timeout: float = 120,
+                                  deadline: Optional[Deadline] = None,
+                                  voter_keys: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """
+        Submit several governance proposals and pass them together.
+        
+        All proposals are submitted before waiting for any, voted on in one
+        multi-message tx per voter key and then watched by a single status
+        poll, so N proposals take about one voting period rather than N.
+        
+        Args:
+            proposal_jsons: Proposal JSON strings (or file paths)
+            timeout: Timeout in seconds for the whole flow
+            deadline: Enclosing deadline; the earlier of the two applies
+            voter_keys: Keys voting yes, concurrently (defaults to config.voter_keys)
+        
+        Returns:
+            One {"success", "proposal_id", "status", "error"} per proposal, in order
+        """
+        outcomes = [
+            {"success": False, "proposal_id": None, "status": None, "error": None} for _ in proposal_jsons
+        ]
+        with deadline_scope(timeout, deadline) as flow_deadline:
+            try:
+                MarketUtils._pass_proposals(proposal_jsons, outcomes, flow_deadline, voter_keys or config.voter_keys)
+            except InjectiveCLIError as e:
+                for outcome in outcomes:
+                    if not outcome["success"] and outcome["error"] is None:
+                        outcome["error"] = str(e)
+        
+        failed = [index for index, outcome in enumerate(outcomes) if not outcome["success"]]
+        if failed:
+            logger.error(f"{len(failed)} of {len(outcomes)} proposal(s) did not pass: {failed}")
+        return outcomes
+    
+    @staticmethod
+    def _pass_proposals(proposal_jsons: List[str], outcomes: List[Dict[str, Any]],
+                        flow_deadline: Deadline, voter_keys: List[str]) -> None:
+        """Run the submit/vote/poll stages for every proposal, filling in outcomes."""
+        gov_params = GovParams(cli.query_gov_params())
+        MarketUtils._check_voting_period(gov_params, flow_deadline)
+        
+        # Broadcast every submission, then wait for them together
+        logger.info(f"Submitting {len(proposal_jsons)} governance proposals...")
+        submitted: Dict[str, int] = {}
+        for index, proposal_json in enumerate(proposal_jsons):
+            try:
+                result = cli.create_market_proposal(proposal_json, config.admin_key)
+            except InjectiveCLIError as e:
+                outcomes[index]["error"] = f"Failed to submit proposal: {e}"
+                continue
+            if int(result.get("code", 0)) != 0 or not result.get("txhash"):
+                outcomes[index]["error"] = f"Failed to submit proposal: {result}"
+            else:
+                submitted[result["txhash"]] = index
+        
+        pending: Dict[str, int] = {}
+        if submitted:
+            for txhash, included in cli.wait_for_txs(list(submitted)).items():
+                index = submitted[txhash]
+                if included.get("code", 0) != 0:
+                    outcomes[index]["error"] = f"Proposal submission failed in block: {included}"
+                    continue
+                proposal_id = MarketUtils._extract_proposal_id(included)
+                outcomes[index]["proposal_id"] = proposal_id
+                pending[proposal_id] = index
+        
+        # One vote tx per voter for every proposal that has reached its voting period
+        proposals = MarketUtils._wait_for_voting_periods(list(pending), flow_deadline)
+        now = current_clock().time()
+        voting_ends = {
+            proposal_id: gov_params.voting_end(proposal, now) for proposal_id, proposal in proposals.items()
+        }
+        to_vote = [
+            proposal_id for proposal_id, proposal in proposals.items()
+            if proposal.get("status") not in TERMINAL_PROPOSAL_STATUSES
+        ]
+        decided: Dict[str, Optional[bool]] = {}
+        if to_vote:
+            logger.info(f"Voting on proposals {to_vote} with {len(voter_keys)} key(s)...")
+            for proposal_id, error in MarketUtils._cast_votes(to_vote, voter_keys).items():
+                if error is not None:
+                    outcomes[pending.pop(proposal_id)]["error"] = f"Vote failed: {error}"
+            
+            decided = MarketUtils._tally_outcomes([p for p in to_vote if p in pending], gov_params)
+            for proposal_id in [p for p, outcome in decided.items() if outcome is False]:
+                outcomes[pending.pop(proposal_id)]["error"] = f"Proposal {proposal_id} cannot pass with the votes cast"
+        
+        # One status poll for all proposals, aligned to the earliest voting end still pending
+        while pending:
+            for proposal_id, proposal_status in cli.query_proposals(list(pending), use_cache=False).items():
+                status = proposal_status.get("proposal", {}).get("status", "")
+                outcome = outcomes[pending[proposal_id]]
+                outcome["status"] = status
+                if status == "PROPOSAL_STATUS_PASSED":
+                    outcome["success"] = True
+                elif status in ["PROPOSAL_STATUS_REJECTED", "PROPOSAL_STATUS_FAILED"]:
+                    outcome["error"] = f"Proposal {proposal_id} failed with status: {status}"
+                else:
+                    continue
+                del pending[proposal_id]
+            
+            if not pending:
+                break
+            if flow_deadline.expired():
+                raise InjectiveCLIError(f"Proposals {list(pending)} did not pass within {flow_deadline.timeout}s")
+            
+            # Proposals the tally has decided need no polls before voting ends
+            undecided = [proposal_id for proposal_id in pending if not decided.get(proposal_id)]
+            now = current_clock().time()
+            if undecided:
+                delay = poll_delay(min(voting_ends[proposal_id] for proposal_id in undecided), now)
+            else:
+                delay = poll_delay(min(voting_ends[proposal_id] for proposal_id in pending), now, decided=True)
+            if delay is not None:
+                current_clock().sleep(flow_deadline.clip(delay))
+                continue
+            
+            # Voting has ended; outcomes are set when the next block is processed
+            try:
+                cli.wait_for_next_block(1)
+            except InjectiveCLIError:
+                if not flow_deadline.expired():
+                    raise
+    
+    @staticmethod
+    def _wait_for_voting_periods(proposal_ids: List[str], flow_deadline: Deadline) -> Dict[str, Dict[str, Any]]:
+        """Return the proposals once all have left their deposit period, checking once per block."""
+        proposals: Dict[str, Dict[str, Any]] = {}
+        while True:
+            waiting = [proposal_id for proposal_id in proposal_ids if proposal_id not in proposals]
+            for proposal_id, result in cli.query_proposals(waiting, use_cache=False).items():
+                proposal = result.get("proposal", {})
+                if proposal.get("status") != DEPOSIT_PERIOD:
+                    proposals[proposal_id] = proposal
+            if len(proposals) == len(proposal_ids):
+                return proposals
+            
+            if flow_deadline.expired():
+                raise InjectiveCLIError(
+                    f"Proposals {waiting} did not reach their voting period within {flow_deadline.timeout}s"
+                )
+            cli.wait_for_next_block(1)
+    
+    @staticmethod
+    def _wait_for_voting_period(proposal_id: str, flow_deadline: Deadline) -> Dict[str, Any]:
+        """Return the proposal once it has left its deposit period, checking once per block."""
+        while True:
+            proposal = cli.query_proposal(proposal_id, use_cache=False).get("proposal", {})
+            if proposal.get("status") != DEPOSIT_PERIOD:
+                return proposal
+            
+            if flow_deadline.expired():
+                raise InjectiveCLIError(
+                    f"Proposal {proposal_id} did not reach its voting period within {flow_deadline.timeout}s"
+                )
+            cli.wait_for_next_block(1)
+    
+    @staticmethod
+    def wait_for_inclusion(tx_result: Dict[str, Any], timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Wait for a broadcast transaction to be included in a block.
+        
+        Args:
+            tx_result: Broadcast result returned by an InjectiveCLI tx method
+            timeout: Maximum seconds to wait (defaults to config.test_timeout)
+            
+        Returns:
+            The included tx result (height, code, raw_log, events)
+        """
+        txhash = tx_result.get("txhash")
+        if not txhash:
+            # Nothing to track; give the chain a block to process it
+            cli.wait_for_next_block(1)
+            return tx_result
+        
+        return cli.wait_for_tx(txhash, timeout)
     
     @staticmethod
     def _extract_proposal_id(tx_result: Dict[str, Any]) -> str:
@@ -161,19 +484,50 @@ class MarketUtils:
         """
         Find a market by its ticker.
         
+        The CLI's session-wide market index resolves the ticker to a market ID
+        without listing markets; the market itself is then re-queried, so
+        fields like the RMR reflect the chain rather than the index.
+        
         Args:
             ticker: Market ticker to search for
             
         Returns:
             Market information or None if not found
         """
-        markets = cli.query_all_markets()
+        indexed = cli.find_market(ticker)
+        if indexed is None:
+            return None
+        return cli.query_market(indexed["market"]["market_id"])
+    
+    @staticmethod
+    def wait_for_market(ticker: str, timeout: float = 60,
+                        deadline: Optional[Deadline] = None) -> Optional[Dict[str, Any]]:
+        """
+        Wait for a market launched by governance to become queryable.
         
-        for market in markets.get("markets", []):
-            if market.get("market", {}).get("ticker") == ticker:
-                return market
+        Checks once per block instead of sleeping a fixed time.
         
-        return None
+        Args:
+            ticker: Market ticker to wait for
+            timeout: Maximum seconds to wait
+            deadline: Enclosing deadline; the earlier of the two applies
+            
+        Returns:
+            Market information or None if it did not appear in time
+        """
+        with deadline_scope(timeout, deadline) as wait_deadline:
+            while True:
+                market = MarketUtils.get_market_by_ticker(ticker)
+                if market:
+                    return market
+                
+                if wait_deadline.expired():
+                    return None
+                
+                try:
+                    cli.wait_for_next_block(1)
+                except InjectiveCLIError:
+                    return None
     
     @staticmethod
     def verify_rmr_value(market_id: str, expected_rmr: float, tolerance: float = 0.000001) -> bool:
@@ -189,6 +543,62 @@ class MarketUtils:
             True if RMR matches expected value
         """
         market_info = cli.query_market(market_id)
+        return MarketUtils._check_rmr(market_id, market_info, expected_rmr, tolerance)
+    
+    @staticmethod
+    def verify_rmr_values(expected: Dict[str, float]) -> Dict[str, Dict[str, Any]]:
+        """
+        Verify the RMR of many markets with one market query.
+        
+        Values are compared exactly as decimals, after quantizing each
+        expected value the way update_market_rmr submits it.
+        
+        Args:
+            expected: Market ID -> expected RMR value
+        
+        Returns:
+            Market ID -> {"expected", "actual", "error"} for each market that
+            does not match; empty if all of them do
+        """
+        markets = cli.query_markets(list(expected))
+        return MarketUtils._rmr_mismatches(expected, markets)
+    
+    @staticmethod
+    def _rmr_mismatches(expected: Dict[str, float],
+                        markets: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """Compare queried markets against expected RMRs, reporting the mismatches."""
+        mismatches: Dict[str, Dict[str, Any]] = {}
+        
+        for market_id, expected_rmr in expected.items():
+            expected_dec = Decimal(str(expected_rmr)).quantize(Decimal('0.000001'), rounding=ROUND_DOWN)
+            report = {"expected": str(expected_dec), "actual": None, "error": None}
+            
+            rmr_str = markets.get(market_id, {}).get("market", {}).get("reduce_margin_ratio")
+            if market_id not in markets:
+                report["error"] = "market not found"
+            elif rmr_str is None:
+                report["error"] = "RMR field not found"
+            else:
+                report["actual"] = rmr_str
+                try:
+                    if Decimal(rmr_str) == expected_dec:
+                        continue
+                    report["error"] = "RMR mismatch"
+                except InvalidOperation:
+                    report["error"] = f"unparseable RMR value '{rmr_str}'"
+            
+            mismatches[market_id] = report
+        
+        if mismatches:
+            logger.error(f"RMR mismatches in {len(mismatches)} of {len(expected)} market(s): {mismatches}")
+        else:
+            logger.info(f"RMR verified for {len(expected)} market(s)")
+        return mismatches
+    
+    @staticmethod
+    def _check_rmr(market_id: str, market_info: Dict[str, Any], expected_rmr: float,
+                   tolerance: float) -> bool:
+        """Compare the RMR in a query_market response against the expected value."""
         market_data = market_info.get("market", {})
         
         if not market_data:
@@ -214,13 +624,14 @@ class MarketUtils:
             return False
     
     @staticmethod
-    def update_market_rmr(market_id: str, new_rmr: float) -> bool:
+    def update_market_rmr(market_id: str, new_rmr: float, deadline: Optional[Deadline] = None) -> bool:
         """
         Update market RMR via admin message.
         
         Args:
             market_id: Market ID to update
             new_rmr: New RMR value
+            deadline: Deadline for the update, inclusion and verification
             
         Returns:
             True if update was successful
@@ -228,26 +639,155 @@ class MarketUtils:
         rmr_str = str(Decimal(str(new_rmr)).quantize(Decimal('0.000001'), rounding=ROUND_DOWN))
         
         try:
-            result = cli.update_market_admin(market_id, rmr_str, config.admin_key)
-            
-            if "code" in result and result["code"] != 0:
-                logger.error(f"Failed to update market RMR: {result}")
-                return False
-            
-            # Wait for update to take effect
-            cli.wait_for_next_block(2)
-            
-            # Verify the update
-            return MarketUtils.verify_rmr_value(market_id, new_rmr)
+            with deadline_scope(deadline=deadline):
+                result = cli.update_market_admin(market_id, rmr_str, config.admin_key)
+                
+                if "code" in result and result["code"] != 0:
+                    logger.error(f"Failed to update market RMR: {result}")
+                    return False
+                
+                # Wait for the update tx to be included before verifying
+                included = MarketUtils.wait_for_inclusion(result)
+                if included.get("code", 0) != 0:
+                    logger.error(f"Market RMR update failed in block: {included}")
+                    return False
+                
+                # Verify the update
+                return MarketUtils.verify_rmr_value(market_id, new_rmr)
             
         except Exception as e:
             logger.error(f"Exception during market RMR update: {e}")
             return False
+    
+    @staticmethod
+    def update_market_rmrs(
+        updates: Dict[str, float],
+        max_messages: Optional[int] = None,
+        max_gas: Optional[int] = None,
+        deadline: Optional[Deadline] = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Update the RMR of many markets using as few txs as the caps allow.
+        
+        Updates are packed into multi-message admin txs; all batches are
+        broadcast before waiting, then every market gets its own result.
+        
+        Args:
+            updates: Market ID -> new RMR value
+            max_messages: Messages per tx (defaults to config.batch_max_messages)
+            max_gas: Gas limit per tx (defaults to config.batch_max_gas)
+            deadline: Deadline for broadcasting and inclusion
+            
+        Returns:
+            Market ID -> {"success", "txhash", "height", "code", "error"}
+        """
+        rmr_strs = {
+            market_id: str(Decimal(str(rmr)).quantize(Decimal('0.000001'), rounding=ROUND_DOWN))
+            for market_id, rmr in updates.items()
+        }
+        batches = plan_batches(list(rmr_strs), max_messages=max_messages, max_gas=max_gas)
+        logger.info(f"Updating {len(updates)} market RMRs in {len(batches)} tx(s)")
+        
+        results: Dict[str, Dict[str, Any]] = {}
+        broadcast: Dict[str, List[str]] = {}
+        
+        with deadline_scope(deadline=deadline):
+            for batch in batches:
+                try:
+                    result = cli.update_markets_admin(
+                        {market_id: rmr_strs[market_id] for market_id in batch}, config.admin_key
+                    )
+                except InjectiveCLIError as e:
+                    results.update(message_results(batch, {"code": 1, "raw_log": str(e)}))
+                    continue
+                
+                if int(result.get("code", 0)) != 0 or not result.get("txhash"):
+                    # Rejected before inclusion (or no hash to track)
+                    results.update(message_results(batch, result))
+                else:
+                    broadcast[result["txhash"]] = batch
+            
+            if broadcast:
+                try:
+                    included = cli.wait_for_txs(list(broadcast))
+                except InjectiveCLIError as e:
+                    included = {txhash: {"txhash": txhash, "code": 1, "raw_log": str(e)} for txhash in broadcast}
+                for txhash, batch in broadcast.items():
+                    results.update(message_results(batch, included[txhash]))
+        
+        failed = [market_id for market_id, result in results.items() if not result["success"]]
+        if failed:
+            logger.error(f"RMR updates failed for {len(failed)} market(s): {failed}")
+        return {market_id: results[market_id] for market_id in updates}
+    
+    @staticmethod
+    def launch_markets(
+        markets: List[Dict[str, Any]],
+        max_messages: Optional[int] = None,
+        timeout: float = 120,
+        deadline: Optional[Deadline] = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Launch many perpetual markets through as few proposals as the caps allow.
+        
+        The proposals go through governance together, in one voting period.
+        
+        Args:
+            markets: One dict per market with the create_market_proposal_json arguments
+            max_messages: Launch messages per proposal (defaults to config.batch_max_messages)
+            timeout: Timeout in seconds for all proposals and market creation
+            deadline: Enclosing deadline; the earlier of the two applies
+            
+        Returns:
+            Ticker -> {"success", "proposal_id", "market_id", "error"}
+        """
+        batches = plan_batches(
+            markets, max_messages=max_messages,
+            size_of=lambda market: len(json.dumps(MarketUtils._market_launch_message(**market))),
+        )
+        logger.info(f"Launching {len(markets)} markets in {len(batches)} proposal(s)")
+        
+        results: Dict[str, Dict[str, Any]] = {}
+        
+        with deadline_scope(timeout, deadline) as flow_deadline:
+            # The inner default timeouts would otherwise cut this flow's own budget
+            outcomes = MarketUtils.submit_and_pass_proposals(
+                [MarketUtils.create_markets_proposal_json(batch) for batch in batches],
+                timeout=flow_deadline.remaining(), deadline=flow_deadline
+            )
+            for batch, outcome in zip(batches, outcomes):
+                proposal_id = outcome["proposal_id"]
+                if not outcome["success"]:
+                    for market in batch:
+                        results[market["ticker"]] = {
+                            "success": False, "proposal_id": proposal_id, "market_id": None,
+                            "error": outcome["error"],
+                        }
+                    continue
+                
+                for market in batch:
+                    found = MarketUtils.wait_for_market(market["ticker"], timeout=flow_deadline.remaining(),
+                                                        deadline=flow_deadline)
+                    market_id = found.get("market", {}).get("market_id") if found else None
+                    results[market["ticker"]] = {
+                        "success": market_id is not None,
+                        "proposal_id": proposal_id,
+                        "market_id": market_id,
+                        "error": None if market_id else "market not found after proposal passed",
+                    }
+        
+        return results
 
 
 # Convenience functions
-def create_test_market(ticker: str, rmr: float, **kwargs) -> str:
-    """Create a test market with specified RMR and return market ID."""
+def create_test_market(ticker: str, rmr: float, timeout: float = 120,
+                       deadline: Optional[Deadline] = None, **kwargs) -> str:
+    """
+    Create a test market with specified RMR and return market ID.
+    
+    The proposal flow and the wait for the market share one deadline of
+    timeout seconds (or the enclosing deadline, if earlier).
+    """
     proposal_json = MarketUtils.create_market_proposal_json(
         ticker=ticker,
         base_denom="tst",
@@ -256,13 +796,15 @@ def create_test_market(ticker: str, rmr: float, **kwargs) -> str:
         **kwargs
     )
     
-    proposal_id = MarketUtils.submit_and_pass_proposal(proposal_json)
-    
-    # Wait for market to be created
-    time.sleep(10)
+    with deadline_scope(timeout, deadline) as flow_deadline:
+        # The inner default timeouts would otherwise cut this function's own budget
+        proposal_id = MarketUtils.submit_and_pass_proposal(
+            proposal_json, timeout=flow_deadline.remaining(), deadline=flow_deadline
+        )
+        
+        # Wait for market to be created
+        market = MarketUtils.wait_for_market(ticker, timeout=flow_deadline.remaining(), deadline=flow_deadline)
     
-    # Find the created market
-    market = MarketUtils.get_market_by_ticker(ticker)
     if not market:
         raise InjectiveCLIError(f"Market {ticker} not found after creation")
     
@@ -0,0 +1,110 @@
+"""
+Block-height-aware response cache for read-only CLI queries.
+
+Chain state only changes when a new block is committed, so a query answered
+at height H stays valid until the height moves. Entries are keyed by the
+full command and tagged with the markets/proposals they describe, so a tx
+sent by this client can invalidate exactly what it touched.
+"""
+
+import copy
+import logging
+import threading
+from typing import Dict, Any, Optional, Iterable, Tuple
+
+
+logger = logging.getLogger(__name__)
+
+# Proposal statuses that can never change again
+TERMINAL_PROPOSAL_STATUSES = frozenset({
+    "PROPOSAL_STATUS_PASSED",
+    "PROPOSAL_STATUS_REJECTED",
+    "PROPOSAL_STATUS_FAILED",
+})
+
+
+class QueryCache:
+    """Thread-safe query cache invalidated on block height changes."""
+
+    def __init__(self):
+        """Initialize an empty cache."""
+        self._entries: Dict[Tuple[str, ...], Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self.height: Optional[int] = None
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Tuple[str, ...]) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached response.
+
+        Args:
+            key: Cache key (the query command as a tuple)
+
+        Returns:
+            A copy of the cached response, or None on a miss
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            return copy.deepcopy(entry["value"])
+
+    def put(self, key: Tuple[str, ...], value: Dict[str, Any],
+            tags: Iterable[str] = (), permanent: bool = False) -> None:
+        """
+        Store a response.
+
+        Args:
+            key: Cache key (the query command as a tuple)
+            value: Parsed query response
+            tags: Invalidation tags, e.g. "market:<id>" or "proposal:<id>"
+            permanent: Keep the entry across height changes (terminal state)
+        """
+        with self._lock:
+            self._entries[key] = {
+                "value": copy.deepcopy(value),
+                "tags": frozenset(tags),
+                "permanent": permanent,
+            }
+
+    def observe_height(self, height: int) -> None:
+        """
+        Record the latest known block height, dropping entries from older blocks.
+
+        Any change counts, not only advances, so a restarted chain never
+        serves state from its previous life.
+        """
+        with self._lock:
+            if height == self.height:
+                return
+            if self.height is not None:
+                stale = [key for key, entry in self._entries.items() if not entry["permanent"]]
+                for key in stale:
+                    del self._entries[key]
+                logger.debug(f"Height {self.height} -> {height}: dropped {len(stale)} cached queries")
+            self.height = height
+
+    def invalidate_tag(self, tag: str) -> None:
+        """Drop every entry carrying the given tag, including permanent ones."""
+        with self._lock:
+            for key in [key for key, entry in self._entries.items() if tag in entry["tags"]]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """Drop all entries and forget the observed height."""
+        with self._lock:
+            self._entries.clear()
+            self.height = None
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters and current size."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._entries),
+                "height": self.height,
+            }
@@ -0,0 +1,259 @@
+"""
+Native query transports for InjectiveCLI.
+
+A transport answers read-only ``injectived query ...`` commands without
+spawning a process. Responses are normalized to the same dict shapes the
+CLI prints with ``--output json``, so callers cannot tell the difference.
+"""
+
+import logging
+from typing import Dict, List, Any, Optional, Callable, Tuple
+
+import requests
+
+from test_config import config
+
+
+logger = logging.getLogger(__name__)
+
+
+class QueryTransportError(Exception):
+    """Raised when a native query cannot be answered."""
+    pass
+
+
+class QueryTransport:
+    """Base class for native query transports."""
+
+    # Whether broadcast() can submit signed tx bytes
+    supports_broadcast = False
+
+    def supports(self, cmd: List[str]) -> bool:
+        """Return True if this transport can answer the given CLI command."""
+        raise NotImplementedError
+
+    def query(self, cmd: List[str], timeout: Optional[float] = None) -> Dict[str, Any]:
+        """Answer a CLI query command, returning the CLI's JSON shape."""
+        raise NotImplementedError
+
+    def broadcast(self, tx_bytes: str, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """Broadcast base64 signed tx bytes in sync mode, returning the TxResponse."""
+        raise QueryTransportError(f"{type(self).__name__} cannot broadcast txs")
+
+    def close(self) -> None:
+        """Release any held connections."""
+        pass
+
+
+def _normalize_market(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Unwrap FullDerivativeMarket into the CLI's {"market": {...}} shape."""
+    full_market = data.get("market", {})
+    return {"market": full_market.get("market", full_market)}
+
+
+def _normalize_markets(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Keep only perpetual markets, as `query exchange perpetual-markets` does."""
+    markets = [
+        market for market in data.get("markets", [])
+        if market.get("market", {}).get("is_perpetual", True)
+    ]
+    if "pagination" in data:
+        return {"markets": markets, "pagination": data["pagination"]}
+    return {"markets": markets}
+
+
+def _normalize_tx(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Unwrap GetTxResponse into the TxResponse that `query tx` prints."""
+    return data.get("tx_response", data)
+
+
+def _passthrough(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Responses whose REST and CLI shapes already match."""
+    return data
+
+
+# CLI command prefix -> (LCD path template, response normalizer).
+# Each "{}" placeholder consumes one positional argument after the prefix.
+_ROUTES: List[Tuple[Tuple[str, ...], str, Callable[[Dict[str, Any]], Dict[str, Any]]]] = [
+    (("query", "exchange", "perpetual-market-info"),
+     "/injective/exchange/v1beta1/derivative/markets/{}", _normalize_market),
+    (("query", "exchange", "perpetual-markets"),
+     "/injective/exchange/v1beta1/derivative/markets", _normalize_markets),
+    (("query", "gov", "proposal"),
+     "/cosmos/gov/v1/proposals/{}", _passthrough),
+    (("query", "gov", "params"),
+     "/cosmos/gov/v1/params/voting", _passthrough),
+    (("query", "gov", "tally"),
+     "/cosmos/gov/v1/proposals/{}/tally", _passthrough),
+    (("query", "staking", "pool"),
+     "/cosmos/staking/v1beta1/pool", _passthrough),
+    (("query", "tx"),
+     "/cosmos/tx/v1beta1/txs/{}", _normalize_tx),
+    (("query", "auth", "account"),
+     "/cosmos/auth/v1beta1/accounts/{}", _passthrough),
+    (("query", "block"),
+     "/cosmos/base/tendermint/v1beta1/blocks/latest", _passthrough),
+]
+
+
+# CLI pagination and filter flags -> LCD query parameters
+_FLAG_PARAMS = {
+    "--limit": "pagination.limit",
+    "--offset": "pagination.offset",
+    "--page-key": "pagination.key",
+    "--market-ids": "market_ids",
+}
+
+# Repeated LCD parameters, passed as one comma-separated flag value
+_LIST_PARAMS = {"market_ids"}
+
+
+def _split_flags(cmd: List[str]) -> Optional[Tuple[List[str], Dict[str, Any]]]:
+    """Split a command into positional args and LCD query parameters, or None for other flags."""
+    first_flag = next((i for i, arg in enumerate(cmd) if arg.startswith("--")), len(cmd))
+    args, flags = cmd[:first_flag], cmd[first_flag:]
+    if len(flags) % 2:
+        return None
+
+    params = {}
+    for flag, value in zip(flags[::2], flags[1::2]):
+        if flag not in _FLAG_PARAMS:
+            return None
+        param = _FLAG_PARAMS[flag]
+        params[param] = value.split(",") if param in _LIST_PARAMS else value
+    return args, params
+
+
+class RestQueryTransport(QueryTransport):
+    """Query transport backed by the node's LCD (gRPC-gateway) REST endpoint."""
+
+    supports_broadcast = True
+
+    def __init__(self, base_url: str, timeout: Optional[float] = None):
+        """
+        Initialize the REST transport.
+
+        Args:
+            base_url: LCD endpoint, e.g. "http://localhost:10337"
+            timeout: Per-request timeout in seconds (defaults to config.test_timeout)
+        """
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout if timeout is not None else config.test_timeout
+        # A single Session keeps one persistent keep-alive connection to the node
+        self.session = requests.Session()
+
+    def _resolve(self, cmd: List[str]) -> Optional[Tuple[str, Callable, Dict[str, Any]]]:
+        """Map a CLI command to an LCD path, normalizer and query parameters, or None."""
+        split = _split_flags(cmd)
+        if split is None:
+            return None
+        positional, params = split
+
+        for prefix, template, normalizer in _ROUTES:
+            args = positional[len(prefix):]
+            if tuple(positional[:len(prefix)]) == prefix and len(args) == template.count("{}"):
+                return template.format(*args), normalizer, params
+
+        return None
+
+    def supports(self, cmd: List[str]) -> bool:
+        return self._resolve(cmd) is not None
+
+    def query(self, cmd: List[str], timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Answer a CLI query command over REST.
+
+        Args:
+            cmd: CLI command arguments, e.g. ["query", "gov", "proposal", "7"];
+                pagination flags (--limit, --offset, --page-key) and --market-ids
+                become query parameters
+            timeout: Request timeout in seconds (defaults to the transport's timeout)
+
+        Returns:
+            Response in the same shape as the CLI's JSON output
+
+        Raises:
+            QueryTransportError: On unsupported commands, HTTP or decode errors
+        """
+        route = self._resolve(cmd)
+        if route is None:
+            raise QueryTransportError(f"Unsupported query: {' '.join(cmd)}")
+
+        path, normalizer, params = route
+        url = self.base_url + path
+        logger.debug(f"REST query: GET {url} {params or ''}")
+
+        try:
+            response = self.session.get(
+                url, params=params, timeout=timeout if timeout is not None else self.timeout
+            )
+        except requests.RequestException as e:
+            raise QueryTransportError(f"REST query {path} failed: {e}") from e
+
+        if response.status_code != 200:
+            raise QueryTransportError(
+                f"REST query {path} failed with status {response.status_code}: {response.text}"
+            )
+
+        try:
+            return normalizer(response.json())
+        except ValueError as e:
+            raise QueryTransportError(f"REST query {path} returned invalid JSON: {e}") from e
+
+    def broadcast(self, tx_bytes: str, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Broadcast signed tx bytes through the tx service.
+
+        Args:
+            tx_bytes: Base64 protobuf-encoded signed tx
+            timeout: Request timeout in seconds (defaults to the transport's timeout)
+
+        Returns:
+            The TxResponse, as `tx broadcast --broadcast-mode sync` prints it
+
+        Raises:
+            QueryTransportError: On HTTP or decode errors
+        """
+        url = self.base_url + "/cosmos/tx/v1beta1/txs"
+        logger.debug(f"REST broadcast: POST {url}")
+
+        try:
+            response = self.session.post(
+                url, json={"tx_bytes": tx_bytes, "mode": "BROADCAST_MODE_SYNC"},
+                timeout=timeout if timeout is not None else self.timeout,
+            )
+        except requests.RequestException as e:
+            raise QueryTransportError(f"REST broadcast failed: {e}") from e
+
+        if response.status_code != 200:
+            raise QueryTransportError(
+                f"REST broadcast failed with status {response.status_code}: {response.text}"
+            )
+
+        try:
+            return _normalize_tx(response.json())
+        except ValueError as e:
+            raise QueryTransportError(f"REST broadcast returned invalid JSON: {e}") from e
+
+    def close(self) -> None:
+        self.session.close()
+
+
+def create_query_transport(backend: Optional[str] = None) -> Optional[QueryTransport]:
+    """
+    Build the query transport selected by configuration.
+
+    Args:
+        backend: "cli" (spawn injectived, no transport) or "rest"; defaults to config
+
+    Returns:
+        A transport instance, or None when queries should go through the CLI
+    """
+    backend = backend or config.query_backend
+
+    if backend == "cli":
+        return None
+    if backend == "rest":
+        return RestQueryTransport(config.lcd_url)
+
+    raise ValueError(f"Unknown query backend: {backend}")
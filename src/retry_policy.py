@@ -0,0 +1,173 @@
+"""
+Retry policy for injectived commands.
+
+Failures are classified before retrying: deterministic errors (unknown key,
+invalid parameters, "not found") fail on the first attempt, while node-side
+hiccups (connection refused, timeouts, sequence mismatches) are retried with
+full-jitter exponential backoff. A session-wide RetryBudget caps the total
+number of retries so an unhealthy node cannot multiply the suite's runtime.
+"""
+
+import copy
+import logging
+import random
+import re
+import threading
+from typing import Dict, Any, List, Optional, Tuple
+
+from test_config import config
+
+
+logger = logging.getLogger(__name__)
+
+# Checked first: errors worth another attempt even if they also match a permanent pattern
+TRANSIENT_PATTERNS = [
+    r"connection refused",
+    r"connection reset",
+    r"timed out|timeout|deadline exceeded",
+    r"\beof\b",
+    r"code = unavailable",
+    r"too many requests|\b429\b|\b50[234]\b",
+    r"account sequence mismatch|incorrect account sequence",
+    r"mempool is full",
+    r"post failed",
+]
+
+PERMANENT_PATTERNS = [
+    r"key not found|unknown key|no such key",
+    r"not found",
+    r"invalid",
+    r"unknown (command|flag|shorthand flag)",
+    r"insufficient (funds|fee)",
+    r"unauthorized",
+    r"out of gas",
+    r"failed to execute message",
+]
+
+# Exit codes meaning the binary could not run at all (126: not executable, 127: not found)
+PERMANENT_EXIT_CODES = {126, 127}
+
+# Per-command overrides keyed by command prefix; the longest matching prefix wins.
+# A timed-out broadcast may still land, so transactions are not retried on timeout.
+DEFAULT_OVERRIDES: Dict[Tuple[str, ...], Dict[str, Any]] = {
+    ("tx",): {"retry_on_timeout": False},
+}
+
+
+class RetryPolicy:
+    """Decides whether and when a failed command is retried."""
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        base_delay: Optional[float] = None,
+        max_delay: Optional[float] = None,
+        retry_on_timeout: bool = True,
+        transient_patterns: Optional[List[str]] = None,
+        permanent_patterns: Optional[List[str]] = None,
+        overrides: Optional[Dict[Tuple[str, ...], Dict[str, Any]]] = None,
+        rng: Optional[random.Random] = None,
+    ):
+        """
+        Initialize the retry policy.
+
+        Args:
+            max_attempts: Total attempts per command, including the first
+            base_delay: Backoff cap for the first retry in seconds (defaults to config)
+            max_delay: Upper bound for any single backoff in seconds (defaults to config)
+            retry_on_timeout: Whether a command that timed out is retried
+            transient_patterns: Regexes for stderr worth retrying
+            permanent_patterns: Regexes for stderr that will fail again
+            overrides: Per-command-prefix attribute overrides, e.g. {("tx",): {"max_attempts": 1}}
+            rng: Random source for jitter
+        """
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay if base_delay is not None else config.retry_base_delay
+        self.max_delay = max_delay if max_delay is not None else config.retry_max_delay
+        self.retry_on_timeout = retry_on_timeout
+        self.transient_patterns = [re.compile(p, re.IGNORECASE)
+                                   for p in (transient_patterns or TRANSIENT_PATTERNS)]
+        self.permanent_patterns = [re.compile(p, re.IGNORECASE)
+                                   for p in (permanent_patterns or PERMANENT_PATTERNS)]
+        self.overrides = overrides if overrides is not None else dict(DEFAULT_OVERRIDES)
+        self.rng = rng or random.Random()
+
+    def for_command(self, cmd: List[str]) -> "RetryPolicy":
+        """
+        Return the policy for a command, applying the longest matching override.
+
+        Args:
+            cmd: Command arguments, e.g. ["tx", "gov", "vote", "1", "yes"]
+        """
+        matches = [prefix for prefix in self.overrides if tuple(cmd[:len(prefix)]) == prefix]
+        if not matches:
+            return self
+
+        policy = copy.copy(self)
+        for attr, value in self.overrides[max(matches, key=len)].items():
+            setattr(policy, attr, value)
+        return policy
+
+    def is_transient(self, stderr: str, returncode: Optional[int] = None) -> bool:
+        """
+        Classify a failed command.
+
+        Args:
+            stderr: Error output of the command
+            returncode: Process exit code
+
+        Returns:
+            True if another attempt may succeed
+        """
+        if returncode in PERMANENT_EXIT_CODES:
+            return False
+        if any(p.search(stderr) for p in self.transient_patterns):
+            return True
+        if any(p.search(stderr) for p in self.permanent_patterns):
+            return False
+        # Unrecognized failures keep the historical behaviour and are retried
+        return True
+
+    def backoff(self, attempt: int) -> float:
+        """
+        Full-jitter backoff before the next attempt.
+
+        Args:
+            attempt: Zero-based index of the attempt that just failed
+
+        Returns:
+            Seconds to sleep, uniform in [0, min(max_delay, base_delay * 2**attempt)]
+        """
+        return self.rng.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+
+
+class RetryBudget:
+    """Session-wide cap on the number of retries across all commands."""
+
+    def __init__(self, max_retries: Optional[int] = None):
+        """
+        Initialize the budget.
+
+        Args:
+            max_retries: Retries allowed for the session (defaults to config.retry_budget)
+        """
+        self.max_retries = max_retries if max_retries is not None else config.retry_budget
+        self.spent = 0
+        self._lock = threading.Lock()
+
+    def consume(self) -> bool:
+        """Take one retry from the budget, returning False if it is exhausted."""
+        with self._lock:
+            if self.spent >= self.max_retries:
+                return False
+            self.spent += 1
+            return True
+
+    @property
+    def remaining(self) -> int:
+        with self._lock:
+            return max(self.max_retries - self.spent, 0)
+
+
+# Global retry budget shared by all CLI clients in the session
+retry_budget = RetryBudget()
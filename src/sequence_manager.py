@@ -0,0 +1,103 @@
+"""
+Per-key account sequence management for pipelined transaction broadcasting.
+
+Without it, injectived looks up the account sequence before signing each
+tx, so a key can only have one tx in flight until the previous one is
+included. SequenceManager fetches the account number and sequence once,
+assigns sequences locally and resyncs when the node reports a mismatch,
+so many txs from one key can be broadcast into the same block.
+"""
+
+import logging
+import re
+import threading
+from contextlib import contextmanager
+from typing import Dict, Callable, Iterator, Optional, Tuple
+
+
+logger = logging.getLogger(__name__)
+
+# sdkerrors.ErrWrongSequence
+SEQUENCE_MISMATCH_CODE = 32
+
+_MISMATCH_PATTERN = re.compile(r"account sequence mismatch, expected (\d+), got (\d+)")
+
+
+def parse_expected_sequence(error: str) -> Optional[int]:
+    """Return the sequence the node expected from a mismatch error, if it is one."""
+    match = _MISMATCH_PATTERN.search(error)
+    return int(match.group(1)) if match else None
+
+
+class AccountSequence:
+    """Locally tracked account number and next sequence for one key."""
+
+    def __init__(self, key_name: str):
+        self.key_name = key_name
+        self.account_number: Optional[int] = None
+        self.sequence: Optional[int] = None
+        self.lock = threading.Lock()
+
+    @property
+    def synced(self) -> bool:
+        return self.sequence is not None
+
+    def advance(self) -> None:
+        """Mark the current sequence as used by an accepted tx."""
+        self.sequence += 1
+
+    def resync(self, expected: Optional[int] = None) -> None:
+        """
+        Correct the local sequence after a mismatch.
+
+        Args:
+            expected: Sequence reported by the node; None forces a fresh query
+        """
+        logger.info(f"Resyncing sequence for {self.key_name}: {self.sequence} -> {expected}")
+        self.sequence = expected
+
+
+class SequenceManager:
+    """Assigns account sequences locally, one lock per key."""
+
+    def __init__(self, fetch_account: Callable[[str], Tuple[int, int]]):
+        """
+        Initialize the manager.
+
+        Args:
+            fetch_account: Returns (account_number, sequence) for a key name from the chain
+        """
+        self.fetch_account = fetch_account
+        self._accounts: Dict[str, AccountSequence] = {}
+        self._lock = threading.Lock()
+
+    def _get(self, key_name: str) -> AccountSequence:
+        with self._lock:
+            if key_name not in self._accounts:
+                self._accounts[key_name] = AccountSequence(key_name)
+            return self._accounts[key_name]
+
+    @contextmanager
+    def account(self, key_name: str) -> Iterator[AccountSequence]:
+        """
+        Hold a key's sequence for the duration of one broadcast.
+
+        Broadcasts from the same key are serialized (sync broadcast only waits
+        for CheckTx, so this is short); different keys proceed in parallel.
+
+        Yields:
+            The key's AccountSequence, synced with the chain if it was not already
+        """
+        account = self._get(key_name)
+        with account.lock:
+            if not account.synced:
+                account.account_number, account.sequence = self.fetch_account(key_name)
+                logger.info(f"Synced {key_name}: account {account.account_number}, "
+                            f"sequence {account.sequence}")
+            yield account
+
+    def invalidate(self, key_name: str) -> None:
+        """Forget a key's sequence, e.g. after it signed a tx outside the manager."""
+        account = self._get(key_name)
+        with account.lock:
+            account.resync(None)
@@ -0,0 +1,124 @@
+"""
+File-locked store of results shared by every process of a test session.
+
+Under pytest-xdist each worker would otherwise build the same session
+fixtures and send the same chain queries as every other worker. The xdist
+controller creates a session directory (SHARED_STORE_DIR) that the workers
+inherit; a value computed by one process is written there and read by the
+rest. Computing is single-flight across processes: the first caller takes
+an exclusive lock on the key and computes, while other callers block on the
+lock and then read its result instead of computing again.
+
+Each value carries a scope, e.g. the block height a query was answered at;
+a value stored under a different scope is recomputed.
+"""
+
+import fcntl
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from typing import Any, Callable, Optional
+
+from test_config import config
+
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+
+class SharedStore:
+    """Cross-process, single-flight key -> JSON value store in a directory."""
+
+    def __init__(self, directory: Optional[str] = None):
+        """
+        Initialize the store; the directory must already exist.
+
+        Args:
+            directory: Session directory shared by all processes; "" disables
+                sharing, so every call computes (defaults to config.shared_store_dir)
+        """
+        self.directory = directory if directory is not None else config.shared_store_dir
+        self.hits = 0
+        self.computes = 0
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.directory)
+
+    def _path(self, key: str) -> str:
+        digest = hashlib.sha256(key.encode()).hexdigest()[:32]
+        return os.path.join(self.directory, digest)
+
+    def _read(self, path: str, scope: Optional[str]) -> Any:
+        try:
+            with open(path + ".json") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return _MISSING
+        return entry["value"] if entry.get("scope") == scope else _MISSING
+
+    def _write(self, path: str, scope: Optional[str], value: Any) -> None:
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump({"scope": scope, "value": value}, f)
+        # Readers never see a partly written value
+        os.replace(tmp_path, path + ".json")
+
+    def get(self, key: str, scope: Optional[str] = None) -> Any:
+        """
+        Look up a value without computing it.
+
+        Returns:
+            The stored value, or None if it is missing or from another scope
+        """
+        if not self.enabled:
+            return None
+        value = self._read(self._path(key), scope)
+        return None if value is _MISSING else value
+
+    def get_or_compute(self, key: str, compute: Callable[[], Any], scope: Optional[str] = None) -> Any:
+        """
+        Return the value stored for key and scope, computing it at most once across processes.
+
+        Args:
+            key: Identity of the value, e.g. "fixture:injective_node"
+            compute: Zero-argument callable producing a JSON-serializable value
+            scope: Validity scope, e.g. a block height; a value from another scope is stale
+
+        Returns:
+            The stored or freshly computed value
+
+        Raises:
+            Whatever compute raised; nothing is stored, so the next caller computes again
+        """
+        if not self.enabled:
+            return compute()
+
+        path = self._path(key)
+        value = self._read(path, scope)
+        if value is _MISSING:
+            with open(path + ".lock", "w") as lock_file:
+                # flock conflicts across processes and across threads with their own open()
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+                value = self._read(path, scope)
+                if value is _MISSING:
+                    value = compute()
+                    self._write(path, scope, value)
+                    with self._lock:
+                        self.computes += 1
+                    logger.debug(f"Computed shared {key} (scope {scope})")
+                    return value
+
+        with self._lock:
+            self.hits += 1
+        return value
+
+    def stats(self):
+        """Return hit/compute counters."""
+        with self._lock:
+            return {"hits": self.hits, "computes": self.computes, "directory": self.directory}
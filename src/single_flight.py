@@ -0,0 +1,83 @@
+"""
+Single-flight coalescing of identical in-flight calls.
+
+When several threads ask for the same key at the same moment, only the
+first (the leader) executes; the others block until it finishes and share
+its result or exception.
+"""
+
+import copy
+import threading
+from typing import Dict, Any, Callable, Hashable, Optional
+
+
+class _Call:
+    """One in-flight execution that followers wait on."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """Coalesces concurrent calls with the same key into one execution."""
+
+    def __init__(self):
+        """Initialize with no calls in flight."""
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self.executions = 0
+        self.shared = 0
+
+    def do(self, key: Hashable, fn: Callable[[], Any], timeout: Optional[float] = None) -> Any:
+        """
+        Run fn once for all concurrent callers using the same key.
+
+        Args:
+            key: Identity of the call, e.g. the command as a tuple
+            fn: Zero-argument callable performing the work
+            timeout: Seconds a follower waits for the leader (None waits indefinitely)
+
+        Returns:
+            fn's result; the leader keeps fn's own object and every follower
+            gets a deep copy of a private snapshot, so callers never share state
+
+        Raises:
+            TimeoutError: If a follower's timeout passes before the leader finishes
+            Whatever fn raised, in the leader and every follower
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self._calls[key] = call
+                self.executions += 1
+            else:
+                self.shared += 1
+
+        if not leader:
+            if not call.done.wait(timeout):
+                raise TimeoutError(f"Shared call {key!r} still running after {timeout:.1f}s")
+            if call.error is not None:
+                raise call.error
+            return copy.deepcopy(call.result)
+
+        try:
+            result = fn()
+            # Snapshot before followers are released, so the leader's caller may mutate its copy
+            call.result = copy.deepcopy(result)
+            return result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    def stats(self) -> Dict[str, int]:
+        """Return how many executions ran and how many callers piggybacked."""
+        with self._lock:
+            return {"executions": self.executions, "shared": self.shared}
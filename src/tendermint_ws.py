@@ -0,0 +1,290 @@
+"""
+Minimal websocket client for the Tendermint/CometBFT RPC event stream.
+
+Only what event subscriptions need is implemented: the opening handshake,
+text messages (reassembled from fragments), ping/pong and close (RFC 6455). The frame helpers are shared
+with the mock node's server side.
+"""
+
+import base64
+import hashlib
+import json
+import logging
+import os
+import socket
+import struct
+from typing import Dict, Any, Optional, Tuple, BinaryIO
+from urllib.parse import urlparse
+
+
+logger = logging.getLogger(__name__)
+
+WS_GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+
+OP_CONTINUATION = 0x0
+OP_TEXT = 0x1
+OP_CLOSE = 0x8
+OP_PING = 0x9
+OP_PONG = 0xA
+
+
+class WebSocketError(Exception):
+    """Raised on handshake or protocol failures."""
+    pass
+
+
+def accept_key(key: str) -> str:
+    """Compute the Sec-WebSocket-Accept value for a client key."""
+    digest = hashlib.sha1((key + WS_GUID).encode()).digest()
+    return base64.b64encode(digest).decode()
+
+
+def encode_frame(payload: bytes, opcode: int = OP_TEXT, mask: bool = True, fin: bool = True) -> bytes:
+    """
+    Encode a single frame.
+
+    Args:
+        payload: Frame payload
+        opcode: Frame opcode
+        mask: Clients must mask frames, servers must not
+        fin: False for every fragment of a message but the last
+    """
+    header = bytes([(0x80 if fin else 0) | opcode])
+    mask_bit = 0x80 if mask else 0
+    length = len(payload)
+
+    if length < 126:
+        header += bytes([mask_bit | length])
+    elif length < 65536:
+        header += bytes([mask_bit | 126]) + struct.pack("!H", length)
+    else:
+        header += bytes([mask_bit | 127]) + struct.pack("!Q", length)
+
+    if not mask:
+        return header + payload
+
+    masking_key = os.urandom(4)
+    masked = bytes(b ^ masking_key[i % 4] for i, b in enumerate(payload))
+    return header + masking_key + masked
+
+
+def _read_exact(stream: BinaryIO, count: int) -> bytes:
+    data = stream.read(count)
+    if data is None or len(data) < count:
+        raise WebSocketError("Connection closed mid-frame")
+    return data
+
+
+def read_frame(stream: BinaryIO) -> Tuple[bool, int, bytes]:
+    """
+    Read one frame from a buffered binary stream.
+
+    Returns:
+        (FIN bit, opcode, unmasked payload)
+    """
+    first, second = _read_exact(stream, 2)
+    fin = bool(first & 0x80)
+    opcode = first & 0x0F
+    length = second & 0x7F
+
+    if length == 126:
+        length = struct.unpack("!H", _read_exact(stream, 2))[0]
+    elif length == 127:
+        length = struct.unpack("!Q", _read_exact(stream, 8))[0]
+
+    masking_key = _read_exact(stream, 4) if second & 0x80 else None
+    payload = _read_exact(stream, length)
+
+    if masking_key:
+        payload = bytes(b ^ masking_key[i % 4] for i, b in enumerate(payload))
+
+    return fin, opcode, payload
+
+
+class _SocketReader:
+    """Buffered socket reader whose reads can be rewound after a timeout."""
+
+    def __init__(self, sock: socket.socket):
+        self._sock = sock
+        self._buffer = bytearray()
+        self._pos = 0
+
+    def _fill(self, predicate) -> None:
+        while not predicate():
+            chunk = self._sock.recv(65536)
+            if not chunk:
+                raise WebSocketError("Connection closed by server")
+            self._buffer += chunk
+
+    def read(self, count: int) -> bytes:
+        self._fill(lambda: len(self._buffer) - self._pos >= count)
+        data = bytes(self._buffer[self._pos:self._pos + count])
+        self._pos += count
+        return data
+
+    def readline(self) -> bytes:
+        self._fill(lambda: self._buffer.find(b"\n", self._pos) >= 0)
+        end = self._buffer.find(b"\n", self._pos) + 1
+        line = bytes(self._buffer[self._pos:end])
+        self._pos = end
+        return line
+
+    def mark(self) -> int:
+        return self._pos
+
+    def rewind(self, mark: int) -> None:
+        self._pos = mark
+
+    def compact(self) -> None:
+        del self._buffer[:self._pos]
+        self._pos = 0
+
+
+class TendermintWebSocket:
+    """Blocking websocket connection to a node's /websocket RPC endpoint."""
+
+    def __init__(self, rpc_url: str, timeout: float = 10.0):
+        """
+        Initialize the connection (not yet opened).
+
+        Args:
+            rpc_url: RPC base URL, e.g. "http://localhost:26657"
+            timeout: Socket timeout for connect and each read, in seconds
+        """
+        parsed = urlparse(rpc_url)
+        self.host = parsed.hostname or "localhost"
+        self.port = parsed.port or 26657
+        self.timeout = timeout
+        self._sock = None
+        self._reader = None
+        self._next_id = 1
+        # Opcode and payload so far of a fragmented message still arriving
+        self._message: Optional[Tuple[int, bytearray]] = None
+
+    def connect(self) -> None:
+        """Open the TCP connection and perform the websocket handshake."""
+        self._sock = socket.create_connection((self.host, self.port), timeout=self.timeout)
+        key = base64.b64encode(os.urandom(16)).decode()
+        request = (
+            f"GET /websocket HTTP/1.1\r\n"
+            f"Host: {self.host}:{self.port}\r\n"
+            f"Upgrade: websocket\r\n"
+            f"Connection: Upgrade\r\n"
+            f"Sec-WebSocket-Key: {key}\r\n"
+            f"Sec-WebSocket-Version: 13\r\n\r\n"
+        )
+        self._sock.sendall(request.encode())
+        self._reader = _SocketReader(self._sock)
+        self._message = None
+
+        status_line = self._reader.readline().decode(errors="replace")
+        headers = {}
+        while True:
+            line = self._reader.readline().decode(errors="replace").strip()
+            if not line:
+                break
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        if " 101 " not in status_line:
+            raise WebSocketError(f"Websocket handshake rejected: {status_line.strip()}")
+        if headers.get("sec-websocket-accept") != accept_key(key):
+            raise WebSocketError("Websocket handshake returned a bad accept key")
+        self._reader.compact()
+
+    def set_timeout(self, timeout: float) -> None:
+        """Change the timeout for subsequent reads."""
+        self._sock.settimeout(timeout)
+
+    def send_json(self, message: Dict[str, Any]) -> None:
+        """Send a JSON-RPC message as a text frame."""
+        self._sock.sendall(encode_frame(json.dumps(message).encode()))
+
+    def subscribe(self, query: str) -> None:
+        """
+        Subscribe to an event query, e.g. "tm.event='NewBlock'".
+
+        Raises:
+            WebSocketError: If the node rejects the subscription
+        """
+        request_id = self._next_id
+        self._next_id += 1
+        self.send_json({
+            "jsonrpc": "2.0",
+            "method": "subscribe",
+            "id": request_id,
+            "params": {"query": query},
+        })
+
+        while True:
+            message = self.receive()
+            if message.get("id") == request_id:
+                if "error" in message:
+                    raise WebSocketError(f"Subscription {query!r} rejected: {message['error']}")
+                return
+
+    def receive(self) -> Dict[str, Any]:
+        """
+        Return the next JSON message, answering pings transparently.
+
+        A message split into fragments is reassembled; control frames may
+        arrive between its fragments.
+
+        Raises:
+            WebSocketError: When the server closes the connection or breaks
+                the fragmentation rules
+            socket.timeout: When no message arrives within the timeout; a
+                partially received frame or message is kept, so receive can
+                be retried
+        """
+        while True:
+            mark = self._reader.mark()
+            try:
+                fin, opcode, payload = read_frame(self._reader)
+            except socket.timeout:
+                self._reader.rewind(mark)
+                raise
+            self._reader.compact()
+
+            if opcode == OP_PING:
+                self._sock.sendall(encode_frame(payload, OP_PONG))
+                continue
+            if opcode == OP_CLOSE:
+                raise WebSocketError("Websocket closed by server")
+            if opcode == OP_PONG:
+                continue
+
+            if opcode == OP_CONTINUATION:
+                if self._message is None:
+                    raise WebSocketError("Continuation frame outside a fragmented message")
+                self._message[1].extend(payload)
+            elif self._message is not None:
+                raise WebSocketError("New message started before the fragmented one finished")
+            else:
+                self._message = (opcode, bytearray(payload))
+
+            if not fin:
+                continue
+            opcode, payload = self._message
+            self._message = None
+            if opcode == OP_TEXT:
+                return json.loads(payload)
+
+    def close(self) -> None:
+        """Send a close frame and release the socket."""
+        if self._sock is None:
+            return
+        try:
+            self._sock.sendall(encode_frame(b"", OP_CLOSE))
+        except OSError:
+            pass
+        finally:
+            self._sock.close()
+            self._sock = None
+
+    def __enter__(self) -> "TendermintWebSocket":
+        self.connect()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
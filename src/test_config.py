@@ -3,11 +3,20 @@ Test configuration module for Injective Chain RMR tests.
 """
 
 import os
-from typing import Dict, Any, Optional
+import tempfile
+from typing import Dict, List, Any, Optional
 from pathlib import Path
 from dotenv import load_dotenv
 
 
+def _env_bool(name: str, default: bool) -> bool:
+    """Read a boolean setting; "1", "true" and "yes" (any case) are true."""
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ("1", "true", "yes")
+
+
 class TestConfig:
     """Central configuration management for RMR tests."""
     
@@ -34,15 +43,61 @@ class TestConfig:
     def grpc_url(self) -> str:
         return os.getenv("INJECTIVE_GRPC_URL", "localhost:9900")
     
+    @property
+    def lcd_url(self) -> str:
+        return os.getenv("INJECTIVE_LCD_URL", "http://localhost:10337")
+    
+    @property
+    def query_backend(self) -> str:
+        """Query backend: "cli" spawns injectived, "rest" queries the LCD directly."""
+        return os.getenv("QUERY_BACKEND", "cli")
+    
     # Test Configuration
     @property
     def keyring_backend(self) -> str:
         return os.getenv("KEYRING_BACKEND", "test")
     
+    @property
+    def keyring_dir(self) -> str:
+        """Directory holding the keyring, watched to invalidate cached addresses."""
+        default = os.path.join("~", ".injectived", f"keyring-{self.keyring_backend}")
+        return os.path.expanduser(os.getenv("KEYRING_DIR", default))
+    
+    @property
+    def address_cache_file(self) -> str:
+        """Key address cache shared by all test processes; empty disables it."""
+        default = os.path.join(tempfile.gettempdir(), "injective_address_cache.json")
+        return os.getenv("ADDRESS_CACHE_FILE", default)
+    
     @property
     def test_timeout(self) -> int:
         return int(os.getenv("TEST_TIMEOUT", "300"))
     
+    @property
+    def max_concurrency(self) -> int:
+        """Maximum number of CLI calls the async client runs at once."""
+        return int(os.getenv("MAX_CONCURRENCY", "8"))
+    
+    @property
+    def query_cache(self) -> bool:
+        """Cache market/proposal queries until the block height changes."""
+        return _env_bool("QUERY_CACHE", True)
+    
+    @property
+    def cache_height_check_interval(self) -> float:
+        """Seconds between block height checks that validate cached queries."""
+        return float(os.getenv("CACHE_HEIGHT_CHECK_INTERVAL", "1.0"))
+    
+    @property
+    def block_poll_interval(self) -> float:
+        """Seconds between /status polls when no NewBlock subscription is available."""
+        return float(os.getenv("BLOCK_POLL_INTERVAL", "0.5"))
+    
+    @property
+    def tx_poll_interval(self) -> float:
+        """Seconds between lookups of transactions still awaiting inclusion."""
+        return float(os.getenv("TX_POLL_INTERVAL", "1.0"))
+    
     @property
     def log_level(self) -> str:
         return os.getenv("LOG_LEVEL", "INFO")
@@ -56,10 +111,126 @@ class TestConfig:
     def validator_key(self) -> str:
         return os.getenv("VALIDATOR_KEY", "val")
     
+    @property
+    def voter_keys(self) -> List[str]:
+        """Keys that vote on governance proposals; defaults to the validator key alone."""
+        keys = [key.strip() for key in os.getenv("VOTER_KEYS", "").split(",") if key.strip()]
+        return keys or [self.validator_key]
+    
+    @property
+    def retry_base_delay(self) -> float:
+        """Backoff cap in seconds for the first retry of a failed command."""
+        return float(os.getenv("RETRY_BASE_DELAY", "1.0"))
+    
+    @property
+    def retry_max_delay(self) -> float:
+        """Upper bound in seconds for any single retry backoff."""
+        return float(os.getenv("RETRY_MAX_DELAY", "8.0"))
+    
+    @property
+    def retry_budget(self) -> int:
+        """Total retries allowed across all commands in a test session."""
+        return int(os.getenv("RETRY_BUDGET", "30"))
+    
+    @property
+    def circuit_failure_threshold(self) -> int:
+        """Consecutive connection/timeout failures before the node circuit opens."""
+        return int(os.getenv("CIRCUIT_FAILURE_THRESHOLD", "3"))
+    
+    @property
+    def circuit_reset_timeout(self) -> float:
+        """Seconds the node circuit stays open before a recovery probe."""
+        return float(os.getenv("CIRCUIT_RESET_TIMEOUT", "30"))
+    
+    @property
+    def pipeline_txs(self) -> bool:
+        """Assign account sequences locally so one key can have many txs per block."""
+        return _env_bool("PIPELINE_TXS", False)
+    
+    @property
+    def batch_max_messages(self) -> int:
+        """Messages packed into one multi-message tx or proposal."""
+        return int(os.getenv("BATCH_MAX_MESSAGES", "25"))
+    
+    @property
+    def batch_max_gas(self) -> int:
+        """Gas limit for one multi-message tx."""
+        return int(os.getenv("BATCH_MAX_GAS", "5000000"))
+    
+    @property
+    def batch_gas_per_message(self) -> int:
+        """Gas budgeted per message in a multi-message tx."""
+        return int(os.getenv("BATCH_GAS_PER_MESSAGE", "200000"))
+    
+    @property
+    def batch_signing(self) -> bool:
+        """Generate txs separately, sign them in batches and broadcast the signed txs."""
+        return _env_bool("BATCH_SIGNING", False)
+    
+    @property
+    def gas_estimation(self) -> bool:
+        """Set tx gas limits from cached measurements instead of injectived's default (opt-in)."""
+        return _env_bool("GAS_ESTIMATION", False)
+    
+    @property
+    def gas_adjustment(self) -> float:
+        """Multiplier applied to simulated or measured gas."""
+        return float(os.getenv("GAS_ADJUSTMENT", "1.3"))
+    
+    @property
+    def gas_samples(self) -> int:
+        """Gas measurements per message type before simulation is skipped."""
+        return int(os.getenv("GAS_SAMPLES", "3"))
+    
+    @property
+    def gas_prices(self) -> str:
+        """Gas price for tx fees, e.g. "500000000inj"; empty leaves fees unset."""
+        return os.getenv("GAS_PRICES", "")
+    
+    @property
+    def markets_page_limit(self) -> int:
+        """Markets fetched per page when listing markets."""
+        return int(os.getenv("MARKETS_PAGE_LIMIT", "100"))
+    
+    @property
+    def market_pool_size(self) -> int:
+        """Markets the clean_test_market pool launches per batch (per xdist worker)."""
+        return int(os.getenv("MARKET_POOL_SIZE", "4"))
+    
+    @property
+    def shared_store_dir(self) -> str:
+        """Session directory sharing fixture and query results across xdist workers; empty disables."""
+        return os.getenv("SHARED_STORE_DIR", "")
+    
+    @property
+    def clock(self) -> str:
+        """Clock for sleeps and timeouts: "system", "virtual", or "auto" (virtual against the mock CLI)."""
+        return os.getenv("CLOCK", "auto")
+    
     @property
     def admin_key(self) -> str:
         return os.getenv("ADMIN_KEY", "testcandidate")
     
+    @property
+    def admin_granter(self) -> str:
+        """Exchange admin whose rights admin_key exercises through authz; empty if admin_key is the admin."""
+        return os.getenv("ADMIN_GRANTER", "")
+    
+    @property
+    def worker_accounts(self) -> bool:
+        """Give each pytest-xdist worker its own funded signer."""
+        return _env_bool("WORKER_ACCOUNTS", True)
+    
+    @property
+    def worker_key_prefix(self) -> str:
+        """Keyring name prefix of the per-worker keys."""
+        return os.getenv("WORKER_KEY_PREFIX", "worker")
+    
+    @property
+    def worker_fund_amount(self) -> str:
+        """Amount each worker key is funded with."""
+        return os.getenv("WORKER_FUND_AMOUNT", "100000000000000000000inj")
+    
     # RMR Test Constants
     @property
     def rmr_test_values(self) -> Dict[str, float]:
@@ -0,0 +1,133 @@
+"""
+Multi-message transactions and proposals.
+
+Helpers for packing many messages into one tx (or one governance proposal)
+within message-count, gas and size caps, and for mapping a tx's single
+result back to each message in it.
+"""
+
+import json
+import re
+from typing import Dict, List, Any, Callable, Optional, Sequence, TypeVar
+
+from test_config import config
+
+
+T = TypeVar("T")
+
+# CometBFT's default mempool max_tx_bytes
+MAX_TX_BYTES = 1048576
+
+_FAILED_INDEX_PATTERN = re.compile(r"message index: (\d+)")
+
+
+def plan_batches(
+    items: Sequence[T],
+    max_messages: Optional[int] = None,
+    max_gas: Optional[int] = None,
+    gas_per_message: Optional[int] = None,
+    max_bytes: int = MAX_TX_BYTES,
+    size_of: Callable[[T], int] = lambda item: len(json.dumps(item)),
+) -> List[List[T]]:
+    """
+    Split messages into batches that each fit in one tx.
+
+    Args:
+        items: Messages (or anything standing for one message) in order
+        max_messages: Messages per batch (defaults to config.batch_max_messages)
+        max_gas: Gas limit per batch (defaults to config.batch_max_gas)
+        gas_per_message: Gas budgeted per message (defaults to config.batch_gas_per_message)
+        max_bytes: Encoded size limit per batch
+        size_of: Approximate encoded size of one item
+
+    Returns:
+        Batches in the original order
+    """
+    max_messages = max_messages or config.batch_max_messages
+    max_gas = max_gas or config.batch_max_gas
+    gas_per_message = gas_per_message or config.batch_gas_per_message
+    per_batch = max(min(max_messages, max_gas // gas_per_message), 1)
+
+    batches: List[List[T]] = []
+    current: List[T] = []
+    current_bytes = 0
+
+    for item in items:
+        item_bytes = size_of(item)
+        if current and (len(current) >= per_batch or current_bytes + item_bytes > max_bytes):
+            batches.append(current)
+            current, current_bytes = [], 0
+        current.append(item)
+        current_bytes += item_bytes
+
+    if current:
+        batches.append(current)
+    return batches
+
+
+def merge_unsigned_txs(txs: List[Dict[str, Any]], gas_limit: int) -> Dict[str, Any]:
+    """
+    Combine unsigned single-message txs (from --generate-only) into one tx.
+
+    Args:
+        txs: Unsigned txs from the same signer
+        gas_limit: Gas limit for the combined tx
+
+    Returns:
+        Unsigned tx carrying every message in order, with summed fees
+    """
+    merged = json.loads(json.dumps(txs[0]))
+    merged["body"]["messages"] = [msg for tx in txs for msg in tx["body"]["messages"]]
+
+    fees: Dict[str, int] = {}
+    for tx in txs:
+        for coin in tx.get("auth_info", {}).get("fee", {}).get("amount", []):
+            fees[coin["denom"]] = fees.get(coin["denom"], 0) + int(coin["amount"])
+
+    fee = merged.setdefault("auth_info", {}).setdefault("fee", {})
+    fee["amount"] = [{"denom": denom, "amount": str(amount)} for denom, amount in fees.items()]
+    fee["gas_limit"] = str(gas_limit)
+    return merged
+
+
+def failed_message_index(raw_log: str) -> Optional[int]:
+    """Return the index of the message that failed a tx, if the log names one."""
+    match = _FAILED_INDEX_PATTERN.search(raw_log or "")
+    return int(match.group(1)) if match else None
+
+
+def message_results(keys: List[str], tx_result: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """
+    Map one tx's result back to each of its messages.
+
+    Messages in a tx succeed or fail together; when the tx fails, the message
+    named in the log gets the error and the others are reported as reverted.
+
+    Args:
+        keys: Identifier for each message, in message order (e.g. market IDs)
+        tx_result: Included (or rejected) tx result
+
+    Returns:
+        Mapping of each key to {"success", "txhash", "height", "code", "error"}
+    """
+    code = int(tx_result.get("code", 0))
+    raw_log = tx_result.get("raw_log", "")
+    failed_index = failed_message_index(raw_log) if code != 0 else None
+
+    results = {}
+    for index, key in enumerate(keys):
+        if code == 0:
+            error = None
+        elif failed_index is None or failed_index == index:
+            error = raw_log or f"tx failed with code {code}"
+        else:
+            error = f"reverted: message {failed_index} in the same tx failed"
+
+        results[key] = {
+            "success": code == 0,
+            "txhash": tx_result.get("txhash"),
+            "height": tx_result.get("height"),
+            "code": code,
+            "error": error,
+        }
+    return results
@@ -0,0 +1,207 @@
+"""
+Generate/sign/broadcast pipeline for transactions.
+
+Running `injectived tx ...` once per tx opens the keyring, signs and
+broadcasts inside one process, so a burst of votes or updates is paid for
+tx by tx. TxPipeline splits that into stages: unsigned txs are generated
+(--generate-only) in the submitting thread, a signer thread signs whatever
+has queued up for a key in a single `tx sign-batch` invocation, and a
+broadcaster thread sends the signed txs in sequence order. The signer works
+on the next batch while the previous one is being broadcast and included.
+"""
+
+import logging
+import queue
+import threading
+from concurrent.futures import Future
+from typing import Dict, List, Any, Optional
+
+from test_config import config
+from sequence_manager import SequenceManager, SEQUENCE_MISMATCH_CODE, parse_expected_sequence
+
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+
+
+class TxPipelineError(Exception):
+    """Raised when the pipeline cannot get a tx accepted."""
+    pass
+
+
+class PendingTx:
+    """An unsigned tx waiting for its signature and broadcast."""
+
+    def __init__(self, unsigned: Dict[str, Any], from_key: str):
+        self.unsigned = unsigned
+        self.from_key = from_key
+        self.future: Future = Future()
+        self.attempts = 0
+
+
+class TxPipeline:
+    """Batches signing per key and broadcasts signed txs in order."""
+
+    def __init__(
+        self,
+        cli: Any,
+        sequence_manager: Optional[SequenceManager] = None,
+        max_batch: Optional[int] = None,
+        max_attempts: int = 3,
+    ):
+        """
+        Initialize the pipeline; its threads start with the first submit.
+
+        Args:
+            cli: InjectiveCLI used to generate, sign, encode and broadcast
+            sequence_manager: Account sequences for offline signing; defaults to
+                the CLI's manager, or a new one querying through the CLI
+            max_batch: Txs signed per invocation (defaults to config.batch_max_messages)
+            max_attempts: Signing attempts per tx when its sequence turns out stale
+        """
+        self.cli = cli
+        self.sequence_manager = (sequence_manager or cli.sequence_manager
+                                 or SequenceManager(cli.query_account_sequence))
+        self.max_batch = max_batch or config.batch_max_messages
+        self.max_attempts = max_attempts
+        self._pending: "queue.Queue" = queue.Queue()
+        self._signed: "queue.Queue" = queue.Queue()
+        self._threads: List[threading.Thread] = []
+        self._lock = threading.Lock()
+
+    def _start(self) -> None:
+        with self._lock:
+            if self._threads:
+                return
+            for target, name in ((self._sign_loop, "tx-signer"), (self._broadcast_loop, "tx-broadcaster")):
+                thread = threading.Thread(target=target, name=name, daemon=True)
+                thread.start()
+                self._threads.append(thread)
+
+    def submit(self, cmd: List[str], from_key: str) -> Future:
+        """
+        Generate an unsigned tx and queue it for signing and broadcast.
+
+        Args:
+            cmd: Tx command arguments including --from, e.g. ["tx", "gov", "vote", "7", "yes", "--from", "val"]
+            from_key: Signing key name
+
+        Returns:
+            Future resolving to the broadcast result
+
+        Raises:
+            InjectiveCLIError: If the tx cannot be generated
+        """
+        pending = PendingTx(self.cli.generate_tx(cmd), from_key)
+        self._start()
+        self._pending.put(pending)
+        return pending.future
+
+    def close(self) -> None:
+        """Stop the pipeline threads after the queued txs are handled."""
+        with self._lock:
+            threads, self._threads = self._threads, []
+        if threads:
+            self._pending.put(_STOP)
+            for thread in threads:
+                thread.join()
+
+    def _take_batch(self) -> Optional[List[PendingTx]]:
+        """Block for one tx, then take whatever else is already queued."""
+        first = self._pending.get()
+        if first is _STOP:
+            return None
+
+        batch = [first]
+        while len(batch) < self.max_batch:
+            try:
+                item = self._pending.get_nowait()
+            except queue.Empty:
+                break
+            if item is _STOP:
+                # Handle what was taken, then stop
+                self._pending.put(_STOP)
+                break
+            batch.append(item)
+        return batch
+
+    def _sign_loop(self) -> None:
+        while True:
+            batch = self._take_batch()
+            if batch is None:
+                self._signed.put(_STOP)
+                return
+
+            by_key: Dict[str, List[PendingTx]] = {}
+            for pending in batch:
+                by_key.setdefault(pending.from_key, []).append(pending)
+
+            for from_key, items in by_key.items():
+                try:
+                    payloads = self._sign(from_key, items)
+                except Exception as e:
+                    for pending in items:
+                        pending.future.set_exception(e)
+                    continue
+                self._signed.put((from_key, items, payloads))
+
+    def _sign(self, from_key: str, items: List[PendingTx]) -> List[Any]:
+        """Sign a key's txs with consecutive sequences in one invocation."""
+        with self.sequence_manager.account(from_key) as account:
+            signed = self.cli.sign_txs(
+                [pending.unsigned for pending in items], from_key,
+                account_number=account.account_number, sequence=account.sequence,
+            )
+            # Assume acceptance; the broadcaster resyncs if one is rejected
+            account.sequence += len(items)
+
+        logger.info(f"Signed {len(items)} tx(s) for {from_key} in one invocation")
+        if self.cli.native_broadcast:
+            return self.cli.encode_txs(signed)
+        return signed
+
+    def _broadcast_loop(self) -> None:
+        while True:
+            item = self._signed.get()
+            if item is _STOP:
+                return
+
+            from_key, items, payloads = item
+            for pending, payload in zip(items, payloads):
+                self._broadcast(from_key, pending, payload)
+
+    def _broadcast(self, from_key: str, pending: PendingTx, payload: Any) -> None:
+        try:
+            result = self.cli.broadcast_signed_tx(payload)
+        except Exception as e:
+            expected = parse_expected_sequence(str(e))
+            if expected is None:
+                # Unknown whether the sequence was used; re-query before the next batch
+                self.sequence_manager.invalidate(from_key)
+                pending.future.set_exception(e)
+            else:
+                self._resign(from_key, pending, expected)
+            return
+
+        code = int(result.get("code", 0))
+        if code == SEQUENCE_MISMATCH_CODE:
+            self._resign(from_key, pending, parse_expected_sequence(result.get("raw_log", "")))
+            return
+
+        # A tx rejected in CheckTx leaves a gap; the txs signed after it come
+        # back as mismatches and are re-signed
+        pending.future.set_result(result)
+
+    def _resign(self, from_key: str, pending: PendingTx, expected: Optional[int]) -> None:
+        """Correct the key's sequence and queue a tx to be signed again."""
+        pending.attempts += 1
+        if pending.attempts >= self.max_attempts:
+            pending.future.set_exception(TxPipelineError(
+                f"Sequence for {from_key} still mismatched after {pending.attempts} attempts"
+            ))
+            return
+
+        with self.sequence_manager.account(from_key) as account:
+            account.resync(expected)
+        self._pending.put(pending)
@@ -0,0 +1,245 @@
+"""
+Transaction inclusion tracking.
+
+TxTracker resolves broadcast transactions the moment they are included in
+a block. One background thread listens for Tx events on the RPC websocket
+and, as a safety net for txs included before it subscribed (or when no
+websocket is available), periodically looks up still-pending hashes.
+"""
+
+import logging
+import socket
+import threading
+import time
+from typing import Dict, Any, Callable, Iterable, List, Optional
+
+from test_config import config
+from tendermint_ws import TendermintWebSocket, WebSocketError
+
+
+logger = logging.getLogger(__name__)
+
+# Seconds between websocket reconnection attempts
+_RECONNECT_INTERVAL = 5.0
+
+
+class TxTimeout(Exception):
+    """Raised when tracked transactions are not included in time."""
+    pass
+
+
+class _PendingTx:
+    """A tracked transaction and the result it resolves to."""
+
+    def __init__(self, txhash: str):
+        self.txhash = txhash
+        self.done = threading.Event()
+        self.result: Optional[Dict[str, Any]] = None
+
+
+def _normalize_tx_event(value: Dict[str, Any], txhash: str) -> Dict[str, Any]:
+    """Convert a Tx event payload into the `query tx` result shape."""
+    tx_result = value.get("TxResult", {})
+    result = tx_result.get("result", {})
+    return {
+        "txhash": txhash,
+        "height": str(tx_result.get("height", "")),
+        "code": int(result.get("code", 0)),
+        "raw_log": result.get("log", ""),
+        "events": result.get("events", []),
+        "gas_wanted": result.get("gas_wanted", ""),
+        "gas_used": result.get("gas_used", ""),
+    }
+
+
+class TxTracker:
+    """Tracks many pending transaction hashes and resolves each on inclusion."""
+
+    def __init__(
+        self,
+        query_tx: Callable[[str], Optional[Dict[str, Any]]],
+        rpc_url: Optional[str] = None,
+        poll_interval: Optional[float] = None,
+    ):
+        """
+        Initialize the tracker.
+
+        Args:
+            query_tx: Looks up an included tx by hash, returning None if not found yet
+            rpc_url: Node RPC URL for Tx event subscription (None disables it)
+            poll_interval: Seconds between lookups of still-pending hashes
+        """
+        self.query_tx = query_tx
+        self.rpc_url = rpc_url
+        self.poll_interval = poll_interval if poll_interval is not None else config.tx_poll_interval
+        self._pending: Dict[str, _PendingTx] = {}
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopping = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def track(self, txhash: str) -> None:
+        """Start tracking a broadcast transaction hash."""
+        key = txhash.upper()
+        with self._lock:
+            if key not in self._pending:
+                self._pending[key] = _PendingTx(txhash)
+            if self._thread is None or not self._thread.is_alive():
+                self._stopping.clear()
+                self._thread = threading.Thread(target=self._run, name="tx-tracker", daemon=True)
+                self._thread.start()
+        self._wakeup.set()
+
+    def wait(self, txhash: str, timeout: float) -> Dict[str, Any]:
+        """
+        Wait for one transaction to be included.
+
+        Args:
+            txhash: Hash returned by the broadcast
+            timeout: Maximum seconds to wait
+
+        Returns:
+            Included tx result with txhash, height, code, raw_log and events
+
+        Raises:
+            TxTimeout: If the tx is not included in time
+        """
+        return self.wait_all([txhash], timeout)[txhash]
+
+    def wait_all(self, txhashes: Iterable[str], timeout: float) -> Dict[str, Dict[str, Any]]:
+        """
+        Wait for a batch of transactions to be included.
+
+        Args:
+            txhashes: Hashes returned by the broadcasts
+            timeout: Maximum seconds to wait for the whole batch
+
+        Returns:
+            Mapping of each hash to its included tx result
+
+        Raises:
+            TxTimeout: If any tx is not included in time
+        """
+        txhashes = list(txhashes)
+        for txhash in txhashes:
+            self.track(txhash)
+
+        deadline = time.monotonic() + timeout
+        results = {}
+        missing = []
+
+        for txhash in txhashes:
+            with self._lock:
+                pending = self._pending.get(txhash.upper())
+            if pending is None:
+                # Resolved and collected by a concurrent waiter; look it up directly
+                result = self.query_tx(txhash)
+                if result is None:
+                    missing.append(txhash)
+                else:
+                    results[txhash] = result
+                continue
+
+            if pending.done.wait(max(deadline - time.monotonic(), 0)):
+                results[txhash] = pending.result
+            else:
+                missing.append(txhash)
+
+        with self._lock:
+            for txhash in txhashes:
+                self._pending.pop(txhash.upper(), None)
+
+        if missing:
+            raise TxTimeout(f"Transactions not included within {timeout}s: {', '.join(missing)}")
+
+        return results
+
+    def pending_count(self) -> int:
+        """Number of tracked transactions not yet included."""
+        with self._lock:
+            return sum(1 for pending in self._pending.values() if not pending.done.is_set())
+
+    def _resolve(self, txhash: str, result: Dict[str, Any]) -> None:
+        with self._lock:
+            pending = self._pending.get(txhash.upper())
+        if pending is not None and not pending.done.is_set():
+            pending.result = result
+            pending.done.set()
+            logger.info(f"Tx {pending.txhash} included at height {result.get('height')} "
+                        f"with code {result.get('code')}")
+
+    def _unresolved(self) -> List[_PendingTx]:
+        with self._lock:
+            return [pending for pending in self._pending.values() if not pending.done.is_set()]
+
+    def _poll_pending(self) -> None:
+        """Look up every unresolved hash once."""
+        for pending in self._unresolved():
+            result = self.query_tx(pending.txhash)
+            if result is not None:
+                result["code"] = int(result.get("code", 0))
+                self._resolve(pending.txhash, result)
+
+    def _connect(self) -> Optional[TendermintWebSocket]:
+        """Open a Tx event subscription, or return None if unavailable."""
+        if self.rpc_url is None:
+            return None
+        ws = TendermintWebSocket(self.rpc_url, timeout=self.poll_interval)
+        try:
+            ws.connect()
+            ws.subscribe("tm.event='Tx'")
+            return ws
+        except (WebSocketError, OSError) as e:
+            logger.debug(f"Tx event subscription unavailable: {e}")
+            ws.close()
+            return None
+
+    def _handle_event(self, message: Dict[str, Any]) -> None:
+        result = message.get("result", {})
+        hashes = result.get("events", {}).get("tx.hash", [])
+        value = result.get("data", {}).get("value", {})
+        for txhash in hashes:
+            self._resolve(txhash, _normalize_tx_event(value, txhash))
+
+    def _run(self) -> None:
+        """Background loop: consume Tx events and poll stragglers."""
+        ws = None
+        next_connect = 0.0
+        next_poll = 0.0
+
+        try:
+            while not self._stopping.is_set():
+                now = time.monotonic()
+                if ws is None and now >= next_connect:
+                    ws = self._connect()
+                    next_connect = now + _RECONNECT_INTERVAL
+
+                if now >= next_poll:
+                    self._poll_pending()
+                    next_poll = time.monotonic() + self.poll_interval
+
+                if ws is None:
+                    self._wakeup.wait(self.poll_interval)
+                    self._wakeup.clear()
+                    continue
+
+                ws.set_timeout(max(next_poll - time.monotonic(), 0.01))
+                try:
+                    self._handle_event(ws.receive())
+                except socket.timeout:
+                    pass
+                except (WebSocketError, OSError) as e:
+                    logger.debug(f"Tx event subscription dropped: {e}")
+                    ws.close()
+                    ws = None
+        finally:
+            if ws is not None:
+                ws.close()
+
+    def close(self) -> None:
+        """Stop the background thread."""
+        self._stopping.set()
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
@@ -0,0 +1,87 @@
+"""
+Per-worker test accounts for pytest-xdist runs.
+
+With every worker signing as config.admin_key, parallel runs contend for one
+account sequence and serialize on the node. Before the workers start, the
+controller provisions one key per worker: the keys are added to the test
+keyring, funded together in one MsgMultiSend and granted the exchange admin
+message through authz in one multi-message tx. Each worker then signs as its
+own key, exercising the admin's rights through authz exec.
+"""
+
+import logging
+import os
+from typing import Dict, List, Optional
+
+from injective_cli import cli, InjectiveCLIError
+from test_config import config
+
+
+logger = logging.getLogger(__name__)
+
+ADMIN_MSG_TYPE = "/injective.exchange.v1beta1.MsgAdminUpdatePerpetualMarket"
+
+
+def worker_key_name(worker_id: str) -> str:
+    """Keyring name of a worker's key, e.g. "worker_gw0"."""
+    return f"{config.worker_key_prefix}_{worker_id}"
+
+
+def provision_worker_accounts(
+    worker_ids: List[str],
+    funder_key: Optional[str] = None,
+    granter_key: Optional[str] = None,
+    amount: Optional[str] = None,
+) -> Dict[str, Dict[str, str]]:
+    """
+    Add, fund and authorize one key per worker.
+
+    Args:
+        worker_ids: pytest-xdist worker IDs ("gw0", "gw1", ...)
+        funder_key: Key paying for the accounts (defaults to config.validator_key)
+        granter_key: Exchange admin granting its rights (defaults to config.admin_key)
+        amount: Amount each account is funded with (defaults to config.worker_fund_amount)
+
+    Returns:
+        Worker ID -> {"key", "address", "granter"}
+    """
+    funder_key = funder_key or config.validator_key
+    granter_key = granter_key or config.admin_key
+    amount = amount or config.worker_fund_amount
+
+    accounts = {
+        worker_id: {"key": worker_key_name(worker_id), "granter": granter_key}
+        for worker_id in worker_ids
+    }
+    for account in accounts.values():
+        account["address"] = cli.add_key(account["key"])
+    addresses = [account["address"] for account in accounts.values()]
+
+    logger.info(f"Funding {len(addresses)} worker account(s) with {amount} each")
+    _wait_for_success(cli.multi_send(funder_key, addresses, amount), "Worker funding")
+
+    logger.info(f"Granting {ADMIN_MSG_TYPE} to {len(addresses)} worker account(s)")
+    _wait_for_success(cli.grant_authz(granter_key, addresses, ADMIN_MSG_TYPE), "Worker authz grant")
+
+    return accounts
+
+
+def use_worker_account(account: Dict[str, str]) -> None:
+    """
+    Make this process sign as a provisioned worker account.
+
+    config reads the environment on every access, so admin_key (and the
+    flows built on it) switches to the worker key from here on.
+    """
+    os.environ["ADMIN_KEY"] = account["key"]
+    os.environ["ADMIN_GRANTER"] = account["granter"]
+    logger.info(f"Signing as worker key {account['key']} ({account['address']})")
+
+
+def _wait_for_success(result: Dict[str, str], action: str) -> None:
+    """Wait for a broadcast tx and raise unless it was included successfully."""
+    if int(result.get("code", 0)) != 0 or not result.get("txhash"):
+        raise InjectiveCLIError(f"{action} failed: {result}")
+    included = cli.wait_for_tx(result["txhash"])
+    if int(included.get("code", 0)) != 0:
+        raise InjectiveCLIError(f"{action} failed in block: {included}")
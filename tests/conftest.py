@@ -5,6 +5,9 @@ Pytest configuration and fixtures for RMR tests.
 import pytest
 import logging
 import json
+import os
+import shutil
+import tempfile
 import time
 from pathlib import Path
 from typing import Dict, Any
@@ -12,9 +15,16 @@ from typing import Dict, Any
 import sys
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from injective_cli import cli, InjectiveCLIError
+import market_utils
+from block_waiter import BlockWaiter
+from injective_cli import cli, InjectiveCLI, InjectiveCLIError, CircuitOpenError
+from query_transport import RestQueryTransport
 from test_config import config
-from market_utils import MarketUtils
+from clock import SystemClock, VirtualClock, current_clock, set_clock
+from market_pool import MarketPool
+from shared_store import SharedStore
+from worker_accounts import provision_worker_accounts, use_worker_account
+from tests.mock_node import MockNodeServer
 
 
 # Configure logging
@@ -29,30 +39,58 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+MOCK_BINARY = Path(__file__).parent.parent / "injectived"
+
 
 @pytest.fixture(scope="session")
-def injective_node():
+def clock():
     """
-    Ensure Injective node is running and accessible.
+    Clock the session sleeps on; virtual against the mock injectived.
+    """
+    return current_clock()
+
+
+@pytest.fixture(scope="session")
+def shared_store():
     """
-    logger.info("Checking Injective node connection...")
+    Store sharing session results across pytest-xdist workers.
     
-    try:
-        # Try to get latest block height
-        height = cli.get_latest_block_height()
-        logger.info(f"Connected to Injective node at block height: {height}")
+    The controller creates its directory; without xdist every call computes.
+    """
+    return SharedStore()
+
+
+@pytest.fixture(scope="session")
+def injective_node(shared_store):
+    """
+    Ensure Injective node is running and accessible.
+    
+    Under pytest-xdist the check runs once for all workers.
+    """
+    def check_node() -> Dict[str, Any]:
+        logger.info("Checking Injective node connection...")
         
-        if height == 0:
-            pytest.fail("Node is not producing blocks")
+        try:
+            # Try to get latest block height
+            height = cli.get_latest_block_height()
+            logger.info(f"Connected to Injective node at block height: {height}")
             
-        return {"height": height, "connected": True}
-        
-    except Exception as e:
-        pytest.fail(f"Failed to connect to Injective node: {e}")
+            if height == 0:
+                pytest.fail("Node is not producing blocks")
+                
+            return {"height": height, "connected": True}
+            
+        except Exception as e:
+            if isinstance(e, CircuitOpenError) or cli.circuit_breaker.is_open:
+                # Every test would fail the same way; stop the session instead
+                pytest.exit(f"Injective node unreachable, aborting test session: {e}", returncode=3)
+            pytest.fail(f"Failed to connect to Injective node: {e}")
+    
+    return shared_store.get_or_compute("fixture:injective_node", check_node)
 
 
 @pytest.fixture(scope="session")
-def test_keys(injective_node):
+def test_keys(injective_node, shared_store):
     """
     Verify test keys are available.
     """
@@ -64,39 +102,46 @@ def test_keys(injective_node):
         config.admin_key
     ]
     
-    available_keys = {}
-    
-    for key_name in keys_to_check:
-        try:
-            account_info = cli.get_account_info(key_name)
-            available_keys[key_name] = account_info.get("output", "")
-            logger.info(f"Key '{key_name}' is available")
-        except InjectiveCLIError as e:
-            logger.error(f"Key '{key_name}' not found: {e}")
-            pytest.fail(f"Required key '{key_name}' not found")
+    def check_keys() -> Dict[str, str]:
+        available_keys = {}
+        
+        for key_name in keys_to_check:
+            try:
+                account_info = cli.get_account_info(key_name)
+                available_keys[key_name] = account_info.get("output", "")
+                logger.info(f"Key '{key_name}' is available")
+            except InjectiveCLIError as e:
+                logger.error(f"Key '{key_name}' not found: {e}")
+                pytest.fail(f"Required key '{key_name}' not found")
+        
+        return available_keys
     
-    return available_keys
+    # Workers sign with different keys, so each set of keys is checked once
+    return shared_store.get_or_compute(f"fixture:test_keys:{','.join(keys_to_check)}", check_keys)
 
 
 @pytest.fixture(scope="session")
-def market_templates():
+def market_templates(shared_store):
     """
     Load market templates from configuration.
     """
-    templates_file = Path(__file__).parent.parent / "config" / "market_templates.json"
-    
-    if not templates_file.exists():
-        pytest.fail(f"Market templates file not found: {templates_file}")
-    
-    try:
-        with open(templates_file, 'r') as f:
-            templates = json.load(f)
+    def load_templates() -> Dict[str, Any]:
+        templates_file = Path(__file__).parent.parent / "config" / "market_templates.json"
         
-        logger.info(f"Loaded {len(templates.get('templates', {}))} market templates")
-        return templates
+        if not templates_file.exists():
+            pytest.fail(f"Market templates file not found: {templates_file}")
         
-    except json.JSONDecodeError as e:
-        pytest.fail(f"Failed to parse market templates: {e}")
+        try:
+            with open(templates_file, 'r') as f:
+                templates = json.load(f)
+            
+            logger.info(f"Loaded {len(templates.get('templates', {}))} market templates")
+            return templates
+            
+        except json.JSONDecodeError as e:
+            pytest.fail(f"Failed to parse market templates: {e}")
+    
+    return shared_store.get_or_compute("fixture:market_templates", load_templates)
 
 
 @pytest.fixture
@@ -110,54 +155,130 @@ def unique_ticker():
     return f"TEST{timestamp}{unique_id}/USDT PERP"
 
 
+@pytest.fixture(scope="session")
+def market_pool():
+    """
+    Session pool of markets at the default RMR, launched in batches on first use.
+    
+    Under pytest-xdist each worker gets its own pool of markets.
+    """
+    pool = MarketPool(
+        baseline_rmr=config.rmr_test_values["valid_medium"],  # 10%
+        size=config.market_pool_size,
+        worker=os.getenv("PYTEST_XDIST_WORKER", ""),
+        timeout=config.test_timeout
+    )
+    yield pool
+    logger.info(f"Market pool used {len(pool)} market(s) in {pool.launches} launch(es), {pool.resets} reset(s)")
+
+
 @pytest.fixture
-def clean_test_market(unique_ticker, test_keys):
+def clean_test_market(market_pool, test_keys):
     """
-    Create a clean test market for each test.
-    Returns market ID and cleans up after test.
+    Lease a test market at the default RMR for each test.
+    Returns market ID and resets the market's RMR after the test.
     """
-    market_id = None
-    
     try:
-        # Create market with default RMR
-        rmr = config.rmr_test_values["valid_medium"]  # 10%
-        
-        proposal_json = MarketUtils.create_market_proposal_json(
-            ticker=unique_ticker,
-            base_denom="tst",
-            quote_denom="usdt",
-            rmr=rmr
-        )
-        
-        logger.info(f"Creating test market: {unique_ticker}")
-        proposal_id = MarketUtils.submit_and_pass_proposal(proposal_json)
-        
-        # Wait for market creation
-        time.sleep(10)
-        
-        # Find created market
-        market = MarketUtils.get_market_by_ticker(unique_ticker)
-        if not market:
-            pytest.fail(f"Failed to create test market: {unique_ticker}")
-        
-        market_id = market.get("market", {}).get("market_id", "")
-        logger.info(f"Created test market {unique_ticker} with ID: {market_id}")
-        
-        yield {
-            "market_id": market_id,
-            "ticker": unique_ticker,
-            "rmr": rmr,
-            "proposal_id": proposal_id
-        }
-        
+        market = market_pool.lease()
     except Exception as e:
         logger.error(f"Failed to create test market: {e}")
         pytest.fail(f"Test market creation failed: {e}")
     
+    logger.info(f"Leased test market {market['ticker']} with ID: {market['market_id']}")
+    try:
+        yield market
     finally:
-        # Cleanup would go here if needed
-        # For now, we'll leave test markets as they don't interfere
-        logger.info(f"Test completed for market: {unique_ticker}")
+        market_pool.release(market)
+        logger.info(f"Test completed for market: {market['ticker']}")
+
+
+@pytest.fixture
+def mock_node():
+    """
+    Start a local stand-in node for offline client tests.
+    """
+    with MockNodeServer() as node:
+        yield node
+
+
+@pytest.fixture
+def mock_binary():
+    """
+    Path to the repo's mock injectived.
+    """
+    return str(MOCK_BINARY)
+
+
+@pytest.fixture
+def mock_chain(tmp_path, monkeypatch, mock_node, mock_binary):
+    """
+    Point market_utils at the repo's mock injectived with a private state file.
+    
+    The stand-in node produces blocks for the CLI's block waits.
+    """
+    monkeypatch.setenv("MOCK_INJECTIVE_STATE_FILE", str(tmp_path / "state.json"))
+    mock_node.start_producing(0.05)
+    client = InjectiveCLI(binary_path=mock_binary, block_waiter=BlockWaiter(mock_node.node_url))
+    monkeypatch.setattr(market_utils, "cli", client)
+    return client
+
+
+@pytest.fixture
+def rest_cli(request, mock_node, monkeypatch):
+    """
+    Uncached CLI whose queries go to the mock node over REST, patched in as market_utils.cli.
+    
+    A rest_markets(count, expiry_every=0, page_limit=None) mark seeds markets "0x00"...
+    with tickers "M00/USDT PERP"...; every expiry_every-th one is an expiry market.
+    """
+    monkeypatch.setenv("QUERY_CACHE", "false")
+    marker = request.node.get_closest_marker("rest_markets")
+    if marker:
+        _seed_rest_markets(mock_node, monkeypatch, *marker.args, **marker.kwargs)
+    
+    transport = RestQueryTransport(mock_node.url)
+    client = InjectiveCLI(binary_path="/nonexistent/injectived", transport=transport)
+    monkeypatch.setattr(market_utils, "cli", client)
+    yield client
+    transport.close()
+
+
+def _seed_rest_markets(mock_node, monkeypatch, count: int, expiry_every: int = 0, page_limit: int = None):
+    """
+    Add the markets a rest_markets mark asks for, optionally listing them page_limit per page.
+    """
+    if page_limit:
+        monkeypatch.setenv("MARKETS_PAGE_LIMIT", str(page_limit))
+    for i in range(count):
+        expiry = expiry_every and i % expiry_every == expiry_every - 1
+        mock_node.add_market(f"0x{i:02d}", f"M{i:02d}/USDT PERP", is_perpetual=not expiry)
+
+
+@pytest.fixture
+def fake_binary(tmp_path):
+    """
+    Build a fake injectived that records one PID file per run, sleeps, then prints JSON.
+    
+    With a non-zero returncode it writes stderr and exits with that code instead.
+    """
+    def _build(delay: float = 0.0, output: Dict[str, Any] = None,
+               returncode: int = 0, stderr: str = ""):
+        output = output if output is not None else {"block": {"header": {"height": "42"}}}
+        script = tmp_path / "injectived"
+        script.write_text(
+            f"#!{sys.executable}\n"
+            "import json, os, sys, time\n"
+            f"open(os.path.join({str(tmp_path)!r}, f'pid.{{os.getpid()}}'), 'w').write(str(os.getpid()))\n"
+            f"time.sleep({delay})\n"
+            f"if {returncode}:\n"
+            f"    sys.stderr.write({stderr!r})\n"
+            f"    sys.exit({returncode})\n"
+            f"print(json.dumps({output!r}))\n"
+        )
+        script.chmod(0o755)
+        return str(script)
+    
+    return _build
 
 
 @pytest.fixture
@@ -192,6 +313,77 @@ def pytest_configure(config):
     config.addinivalue_line(
         "markers", "slow: tests that take longer to run"
     )
+    config.addinivalue_line(
+        "markers", "client: offline tests for the CLI client layer"
+    )
+    config.addinivalue_line(
+        "markers", "rest_markets(count, expiry_every=0, page_limit=None): markets the rest_cli fixture seeds"
+    )
+    
+    # The xdist controller creates the directory its workers share results through
+    if (getattr(config.option, "numprocesses", None) and not hasattr(config, "workerinput")
+            and not os.getenv("SHARED_STORE_DIR")):
+        config._shared_store_dir = tempfile.mkdtemp(prefix="rmr_shared_")
+        os.environ["SHARED_STORE_DIR"] = config._shared_store_dir
+    
+    set_clock(_session_clock())
+    
+    # pytest-xdist workers sign as the account the controller provisioned for them
+    worker_account = getattr(config, "workerinput", {}).get("worker_account")
+    if worker_account:
+        use_worker_account(json.loads(worker_account))
+
+
+def pytest_unconfigure(config):
+    """
+    Remove the directory the xdist controller shared with its workers.
+    """
+    shared_dir = getattr(config, "_shared_store_dir", None)
+    if shared_dir:
+        shutil.rmtree(shared_dir, ignore_errors=True)
+        os.environ.pop("SHARED_STORE_DIR", None)
+
+
+def _session_clock() -> SystemClock:
+    """
+    Pick the session clock: virtual when config.clock asks for it, or on "auto" when injectived is the mock.
+    """
+    if config.clock == "auto":
+        binary = shutil.which(cli.binary_path)
+        virtual = binary is not None and Path(binary).resolve() == MOCK_BINARY.resolve()
+    else:
+        virtual = config.clock == "virtual"
+    
+    logger.info(f"Using the {'virtual' if virtual else 'system'} clock")
+    return VirtualClock() if virtual else SystemClock()
+
+
+# Worker ID -> account, filled in by the xdist controller
+_worker_accounts: Dict[str, Dict[str, str]] = {}
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_xdist_setupnodes(specs):
+    """
+    Provision a funded signer for each pytest-xdist worker before the workers start.
+    """
+    if not config.worker_accounts:
+        return
+    
+    try:
+        _worker_accounts.update(provision_worker_accounts([spec.id for spec in specs]))
+    except InjectiveCLIError as e:
+        logger.warning(f"Worker accounts unavailable, workers share {config.admin_key}: {e}")
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    """
+    Hand a pytest-xdist worker its provisioned account.
+    """
+    account = _worker_accounts.get(node.gateway.id)
+    if account:
+        node.workerinput["worker_account"] = json.dumps(account)
 
 
 def pytest_collection_modifyitems(config, items):
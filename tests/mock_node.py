@@ -0,0 +1,370 @@
+"""
+In-process stand-in for an Injective node, used to test native transports offline.
+
+The server speaks the subset of the LCD REST API that the query transports
+use, plus the Tendermint RPC /status endpoint and /websocket event stream,
+and keeps its chain state in plain dicts that tests can seed directly.
+"""
+
+import base64
+import hashlib
+import json
+import logging
+import queue
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Any, List, Optional, Tuple
+from urllib.parse import parse_qs
+
+from tendermint_ws import OP_CLOSE, OP_CONTINUATION, OP_PING, OP_TEXT, accept_key, encode_frame, read_frame
+
+
+logger = logging.getLogger(__name__)
+
+
+class _MockNodeHandler(BaseHTTPRequestHandler):
+    """Request handler dispatching LCD paths to the owning MockNodeServer."""
+
+    protocol_version = "HTTP/1.1"  # Keep-alive, so clients can reuse one connection
+    disable_nagle_algorithm = True
+
+    def setup(self):
+        super().setup()
+        self.server.node.connection_count += 1
+
+    def do_GET(self):
+        if self.path == "/websocket" and self.headers.get("Upgrade", "").lower() == "websocket":
+            self._serve_websocket()
+            return
+
+        self._send_response(*self.server.node.handle_get(self.path))
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        body = json.loads(self.rfile.read(length) or b"{}")
+        self._send_response(*self.server.node.handle_post(self.path, body))
+
+    def _send_response(self, status: int, body: Dict[str, Any]):
+        payload = json.dumps(body).encode()
+
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _serve_websocket(self):
+        """Accept one websocket client and stream the events it subscribes to."""
+        self.send_response(101, "Switching Protocols")
+        self.send_header("Upgrade", "websocket")
+        self.send_header("Connection", "Upgrade")
+        self.send_header("Sec-WebSocket-Accept", accept_key(self.headers["Sec-WebSocket-Key"]))
+        self.end_headers()
+        self.close_connection = True
+
+        _, opcode, payload = read_frame(self.rfile)
+        if opcode != OP_TEXT:
+            return
+        request = json.loads(payload)
+        events = self.server.node.subscribe(request["params"]["query"])
+        self._send_json({"jsonrpc": "2.0", "id": request["id"], "result": {}})
+
+        try:
+            while not self.server.node.stopping.is_set():
+                try:
+                    event = events.get(timeout=0.05)
+                except queue.Empty:
+                    continue
+                self._send_json({"jsonrpc": "2.0", "id": request["id"], "result": event})
+        except OSError:
+            pass  # Client went away
+        finally:
+            self.server.node.unsubscribe(events)
+            try:
+                self.wfile.write(encode_frame(b"", OP_CLOSE, mask=False))
+            except OSError:
+                pass
+
+    def _send_json(self, message: Dict[str, Any]):
+        payload = json.dumps(message).encode()
+        size = self.server.node.ws_fragment_size or len(payload)
+        chunks = [payload[i:i + size] for i in range(0, len(payload), size)]
+        for i, chunk in enumerate(chunks):
+            if i:
+                # Control frames may arrive between the fragments of a message
+                self.wfile.write(encode_frame(b"", OP_PING, mask=False))
+            self.wfile.write(encode_frame(chunk, OP_CONTINUATION if i else OP_TEXT, mask=False,
+                                          fin=i == len(chunks) - 1))
+
+    def log_message(self, format, *args):
+        logger.debug(f"mock node: {format % args}")
+
+
+class MockNodeServer:
+    """Local stand-in for a node's LCD and RPC endpoints backed by in-memory state."""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0):
+        """
+        Initialize the mock node.
+
+        Args:
+            host: Interface to bind
+            port: Port to bind (0 picks a free port)
+        """
+        self.host = host
+        self.port = port
+        self.height = 1000000
+        self.markets: Dict[str, Dict[str, Any]] = {}
+        self.proposals: Dict[str, Dict[str, Any]] = {}
+        self.txs: Dict[str, Dict[str, Any]] = {}
+        self.accounts: Dict[str, Dict[str, Any]] = {}
+        self.gov_params: Dict[str, Any] = {"voting_period": "10s"}
+        self.tallies: Dict[str, Dict[str, str]] = {}
+        self.bonded_tokens = "3000000"
+        self.broadcasts: List[str] = []
+        self.request_count = 0
+        self.connection_count = 0
+        # Split websocket messages into fragments of this many bytes
+        self.ws_fragment_size: Optional[int] = None
+        self.stopping = threading.Event()
+        self._subscribers: List[Tuple[str, "queue.Queue"]] = []
+        self._lock = threading.Lock()
+        self._httpd: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+        self._producer: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    @property
+    def node_url(self) -> str:
+        """Address in the form the CLI's --node flag (and config.node_url) uses."""
+        return f"tcp://{self.host}:{self.port}"
+
+    def subscribe(self, query: str) -> "queue.Queue":
+        """Register a websocket subscriber for an event query."""
+        events: "queue.Queue" = queue.Queue()
+        with self._lock:
+            self._subscribers.append((query, events))
+        return events
+
+    def unsubscribe(self, events: "queue.Queue") -> None:
+        with self._lock:
+            self._subscribers = [sub for sub in self._subscribers if sub[1] is not events]
+
+    @property
+    def subscriber_count(self) -> int:
+        with self._lock:
+            return len(self._subscribers)
+
+    def publish(self, event_type: str, value: Dict[str, Any]) -> None:
+        """Deliver an event to every subscriber whose query names its type."""
+        event = {
+            "query": f"tm.event='{event_type}'",
+            "data": {"type": f"tendermint/event/{event_type}", "value": value},
+        }
+        with self._lock:
+            for query, events in self._subscribers:
+                if f"tm.event='{event_type}'" in query:
+                    events.put(event)
+
+    def include_tx(self, txhash: str, code: int = 0, events: Optional[List[Dict[str, Any]]] = None,
+                   raw_log: str = "") -> Dict[str, Any]:
+        """Include a tx in the next block, making it queryable and emitting its Tx event."""
+        height = self.produce_block()
+        events = events or []
+        tx = {
+            "txhash": txhash,
+            "height": str(height),
+            "code": code,
+            "raw_log": raw_log,
+            "events": events,
+        }
+        self.txs[txhash] = tx
+        self.publish_tx(txhash, height, code, events, raw_log)
+        return tx
+
+    def publish_tx(self, txhash: str, height: int, code: int = 0,
+                   events: Optional[List[Dict[str, Any]]] = None, raw_log: str = "") -> None:
+        """Emit a Tx event the way CometBFT does, with tx.hash in the event index."""
+        value = {"TxResult": {"height": str(height), "result": {
+            "code": code, "log": raw_log, "events": events or [],
+        }}}
+        event = {
+            "query": "tm.event='Tx'",
+            "data": {"type": "tendermint/event/Tx", "value": value},
+            "events": {"tx.hash": [txhash], "tx.height": [str(height)]},
+        }
+        with self._lock:
+            for query, subscriber in self._subscribers:
+                if "tm.event='Tx'" in query:
+                    subscriber.put(event)
+
+    def produce_block(self) -> int:
+        """Commit one block and emit its NewBlock event."""
+        with self._lock:
+            self.height += 1
+            height = self.height
+        self.publish("NewBlock", {"block": {"header": {"height": str(height)}}})
+        return height
+
+    def start_producing(self, block_time: float) -> None:
+        """Produce a block every block_time seconds until the server stops."""
+        def _produce():
+            while not self.stopping.wait(block_time):
+                self.produce_block()
+
+        self._producer = threading.Thread(target=_produce, daemon=True)
+        self._producer.start()
+
+    def add_market(self, market_id: str, ticker: str, rmr: str = "0.100000000000000000",
+                   **fields) -> Dict[str, Any]:
+        """Seed a perpetual market into the mock state."""
+        market = {
+            "market_id": market_id,
+            "ticker": ticker,
+            "reduce_margin_ratio": rmr,
+            "initial_margin_ratio": fields.pop("initial_margin_ratio", "0.050000000000000000"),
+            "maintenance_margin_ratio": fields.pop("maintenance_margin_ratio", "0.030000000000000000"),
+            "is_perpetual": fields.pop("is_perpetual", True),
+            "status": fields.pop("status", "Active"),
+        }
+        market.update(fields)
+        self.markets[market_id] = market
+        return market
+
+    def add_proposal(self, proposal_id: str, status: str = "PROPOSAL_STATUS_VOTING_PERIOD",
+                     **fields) -> Dict[str, Any]:
+        """Seed a governance proposal into the mock state."""
+        proposal = {"id": proposal_id, "status": status}
+        proposal.update(fields)
+        self.proposals[proposal_id] = proposal
+        return proposal
+
+    def add_account(self, address: str, account_number: int = 1, sequence: int = 0) -> Dict[str, Any]:
+        """Seed an account into the mock state."""
+        account = {"address": address, "account_number": str(account_number), "sequence": str(sequence)}
+        self.accounts[address] = account
+        return account
+
+    def handle_get(self, path: str) -> Tuple[int, Dict[str, Any]]:
+        """Answer an LCD GET request, returning (HTTP status, JSON body)."""
+        self.request_count += 1
+        path, _, query = path.partition("?")
+        query_params = parse_qs(query)
+        params = {name: values[0] for name, values in query_params.items()}
+
+        if path == "/status":
+            return 200, {
+                "jsonrpc": "2.0",
+                "id": -1,
+                "result": {"sync_info": {"latest_block_height": str(self.height)}},
+            }
+
+        if path == "/cosmos/base/tendermint/v1beta1/blocks/latest":
+            return 200, {"block": {"header": {"height": str(self.height)}}}
+
+        if path == "/injective/exchange/v1beta1/derivative/markets":
+            markets = [
+                {"market": market, "mark_price": "1.0"} for market in self.markets.values()
+                if "market_ids" not in query_params or market["market_id"] in query_params["market_ids"]
+            ]
+            if "pagination.limit" not in params:
+                return 200, {"markets": markets}
+
+            # Keys are opaque to clients; here they encode the next index
+            start = int(base64.b64decode(params["pagination.key"])) if "pagination.key" in params else 0
+            end = start + int(params["pagination.limit"])
+            next_key = base64.b64encode(str(end).encode()).decode() if end < len(markets) else None
+            return 200, {"markets": markets[start:end], "pagination": {"next_key": next_key, "total": "0"}}
+
+        match = re.fullmatch(r"/injective/exchange/v1beta1/derivative/markets/([^/]+)", path)
+        if match:
+            market = self.markets.get(match.group(1))
+            if market is None:
+                return 404, {"code": 5, "message": f"market {match.group(1)} not found"}
+            return 200, {"market": {"market": market, "mark_price": "1.0"}}
+
+        match = re.fullmatch(r"/cosmos/tx/v1beta1/txs/([^/]+)", path)
+        if match:
+            tx = self.txs.get(match.group(1))
+            if tx is None:
+                return 404, {"code": 5, "message": f"tx not found: {match.group(1)}"}
+            return 200, {"tx_response": tx}
+
+        match = re.fullmatch(r"/cosmos/auth/v1beta1/accounts/([^/]+)", path)
+        if match:
+            account = self.accounts.get(match.group(1))
+            if account is None:
+                return 404, {"code": 5, "message": f"account {match.group(1)} not found"}
+            return 200, {"account": {"@type": "/injective.types.v1beta1.EthAccount", "base_account": account}}
+
+        if path == "/cosmos/gov/v1/params/voting":
+            return 200, {"voting_params": {"voting_period": self.gov_params["voting_period"]},
+                         "params": self.gov_params}
+
+        if path == "/cosmos/staking/v1beta1/pool":
+            return 200, {"pool": {"not_bonded_tokens": "0", "bonded_tokens": self.bonded_tokens}}
+
+        match = re.fullmatch(r"/cosmos/gov/v1/proposals/([^/]+)/tally", path)
+        if match:
+            if match.group(1) not in self.proposals:
+                return 404, {"code": 5, "message": f"proposal {match.group(1)} doesn't exist"}
+            empty = {"yes_count": "0", "abstain_count": "0", "no_count": "0", "no_with_veto_count": "0"}
+            return 200, {"tally": self.tallies.get(match.group(1), empty)}
+
+        match = re.fullmatch(r"/cosmos/gov/v1/proposals/([^/]+)", path)
+        if match:
+            proposal = self.proposals.get(match.group(1))
+            if proposal is None:
+                return 404, {"code": 5, "message": f"proposal {match.group(1)} doesn't exist"}
+            return 200, {"proposal": proposal}
+
+        return 501, {"code": 12, "message": f"Not Implemented: {path}"}
+
+    def handle_post(self, path: str, body: Dict[str, Any]) -> Tuple[int, Dict[str, Any]]:
+        """Answer an LCD POST request; only tx broadcasts are supported."""
+        self.request_count += 1
+
+        if path == "/cosmos/tx/v1beta1/txs":
+            tx_bytes = body.get("tx_bytes", "")
+            self.broadcasts.append(tx_bytes)
+            txhash = hashlib.sha256(tx_bytes.encode()).hexdigest().upper()
+            return 200, {"tx_response": {"txhash": txhash, "code": 0, "height": "0", "raw_log": ""}}
+
+        return 501, {"code": 12, "message": f"Not Implemented: {path}"}
+
+    def start(self) -> "MockNodeServer":
+        """Start serving in a background thread."""
+        self.stopping.clear()
+        self._httpd = ThreadingHTTPServer((self.host, self.port), _MockNodeHandler)
+        self._httpd.daemon_threads = True
+        self._httpd.node = self
+        self.port = self._httpd.server_address[1]
+
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+        )
+        self._thread.start()
+        logger.info(f"Mock node listening on {self.url}")
+        return self
+
+    def stop(self) -> None:
+        """Stop the server and wait for its thread to exit."""
+        self.stopping.set()
+        if self._producer is not None:
+            self._producer.join()
+            self._producer = None
+        if self._httpd is not None:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._thread.join()
+            self._httpd = None
+
+    def __enter__(self) -> "MockNodeServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
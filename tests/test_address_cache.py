@@ -0,0 +1,104 @@
+"""
+Test cases for the persistent keyring address cache.
+"""
+
+import pytest
+import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from address_cache import AddressCache
+from injective_cli import InjectiveCLI
+
+
+logger = logging.getLogger(__name__)
+
+
+def _put_from_worker(cache_file: str, keyring_dir: str, key_name: str) -> None:
+    AddressCache(cache_file, keyring_dir, "test").put(key_name, f"inj1{key_name}")
+
+
+@pytest.fixture
+def keyring(tmp_path):
+    """
+    Provide a keyring directory and a cache file next to it.
+    """
+    keyring_dir = tmp_path / "keyring-test"
+    keyring_dir.mkdir()
+    return str(keyring_dir), str(tmp_path / "addresses.json")
+
+
+@pytest.mark.client
+class TestAddressCache:
+    """Test address caching and invalidation."""
+
+    def test_shared_between_instances(self, keyring):
+        """
+        Test: Verify an address stored by one cache instance is found by another
+        """
+        keyring_dir, cache_file = keyring
+        AddressCache(cache_file, keyring_dir, "test").put("val", "inj1val")
+
+        assert AddressCache(cache_file, keyring_dir, "test").get("val") == "inj1val"
+        assert AddressCache(cache_file, keyring_dir, "file").get("val") is None
+
+    def test_keyring_change_invalidates(self, keyring):
+        """
+        Test: Verify changing the keyring directory drops its cached addresses
+        """
+        keyring_dir, cache_file = keyring
+        cache = AddressCache(cache_file, keyring_dir, "test")
+        cache.put("val", "inj1val")
+
+        # Adding a key changes the directory's mtime
+        stat = os.stat(keyring_dir)
+        os.utime(keyring_dir, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert cache.get("val") is None
+
+    def test_missing_keyring_or_disabled_is_not_cached(self, keyring, tmp_path):
+        """
+        Test: Verify nothing is cached without a keyring directory or with caching disabled
+        """
+        keyring_dir, cache_file = keyring
+        missing = AddressCache(cache_file, str(tmp_path / "nowhere"), "test")
+        missing.put("val", "inj1val")
+        disabled = AddressCache("", keyring_dir, "test")
+        disabled.put("val", "inj1val")
+
+        assert missing.get("val") is None
+        assert disabled.get("val") is None
+        assert not os.path.exists(cache_file)
+
+    def test_concurrent_writers_keep_all_entries(self, keyring):
+        """
+        Test: Verify writes from several processes are merged, not lost
+        """
+        keyring_dir, cache_file = keyring
+        keys = [f"key{i}" for i in range(8)]
+
+        with ProcessPoolExecutor(max_workers=4) as executor:
+            list(executor.map(_put_from_worker, [cache_file] * 8, [keyring_dir] * 8, keys))
+
+        cache = AddressCache(cache_file, keyring_dir, "test")
+        assert all(cache.get(key) == f"inj1{key}" for key in keys)
+
+    def test_get_account_info_spawns_once(self, keyring, fake_binary, tmp_path):
+        """
+        Test: Verify a warm lookup needs no process and takes microseconds
+        """
+        keyring_dir, cache_file = keyring
+        binary = fake_binary(output={"output": "inj1cached"})
+
+        cold = InjectiveCLI(binary_path=binary, address_cache=AddressCache(cache_file, keyring_dir, "test"))
+        assert cold.get_account_info("val") == {"output": "inj1cached"}
+
+        warm = InjectiveCLI(binary_path=binary, address_cache=AddressCache(cache_file, keyring_dir, "test"))
+        warm.get_account_info("val")
+        start = time.perf_counter()
+        for _ in range(100):
+            assert warm.get_account_info("val") == {"output": "inj1cached"}
+
+        assert (time.perf_counter() - start) / 100 < 0.001
+        assert len(list(tmp_path.glob("pid.*"))) == 1
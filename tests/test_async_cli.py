@@ -0,0 +1,130 @@
+"""
+Test cases for the asyncio CLI client - bounded concurrency, timeouts and cancellation.
+"""
+
+import pytest
+import asyncio
+import logging
+import os
+import time
+
+import async_market_utils
+from async_cli import AsyncInjectiveCLI
+from async_market_utils import AsyncMarketUtils, create_test_market
+from block_waiter import BlockWaiter
+from injective_cli import InjectiveCLIError
+from query_transport import RestQueryTransport
+
+
+logger = logging.getLogger(__name__)
+
+
+class TestAsyncCLI:
+    """Test suite for AsyncInjectiveCLI."""
+
+    @pytest.mark.client
+    @pytest.mark.asyncio
+    async def test_queries_overlap_up_to_limit(self, fake_binary):
+        """
+        Test: Verify independent queries run concurrently, bounded by the semaphore.
+        """
+        binary = fake_binary(0.5)
+
+        cli = AsyncInjectiveCLI(binary_path=binary, max_concurrency=4)
+        start = time.monotonic()
+        heights = await asyncio.gather(*[cli.get_latest_block_height() for _ in range(4)])
+        parallel_elapsed = time.monotonic() - start
+
+        assert heights == [42] * 4
+        assert parallel_elapsed < 1.5, f"4 calls with limit 4 should overlap, took {parallel_elapsed:.2f}s"
+
+        serial_cli = AsyncInjectiveCLI(binary_path=binary, max_concurrency=1)
+        start = time.monotonic()
+        await asyncio.gather(*[serial_cli.get_latest_block_height() for _ in range(3)])
+        serial_elapsed = time.monotonic() - start
+
+        assert serial_elapsed >= 1.5, f"Limit 1 should serialize calls, took {serial_elapsed:.2f}s"
+
+    @pytest.mark.client
+    @pytest.mark.asyncio
+    async def test_per_call_timeout(self, fake_binary):
+        """
+        Test: Verify a per-call timeout aborts a hung command.
+        """
+        cli = AsyncInjectiveCLI(binary_path=fake_binary(10))
+
+        start = time.monotonic()
+        with pytest.raises(InjectiveCLIError, match="timed out"):
+            await cli._run_command(["query", "block"], retry_count=1, timeout=0.3)
+
+        assert time.monotonic() - start < 5
+
+    @pytest.mark.client
+    @pytest.mark.asyncio
+    async def test_cancellation_kills_process(self, fake_binary, tmp_path):
+        """
+        Test: Verify cancelling a call kills the spawned process.
+        """
+        cli = AsyncInjectiveCLI(binary_path=fake_binary(10))
+
+        task = asyncio.create_task(cli.get_latest_block_height())
+        await asyncio.sleep(0.3)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        pid_files = list(tmp_path.glob("pid.*"))
+        assert len(pid_files) == 1
+        pid = int(pid_files[0].read_text())
+        with pytest.raises(ProcessLookupError):
+            os.kill(pid, 0)
+
+    @pytest.mark.client
+    @pytest.mark.asyncio
+    async def test_async_market_utils_over_transport(self, mock_node, monkeypatch):
+        """
+        Test: Verify async MarketUtils helpers can verify many markets concurrently.
+        """
+        for i in range(5):
+            mock_node.add_market(f"0x{i}", f"T{i}/USDT PERP", rmr="0.100000000000000000")
+
+        transport = RestQueryTransport(mock_node.url)
+        cli = AsyncInjectiveCLI(binary_path="/nonexistent/injectived", transport=transport)
+        monkeypatch.setattr(async_market_utils, "async_cli", cli)
+
+        results = await asyncio.gather(
+            *[AsyncMarketUtils.verify_rmr_value(f"0x{i}", 0.10) for i in range(5)]
+        )
+        assert all(results)
+
+        market = await AsyncMarketUtils.get_market_by_ticker("T3/USDT PERP")
+        assert market["market"]["market_id"] == "0x3"
+        transport.close()
+
+    @pytest.mark.client
+    @pytest.mark.asyncio
+    async def test_async_flows_wait_for_inclusion(self, mock_node, monkeypatch, tmp_path, mock_binary):
+        """
+        Test: Verify async market creation and RMR updates track their txs to inclusion.
+        """
+        monkeypatch.setenv("MOCK_INJECTIVE_STATE_FILE", str(tmp_path / "state.json"))
+        monkeypatch.setenv("TX_POLL_INTERVAL", "0.05")
+        mock_node.start_producing(0.05)
+        cli = AsyncInjectiveCLI(binary_path=mock_binary, block_waiter=BlockWaiter(mock_node.node_url))
+        commands = []
+        run_command = cli._run_command
+
+        async def recording_run_command(cmd, retry_count=None, timeout=None):
+            commands.append(cmd)
+            return await run_command(cmd, retry_count, timeout)
+
+        cli._run_command = recording_run_command
+        monkeypatch.setattr(async_market_utils, "async_cli", cli)
+
+        market_id = await create_test_market("ASYNC/USDT PERP", rmr=0.1, timeout=60)
+        assert await AsyncMarketUtils.update_market_rmr(market_id, 0.15)
+
+        tx_hashes = [cmd[2] for cmd in commands if cmd[:2] == ["query", "tx"]]
+        # Submission, vote and update were each looked up before use
+        assert len(set(tx_hashes)) >= 3
+        assert not any(cmd[:2] == ["query", "block"] for cmd in commands)
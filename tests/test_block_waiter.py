@@ -0,0 +1,98 @@
+"""
+Test cases for event-driven block waiting over the Tendermint RPC websocket.
+"""
+
+import pytest
+import logging
+import time
+
+from block_waiter import BlockWaiter, BlockWaitTimeout, rpc_http_url
+from injective_cli import InjectiveCLI, InjectiveCLIError
+from tendermint_ws import TendermintWebSocket, WebSocketError
+
+
+logger = logging.getLogger(__name__)
+
+
+class TestBlockWaiter:
+    """Test suite for NewBlock-driven waiting."""
+
+    @pytest.mark.client
+    def test_returns_as_soon_as_height_reached(self, mock_node):
+        """
+        Test: Verify waiting follows NewBlock events rather than a fixed block time.
+        """
+        mock_node.start_producing(0.1)
+        # A huge poll interval proves the websocket path, not polling, did the work
+        waiter = BlockWaiter(mock_node.node_url, poll_interval=60)
+
+        start_height = waiter.current_height()
+        start = time.monotonic()
+        height = waiter.wait_for_height(start_height + 3, timeout=5)
+
+        assert height == start_height + 3
+        assert time.monotonic() - start < 2
+
+    @pytest.mark.client
+    def test_cli_wait_returns_observed_height(self, mock_node):
+        """
+        Test: Verify InjectiveCLI.wait_for_next_block returns the height it observed.
+        """
+        mock_node.start_producing(0.1)
+        cli = InjectiveCLI(block_waiter=BlockWaiter(mock_node.node_url))
+
+        before = mock_node.height
+        height = cli.wait_for_next_block(2, timeout=5)
+
+        assert height >= before + 2
+
+    @pytest.mark.client
+    def test_fragmented_events_reassembled(self, mock_node):
+        """
+        Test: Verify NewBlock events split into fragments, with pings between them, are reassembled.
+        """
+        mock_node.ws_fragment_size = 16
+        mock_node.start_producing(0.1)
+        waiter = BlockWaiter(mock_node.node_url, poll_interval=60)
+
+        start_height = waiter.current_height()
+        height = waiter.wait_for_height(start_height + 2, timeout=5)
+
+        assert height == start_height + 2
+
+    @pytest.mark.client
+    def test_falls_back_to_status_polling(self, mock_node, monkeypatch):
+        """
+        Test: Verify /status polling takes over when the websocket is unavailable.
+        """
+        def refuse(self):
+            raise WebSocketError("websocket disabled")
+
+        monkeypatch.setattr(TendermintWebSocket, "connect", refuse)
+        mock_node.start_producing(0.1)
+        waiter = BlockWaiter(mock_node.node_url, poll_interval=0.05)
+
+        start_height = waiter.current_height()
+        assert waiter.wait_for_height(start_height + 2, timeout=5) >= start_height + 2
+        assert mock_node.subscriber_count == 0
+
+    @pytest.mark.client
+    def test_stalled_chain_times_out(self, mock_node):
+        """
+        Test: Verify a stalled chain raises instead of waiting forever.
+        """
+        waiter = BlockWaiter(mock_node.node_url)
+        with pytest.raises(BlockWaitTimeout):
+            waiter.wait_for_height(mock_node.height + 1, timeout=0.3)
+
+        cli = InjectiveCLI(block_waiter=waiter)
+        with pytest.raises(InjectiveCLIError, match="not reached"):
+            cli.wait_for_next_block(1, timeout=0.3)
+
+    @pytest.mark.client
+    def test_rpc_url_conversion(self):
+        """
+        Test: Verify CLI --node addresses map to HTTP RPC URLs.
+        """
+        assert rpc_http_url("tcp://localhost:26657") == "http://localhost:26657"
+        assert rpc_http_url("http://node:26657/") == "http://node:26657"
@@ -0,0 +1,99 @@
+"""
+Test cases for verifying the RMR of many markets with one query.
+"""
+
+import pytest
+import asyncio
+import json
+import logging
+
+import async_market_utils
+import market_utils
+from async_cli import AsyncInjectiveCLI
+from async_market_utils import AsyncMarketUtils
+from injective_cli import InjectiveCLI
+from market_utils import MarketUtils
+from query_transport import RestQueryTransport
+
+
+logger = logging.getLogger(__name__)
+
+
+@pytest.mark.client
+@pytest.mark.rest_markets(20)
+class TestBulkRMRVerification:
+    """Test MarketUtils.verify_rmr_values."""
+
+    def test_one_request_for_many_markets(self, rest_cli, mock_node):
+        """
+        Test: Verify matching markets produce an empty report from a single request
+        """
+        mock_node.markets["0x07"]["reduce_margin_ratio"] = "0.250000000000000000"
+
+        mismatches = MarketUtils.verify_rmr_values({"0x02": 0.1, "0x07": 0.25, "0x15": 0.1})
+
+        assert mismatches == {}
+        assert mock_node.request_count == 1
+
+    def test_reports_each_mismatch(self, rest_cli, mock_node):
+        """
+        Test: Verify wrong, missing and unparseable values are each reported
+        """
+        mock_node.markets["0x03"]["reduce_margin_ratio"] = "not-a-number"
+
+        mismatches = MarketUtils.verify_rmr_values({"0x01": 0.2, "0x02": 0.1, "0x03": 0.1, "0xmissing": 0.1})
+
+        assert set(mismatches) == {"0x01", "0x03", "0xmissing"}
+        assert mismatches["0x01"] == {"expected": "0.200000", "actual": "0.100000000000000000",
+                                      "error": "RMR mismatch"}
+        assert "unparseable" in mismatches["0x03"]["error"]
+        assert mismatches["0xmissing"]["error"] == "market not found"
+
+    def test_exact_decimal_comparison(self, rest_cli, mock_node):
+        """
+        Test: Verify a difference within the float tolerance is still a mismatch
+        """
+        mock_node.markets["0x04"]["reduce_margin_ratio"] = "0.100000500000000000"
+        mock_node.markets["0x05"]["reduce_margin_ratio"] = "0.100001000000000000"
+
+        assert MarketUtils.verify_rmr_value("0x04", 0.1)
+        assert MarketUtils.verify_rmr_values({"0x04": 0.1})["0x04"]["actual"] == "0.100000500000000000"
+        # Expected values are quantized like update_market_rmr submits them
+        assert MarketUtils.verify_rmr_values({"0x05": 0.1000019}) == {}
+
+    def test_cli_stops_once_all_found(self, tmp_path, monkeypatch, mock_binary):
+        """
+        Test: Verify injectived is paged only until every requested market is found
+        """
+        state_file = tmp_path / "state.json"
+        markets = {
+            f"market_{i}": {"market_id": f"market_{i}", "ticker": f"C{i}/USDT",
+                            "reduce_margin_ratio": "0.100000000000000000"}
+            for i in range(9)
+        }
+        state_file.write_text(json.dumps({"markets": markets}))
+        monkeypatch.setenv("MOCK_INJECTIVE_STATE_FILE", str(state_file))
+        monkeypatch.setenv("MARKETS_PAGE_LIMIT", "3")
+        client = InjectiveCLI(binary_path=mock_binary)
+        commands = []
+        run_command = client._run_command
+        client._run_command = lambda cmd, retry_count=None: commands.append(cmd) or run_command(cmd, retry_count)
+        monkeypatch.setattr(market_utils, "cli", client)
+
+        assert MarketUtils.verify_rmr_values({"market_1": 0.1, "market_4": 0.1}) == {}
+        assert [cmd[-1] for cmd in commands if "perpetual-markets" in cmd] == ["0", "3"]
+
+    def test_async_verify(self, mock_node, monkeypatch):
+        """
+        Test: Verify the async helper reports mismatches from a single request
+        """
+        for i in range(5):
+            mock_node.add_market(f"0x{i}", f"A{i}/USDT PERP")
+        client = AsyncInjectiveCLI(binary_path="/nonexistent/injectived",
+                                   transport=RestQueryTransport(mock_node.url))
+        monkeypatch.setattr(async_market_utils, "async_cli", client)
+
+        mismatches = asyncio.run(AsyncMarketUtils.verify_rmr_values({"0x1": 0.1, "0x3": 0.3}))
+
+        assert list(mismatches) == ["0x3"]
+        assert mock_node.request_count == 1
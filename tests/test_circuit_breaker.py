@@ -0,0 +1,192 @@
+"""
+Test cases for the node circuit breaker - failing fast while the node is down and recovering after.
+"""
+
+import pytest
+import logging
+
+from circuit_breaker import CircuitBreaker, ALLOW, PROBE, REJECT, CLOSED, OPEN, is_connection_failure
+from injective_cli import InjectiveCLI, InjectiveCLIError, CircuitOpenError
+from retry_policy import RetryPolicy, RetryBudget
+
+
+logger = logging.getLogger(__name__)
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _attempts(tmp_path) -> int:
+    return len(list(tmp_path.glob("pid.*")))
+
+
+class TestCircuitBreaker:
+    """Test suite for the CircuitBreaker state machine."""
+
+    @pytest.mark.client
+    def test_opens_after_threshold_and_probes_after_reset(self):
+        """
+        Test: Verify closed -> open -> half-open -> closed transitions.
+        """
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=3, reset_timeout=10, clock=clock)
+
+        for _ in range(2):
+            breaker.record_failure()
+        assert breaker.acquire() == ALLOW
+
+        breaker.record_failure()
+        assert breaker.state == OPEN
+        assert breaker.acquire() == REJECT
+
+        clock.now = 10
+        assert breaker.acquire() == PROBE
+        assert breaker.acquire() == REJECT, "Only one probe at a time"
+
+        breaker.record_success()
+        assert breaker.state == CLOSED
+        assert breaker.acquire() == ALLOW
+
+    @pytest.mark.client
+    def test_failed_probe_reopens(self):
+        """
+        Test: Verify a failed probe re-opens the circuit for another reset period.
+        """
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10, clock=clock)
+
+        breaker.record_failure()
+        clock.now = 10
+        assert breaker.acquire() == PROBE
+
+        breaker.record_failure()
+        assert breaker.state == OPEN
+        assert breaker.retry_in() == 10
+
+    @pytest.mark.client
+    def test_success_resets_count(self):
+        """
+        Test: Verify only consecutive failures count toward the threshold.
+        """
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=10)
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+        assert breaker.state == CLOSED
+
+    @pytest.mark.client
+    @pytest.mark.parametrize("error,expected", [
+        ("Error: post failed: Post \"http://localhost:26657\": dial tcp: connection refused", True),
+        ("Command timed out after 300 seconds", True),
+        ("rpc error: code = Unavailable desc = transport is closing", True),
+        ("Error: testcandidate.info: key not found", False),
+        ("invalid reduce margin ratio", False),
+    ])
+    def test_connection_failure_classification(self, error, expected):
+        """
+        Test: Verify only unreachable-node errors count as breaker failures.
+        """
+        assert is_connection_failure(error) is expected
+
+
+class TestCLICircuitBreaker:
+    """Test suite for the circuit breaker inside InjectiveCLI."""
+
+    def _cli(self, binary, clock):
+        return InjectiveCLI(
+            binary_path=binary,
+            retry_policy=RetryPolicy(base_delay=0.01),
+            retry_budget=RetryBudget(100),
+            circuit_breaker=CircuitBreaker(failure_threshold=3, reset_timeout=30, clock=clock),
+        )
+
+    @pytest.mark.client
+    def test_fails_fast_while_open(self, fake_binary, tmp_path):
+        """
+        Test: Verify once the node is known down, calls fail without spawning injectived.
+        """
+        clock = FakeClock()
+        cli = self._cli(fake_binary(returncode=1, stderr="dial tcp: connection refused"), clock)
+
+        with pytest.raises(InjectiveCLIError, match="connection refused"):
+            cli.get_latest_block_height()
+        assert _attempts(tmp_path) == 3
+        assert cli.circuit_breaker.is_open
+
+        with pytest.raises(CircuitOpenError, match="circuit open after 3"):
+            cli.query_proposal("1", use_cache=False)
+        assert _attempts(tmp_path) == 3, "Open circuit must not spawn injectived"
+
+    @pytest.mark.client
+    def test_permanent_errors_do_not_trip(self, fake_binary):
+        """
+        Test: Verify deterministic errors from a reachable node leave the circuit closed.
+        """
+        cli = self._cli(fake_binary(returncode=1, stderr="market not found"), FakeClock())
+
+        for _ in range(5):
+            with pytest.raises(InjectiveCLIError):
+                cli.query_market("0xabc", use_cache=False)
+
+        assert not cli.circuit_breaker.is_open
+
+    @pytest.mark.client
+    def test_node_answer_resets_failures(self, fake_binary):
+        """
+        Test: Verify an error answered by the node clears earlier consecutive connection failures.
+        """
+        cli = self._cli(fake_binary(returncode=1, stderr="connection refused"), FakeClock())
+        with pytest.raises(InjectiveCLIError):
+            cli._run_command(["query", "exchange", "perpetual-market-info", "0xabc"], retry_count=2)
+        assert cli.circuit_breaker.consecutive_failures == 2
+
+        fake_binary(returncode=1, stderr="market not found")
+        with pytest.raises(InjectiveCLIError):
+            cli.query_market("0xabc", use_cache=False)
+
+        assert cli.circuit_breaker.consecutive_failures == 0
+
+    @pytest.mark.client
+    def test_half_open_probe_recovers(self, fake_binary, tmp_path):
+        """
+        Test: Verify a successful probe via get_latest_block_height closes the circuit.
+        """
+        clock = FakeClock()
+        cli = self._cli(fake_binary(returncode=1, stderr="connection refused"), clock)
+
+        with pytest.raises(InjectiveCLIError):
+            cli.get_latest_block_height()
+        assert cli.circuit_breaker.is_open
+
+        # Node comes back; the probe and then the real call succeed
+        fake_binary(output={"block": {"header": {"height": "77"}}})
+        clock.now = 30
+
+        assert cli.get_latest_block_height() == 77
+        assert not cli.circuit_breaker.is_open
+        assert _attempts(tmp_path) == 3 + 2
+
+    @pytest.mark.client
+    def test_failed_probe_raises_circuit_open(self, fake_binary, tmp_path):
+        """
+        Test: Verify a probe against a still-down node fails fast and re-opens.
+        """
+        clock = FakeClock()
+        cli = self._cli(fake_binary(returncode=1, stderr="connection refused"), clock)
+
+        with pytest.raises(InjectiveCLIError):
+            cli.get_latest_block_height()
+
+        clock.now = 30
+        with pytest.raises(CircuitOpenError, match="still unreachable"):
+            cli.query_proposal("1", use_cache=False)
+
+        assert _attempts(tmp_path) == 4, "Only the single probe attempt should run"
+        assert cli.circuit_breaker.is_open
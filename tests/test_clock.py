@@ -0,0 +1,97 @@
+"""
+Test cases for the injectable clock behind every sleep and timeout.
+"""
+
+import pytest
+import logging
+import os
+import time
+from pathlib import Path
+
+from block_waiter import BlockWaiter
+from circuit_breaker import CircuitBreaker
+from clock import SystemClock, VirtualClock, current_clock, set_clock
+from deadline import Deadline
+from injective_cli import InjectiveCLI
+from tests import conftest
+
+
+logger = logging.getLogger(__name__)
+
+
+@pytest.fixture
+def virtual_clock():
+    """
+    Install a fresh VirtualClock for one test, restoring the session clock afterwards.
+    """
+    clock = VirtualClock()
+    previous = set_clock(clock)
+    yield clock
+    set_clock(previous)
+
+
+@pytest.mark.client
+class TestClock:
+    """Test virtual time and the code that sleeps and times out on it."""
+
+    def test_virtual_sleep_advances_instantly(self, virtual_clock):
+        """
+        Test: Verify a virtual sleep moves wall and monotonic time forward without blocking
+        """
+        start, wall = time.monotonic(), virtual_clock.time()
+        virtual_clock.sleep(3600)
+
+        assert time.monotonic() - start < 0.5
+        assert virtual_clock.time() - wall >= 3600
+        assert virtual_clock.slept == 3600 and virtual_clock.sleeps == 1
+
+    def test_deadlines_and_breaker_follow_installed_clock(self, virtual_clock):
+        """
+        Test: Verify deadlines and the circuit breaker time out on virtual time
+        """
+        deadline = Deadline(10)
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30)
+        breaker.record_failure()
+
+        virtual_clock.sleep(10)
+
+        assert deadline.expired()
+        assert breaker.retry_in() == pytest.approx(20, abs=0.5)
+
+    def test_block_wait_fallback_does_not_block(self, virtual_clock, tmp_path, monkeypatch, mock_binary):
+        """
+        Test: Verify the mock CLI's block-time fallback sleeps on the virtual clock
+        """
+        monkeypatch.setenv("MOCK_INJECTIVE_STATE_FILE", str(tmp_path / "state.json"))
+        client = InjectiveCLI(binary_path=mock_binary, block_waiter=BlockWaiter("http://127.0.0.1:9"))
+
+        start = time.monotonic()
+        client.wait_for_next_block(blocks=5)
+
+        assert time.monotonic() - start < 5
+        assert virtual_clock.slept == 15
+
+    def test_auto_clock_is_virtual_against_mock(self, monkeypatch, mock_binary):
+        """
+        Test: Verify "auto" picks virtual time only when injectived resolves to the mock
+        """
+        monkeypatch.setenv("CLOCK", "auto")
+        monkeypatch.setenv("PATH", f"{os.path.dirname(mock_binary)}{os.pathsep}{os.environ['PATH']}")
+        assert isinstance(conftest._session_clock(), VirtualClock)
+
+        monkeypatch.setenv("PATH", str(Path(__file__).parent))
+        assert type(conftest._session_clock()) is SystemClock
+
+        monkeypatch.setenv("CLOCK", "virtual")
+        assert isinstance(conftest._session_clock(), VirtualClock)
+
+    def test_set_clock_returns_previous(self):
+        """
+        Test: Verify installing a clock hands back the one it replaced
+        """
+        session_clock = current_clock()
+        clock = VirtualClock()
+
+        assert set_clock(clock) is session_clock
+        assert set_clock(session_clock) is clock
+        assert current_clock() is session_clock
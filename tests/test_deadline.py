@@ -0,0 +1,151 @@
+"""
+Test cases for deadline propagation - hard latency ceilings for multi-step flows.
+"""
+
+import pytest
+import logging
+import time
+
+import market_utils
+from address_cache import AddressCache
+from deadline import Deadline, deadline_scope, current_deadline
+from injective_cli import InjectiveCLI, InjectiveCLIError, DeadlineExceeded
+from market_utils import MarketUtils, create_test_market
+from retry_policy import RetryPolicy, RetryBudget
+
+
+logger = logging.getLogger(__name__)
+
+
+class TestDeadlineScope:
+    """Test suite for Deadline and deadline_scope."""
+
+    @pytest.mark.client
+    def test_nested_scopes_only_shorten(self):
+        """
+        Test: Verify an inner scope cannot extend the enclosing deadline.
+        """
+        assert current_deadline() is None
+
+        with deadline_scope(10) as outer:
+            with deadline_scope(100) as inner:
+                assert inner is outer
+            with deadline_scope(1) as shorter:
+                assert shorter.remaining() <= 1
+                assert current_deadline() is shorter
+            assert current_deadline() is outer
+
+        assert current_deadline() is None
+
+    @pytest.mark.client
+    def test_explicit_deadline_handoff(self):
+        """
+        Test: Verify a deadline handed down explicitly applies alongside the timeout.
+        """
+        parent = Deadline(0.5)
+        with deadline_scope(60, parent) as effective:
+            assert effective is parent
+        with deadline_scope(deadline=parent) as effective:
+            assert effective is parent
+
+
+class TestCLIDeadlines:
+    """Test suite for deadline clipping inside InjectiveCLI."""
+
+    @pytest.mark.client
+    def test_subprocess_timeout_clipped(self, fake_binary):
+        """
+        Test: Verify a hung command is killed at the deadline, not at config.test_timeout.
+        """
+        cli = InjectiveCLI(binary_path=fake_binary(delay=10), retry_budget=RetryBudget(10),
+                           address_cache=AddressCache(path=""))
+
+        start = time.monotonic()
+        with deadline_scope(0.5):
+            with pytest.raises(DeadlineExceeded):
+                cli.get_account_info("val")
+
+        assert time.monotonic() - start < 2
+        assert not cli.circuit_breaker.is_open
+        assert cli.circuit_breaker.consecutive_failures == 0, "Own deadline is not a node failure"
+
+    @pytest.mark.client
+    def test_retry_backoff_clipped(self, fake_binary, tmp_path):
+        """
+        Test: Verify retry sleeps stop at the deadline.
+        """
+        binary = fake_binary(returncode=1, stderr="connection refused")
+        cli = InjectiveCLI(binary_path=binary, retry_policy=RetryPolicy(base_delay=30, max_delay=30),
+                           retry_budget=RetryBudget(10))
+
+        start = time.monotonic()
+        with deadline_scope(0.5):
+            with pytest.raises(DeadlineExceeded):
+                # Full jitter could draw a tiny delay; keep retrying until the clip bites
+                cli._run_command(["query", "block"], retry_count=50)
+
+        assert time.monotonic() - start < 2
+
+    @pytest.mark.client
+    def test_expired_deadline_fails_before_spawning(self, fake_binary, tmp_path):
+        """
+        Test: Verify no command is started once the deadline has passed.
+        """
+        cli = InjectiveCLI(binary_path=fake_binary())
+
+        with deadline_scope(0):
+            with pytest.raises(DeadlineExceeded):
+                cli.get_latest_block_height()
+
+        assert not list(tmp_path.glob("pid.*"))
+
+    @pytest.mark.client
+    def test_proposal_flow_ceiling(self, fake_binary, monkeypatch):
+        """
+        Test: Verify submit_and_pass_proposal gives up at its timeout even while every call succeeds.
+        """
+        # One canned response serves every command: the proposal never leaves its voting period
+        binary = fake_binary(output={
+            "code": 0,
+            "events": [{"type": "submit_proposal", "attributes": [{"key": "proposal_id", "value": "1"}]}],
+            "proposal": {"status": "PROPOSAL_STATUS_VOTING_PERIOD"},
+        })
+        monkeypatch.setattr(market_utils, "cli", InjectiveCLI(binary_path=binary))
+
+        start = time.monotonic()
+        with pytest.raises(InjectiveCLIError):
+            MarketUtils.submit_and_pass_proposal("{}", timeout=2)
+
+        assert time.monotonic() - start < 3
+
+    @pytest.mark.client
+    def test_parallel_encodes_follow_deadline(self, fake_binary):
+        """
+        Test: Verify txs encoded on worker threads are still killed at the caller's deadline.
+        """
+        cli = InjectiveCLI(binary_path=fake_binary(delay=10), retry_budget=RetryBudget(10))
+
+        start = time.monotonic()
+        with deadline_scope(0.5):
+            with pytest.raises(DeadlineExceeded):
+                cli.encode_txs([{"body": {"messages": []}}] * 2)
+
+        assert time.monotonic() - start < 2
+
+    @pytest.mark.client
+    def test_create_test_market_keeps_its_budget(self, monkeypatch):
+        """
+        Test: Verify create_test_market gives the proposal flow its whole timeout, not the flow's default.
+        """
+        class SlowGovChain:
+            def query_gov_params(self):
+                return {"params": {"voting_period": "90s"}}
+
+            def create_market_proposal(self, proposal_json, from_key):
+                raise InjectiveCLIError("submitted")
+
+        monkeypatch.setattr(market_utils, "cli", SlowGovChain())
+
+        # A 90s voting period fits in 120s; the inner 60s default used to reject it
+        with pytest.raises(InjectiveCLIError, match="submitted"):
+            create_test_market("BUDGET/USDT PERP", rmr=0.1, timeout=120)
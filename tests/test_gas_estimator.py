@@ -0,0 +1,138 @@
+"""
+Test cases for the gas estimation cache.
+"""
+
+import pytest
+import json
+import logging
+
+from gas_estimator import GasEstimator, gas_key
+
+
+logger = logging.getLogger(__name__)
+
+VOTE_CMD = ["tx", "gov", "vote", "1", "yes", "--from", "val"]
+
+
+@pytest.mark.client
+class TestGasEstimator:
+    """Test gas keys and cached limits."""
+
+    def test_gas_key_by_type_and_size(self, tmp_path):
+        """
+        Test: Verify txs are keyed by message type and proposal size bucket
+        """
+        small, large = tmp_path / "small.json", tmp_path / "large.json"
+        small.write_text("{}" * 10)
+        large.write_text("{}" * 1000)
+
+        assert gas_key(VOTE_CMD)[0] == "gov vote"
+        assert gas_key(VOTE_CMD) == gas_key(["tx", "gov", "vote", "2", "no", "--from", "val"])
+        assert (gas_key(["tx", "gov", "submit-proposal", str(small), "--from", "val"])
+                != gas_key(["tx", "gov", "submit-proposal", str(large), "--from", "val"]))
+
+    def test_simulates_until_enough_samples(self):
+        """
+        Test: Verify --gas auto is used until enough measurements, then the adjusted maximum
+        """
+        estimator = GasEstimator(adjustment=1.5, samples=2)
+        key = gas_key(VOTE_CMD)
+
+        assert estimator.gas_args(key)[:2] == ["--gas", "auto"]
+        estimator.record(key, 1000)
+        assert estimator.estimate(key) is None
+        estimator.record(key, 1200)
+
+        assert estimator.gas_args(key)[:2] == ["--gas", "1800"]
+        assert estimator.simulations == 1
+
+    def test_keeps_recent_samples_and_resets(self):
+        """
+        Test: Verify only recent measurements count and a reset forces simulation
+        """
+        estimator = GasEstimator(adjustment=1.0, samples=2)
+        key = gas_key(VOTE_CMD)
+        for gas_used in (5000, 1000, 1100):
+            estimator.record(key, gas_used)
+
+        assert estimator.estimate(key) == 1100
+
+        estimator.reset(key)
+        assert estimator.estimate(key) is None
+
+    def test_gas_prices_added(self, monkeypatch):
+        """
+        Test: Verify fees are requested through --gas-prices when configured
+        """
+        monkeypatch.setenv("GAS_PRICES", "500000000inj")
+
+        assert GasEstimator().gas_args(gas_key(VOTE_CMD))[-2:] == ["--gas-prices", "500000000inj"]
+
+
+@pytest.mark.client
+class TestCliGasEstimation:
+    """Test gas estimation in InjectiveCLI tx methods against the mock chain."""
+
+    def test_steady_state_skips_simulation(self, mock_chain):
+        """
+        Test: Verify included txs feed the cache and later txs skip simulation
+        """
+        estimator = GasEstimator(adjustment=1.3, samples=2)
+        client = mock_chain
+        client.gas_estimator = estimator
+
+        for proposal_id in ("1", "2", "3", "4"):
+            result = client.vote_proposal(proposal_id, "yes", "val")
+            assert client.wait_for_tx(result["txhash"])["code"] == 0
+
+        assert estimator.simulations == 2
+        assert estimator.estimate(gas_key(VOTE_CMD)) == 78000  # 60000 gas used * 1.3
+
+    def test_out_of_gas_resimulates(self, mock_chain):
+        """
+        Test: Verify a tx that runs out of gas on a cached limit is resent with a fresh simulation
+        """
+        estimator = GasEstimator(adjustment=1.3, samples=2)
+        key = gas_key(VOTE_CMD)
+        estimator.record(key, 10000)
+        estimator.record(key, 10000)
+        client = mock_chain
+        client.gas_estimator = estimator
+
+        result = client.vote_proposal("1", "yes", "val")
+
+        assert result["code"] == 0
+        assert estimator.simulations == 1
+        assert client.wait_for_tx(result["txhash"])["gas_used"] == "60000"
+
+    def test_exec_batches_keyed_by_message_count(self, mock_chain, tmp_path):
+        """
+        Test: Verify 1-message and many-message authz execs never share a cached gas limit
+        """
+        estimator = GasEstimator(adjustment=1.3, samples=1)
+        client = mock_chain
+        client.gas_estimator = estimator
+        voter = client.get_account_info("val")["output"]
+        grantee = client.add_key("exec_grantee")
+        grant = client.grant_authz("val", [grantee], "/cosmos.gov.v1.MsgVote")
+        assert client.wait_for_tx(grant["txhash"])["code"] == 0
+
+        def votes(count):
+            messages = [{"@type": "/cosmos.gov.v1.MsgVote", "voter": voter, "proposal_id": str(i),
+                         "option": "yes"} for i in range(count)]
+            return {"body": {"messages": messages, "memo": ""},
+                    "auth_info": {"signer_infos": [], "fee": {"amount": [], "gas_limit": "200000"}},
+                    "signatures": []}
+
+        simulations = estimator.simulations
+        for count in (1, 20, 1, 20):
+            result = client.exec_authz(votes(count), "exec_grantee")
+            assert client.wait_for_tx(result["txhash"])["code"] == 0
+
+        # One simulation per size; a shared limit would run the large exec out of gas
+        assert estimator.simulations - simulations == 2
+        one, twenty = tmp_path / "one.json", tmp_path / "twenty.json"
+        one.write_text(json.dumps(votes(1)))
+        twenty.write_text(json.dumps(votes(20)))
+        assert (gas_key(["tx", "authz", "exec", str(one), "--from", "exec_grantee"])
+                != gas_key(["tx", "authz", "exec", str(twenty), "--from", "exec_grantee"]))
@@ -0,0 +1,164 @@
+"""
+Test cases for governance timing - gov params, voting end times and polling schedule.
+"""
+
+import pytest
+import logging
+from datetime import datetime, timezone
+
+import market_utils
+from clock import current_clock
+from gov_schedule import GovParams, parse_duration, parse_timestamp, poll_delay
+from injective_cli import InjectiveCLI, InjectiveCLIError
+from market_utils import MarketUtils
+
+
+logger = logging.getLogger(__name__)
+
+
+class VotingChain:
+    """
+    Minimal chain whose proposals pass in the first block after voting_end_time.
+
+    Stands in for InjectiveCLI in MarketUtils, counting status polls.
+    """
+
+    def __init__(self, voting_period: float, block_time: float = 0.05):
+        self.voting_period = voting_period
+        self.block_time = block_time
+        self.voting_end = None
+        self.voted = False
+        self.tallied = False
+        self.status_polls = 0
+
+    def query_gov_params(self):
+        return {"params": {"voting_period": f"{self.voting_period}s"}}
+
+    def create_market_proposal(self, proposal_json, from_key):
+        self.voting_end = current_clock().time() + self.voting_period
+        return {"txhash": "SUBMIT", "code": 0}
+
+    def wait_for_tx(self, txhash, timeout=None):
+        events = [{"type": "submit_proposal", "attributes": [{"key": "proposal_id", "value": "7"}]}]
+        return {"txhash": txhash, "code": 0, "events": events if txhash == "SUBMIT" else []}
+
+    def wait_for_txs(self, txhashes, timeout=None):
+        return {txhash: self.wait_for_tx(txhash) for txhash in txhashes}
+
+    def vote_proposal(self, proposal_id, vote, from_key):
+        self.voted = True
+        return {"txhash": "VOTE", "code": 0}
+
+    def query_staking_pool(self):
+        return {"pool": {"bonded_tokens": "3000"}}
+
+    def query_tallies(self, proposal_ids):
+        # One validator of three has voted, which leaves the outcome open
+        yes_count = "1000" if self.voted else "0"
+        return {proposal_id: {"tally": {"yes_count": yes_count}} for proposal_id in proposal_ids}
+
+    def query_proposal(self, proposal_id, use_cache=True):
+        self.status_polls += 1
+        end = datetime.fromtimestamp(self.voting_end, timezone.utc)
+        status = "PROPOSAL_STATUS_VOTING_PERIOD"
+        if self.voted and self.tallied:
+            status = "PROPOSAL_STATUS_PASSED"
+        return {"proposal": {"id": proposal_id, "status": status,
+                             "voting_end_time": end.strftime("%Y-%m-%dT%H:%M:%S.%fZ")}}
+
+    def wait_for_next_block(self, blocks=1, timeout=None):
+        current_clock().sleep(self.block_time)
+        # EndBlocker tallies proposals whose voting period is over
+        self.tallied = current_clock().time() >= self.voting_end
+
+
+@pytest.mark.client
+class TestGovSchedule:
+    """Test parsing gov params and the polling schedule."""
+
+    def test_parse_duration(self):
+        """
+        Test: Verify JSON, Go and protobuf durations are parsed to seconds
+        """
+        assert parse_duration("172800s") == 172800
+        assert parse_duration("48h0m0s") == 172800
+        assert parse_duration("1m30.5s") == 90.5
+        assert parse_duration("500ms") == 0.5
+        assert parse_duration({"seconds": "2", "nanos": 500000000}) == 2.5
+        with pytest.raises(ValueError):
+            parse_duration("two days")
+
+    def test_parse_timestamp(self):
+        """
+        Test: Verify RFC 3339 times with nanoseconds are parsed and zero times ignored
+        """
+        assert parse_timestamp("2024-01-01T00:00:10.250000000Z") == pytest.approx(1704067210.25)
+        assert parse_timestamp("2024-01-01T01:00:10+01:00") == 1704067210
+        assert parse_timestamp("0001-01-01T00:00:00Z") is None
+        assert parse_timestamp(None) is None
+
+    def test_gov_params_and_voting_end(self):
+        """
+        Test: Verify the voting period is read from v1 or legacy params and used as a fallback end
+        """
+        assert GovParams({"params": {"voting_period": "30s"}}).voting_period == 30
+        legacy = GovParams({"voting_params": {"voting_period": "1h0m0s"}})
+
+        assert legacy.voting_end({}, now=100.0) == 3700.0
+        assert legacy.voting_end({"voting_end_time": "2024-01-01T00:00:10Z"}, now=100.0) == 1704067210
+
+    def test_poll_delay_converges_on_voting_end(self):
+        """
+        Test: Verify polls halve the remaining time, then follow blocks once voting has ended
+        """
+        assert poll_delay(voting_end=100.0, now=60.0) == 20.0
+        assert poll_delay(voting_end=100.0, now=99.8) == pytest.approx(0.2)
+        assert poll_delay(voting_end=100.0, now=99.0) == 0.5
+        assert poll_delay(voting_end=100.0, now=100.0) is None
+
+
+@pytest.mark.client
+class TestAdaptiveProposalFlow:
+    """Test submit_and_pass_proposal timing against the chain's voting period."""
+
+    def test_passes_right_after_voting_period(self, monkeypatch):
+        """
+        Test: Verify the flow finishes in the first blocks after voting ends with few polls
+        """
+        chain = VotingChain(voting_period=1.0)
+        monkeypatch.setattr(market_utils, "cli", chain)
+
+        start = current_clock().time()
+        assert MarketUtils.submit_and_pass_proposal("{}", timeout=30) == "7"
+        elapsed = current_clock().time() - start
+
+        assert 1.0 <= elapsed < 1.5
+        assert chain.status_polls <= 6
+
+    def test_voting_period_longer_than_timeout_fails_fast(self, monkeypatch):
+        """
+        Test: Verify a voting period that cannot fit in the timeout fails before submitting
+        """
+        chain = VotingChain(voting_period=600)
+        monkeypatch.setattr(market_utils, "cli", chain)
+
+        with pytest.raises(InjectiveCLIError, match="Voting period"):
+            MarketUtils.submit_and_pass_proposal("{}", timeout=30)
+        assert chain.voting_end is None
+
+    def test_gov_params_queried_once(self, tmp_path, monkeypatch, mock_binary):
+        """
+        Test: Verify gov params are read once per session from injectived
+        """
+        state_file = tmp_path / "state.json"
+        monkeypatch.setenv("MOCK_INJECTIVE_STATE_FILE", str(state_file))
+        monkeypatch.setenv("MOCK_VOTING_PERIOD", "5")
+        client = InjectiveCLI(binary_path=mock_binary)
+        commands = []
+        run_command = client._run_command
+        client._run_command = lambda cmd, retry_count=None: commands.append(cmd) or run_command(cmd, retry_count)
+
+        assert GovParams(client.query_gov_params()).voting_period == 5
+        client.query_gov_params()
+
+        assert sum(cmd[:3] == ["query", "gov", "params"] for cmd in commands) == 1
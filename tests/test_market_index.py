@@ -0,0 +1,90 @@
+"""
+Test cases for the ticker -> market index.
+"""
+
+import pytest
+import logging
+
+from market_utils import MarketUtils
+from market_index import MarketIndex
+
+
+logger = logging.getLogger(__name__)
+
+
+@pytest.mark.client
+@pytest.mark.rest_markets(12, page_limit=5)
+class TestMarketIndex:
+    """Test ticker lookups through the market index."""
+
+    def test_observe_and_get(self):
+        """
+        Test: Verify observed markets are found by ticker and ID without queries
+        """
+        index = MarketIndex()
+        index.observe({"market": {"market_id": "0x01", "ticker": "A/USDT PERP"}})
+        index.observe({"market": {"ticker": "NO-ID"}})
+
+        assert index.market_id("A/USDT PERP") == "0x01"
+        assert index.get("A/USDT PERP")["market"]["market_id"] == "0x01"
+        assert index.get("NO-ID") is None
+        assert len(index) == 1
+
+    def test_markets_seen_on_the_way_are_indexed(self, rest_cli, mock_node):
+        """
+        Test: Verify tickers passed while streaming are later found without requests
+        """
+        assert rest_cli.find_market("M07/USDT PERP")["market"]["market_id"] == "0x07"
+        requests = mock_node.request_count
+
+        assert rest_cli.find_market("M02/USDT PERP")["market"]["market_id"] == "0x02"
+        assert rest_cli.find_market("M09/USDT PERP")["market"]["market_id"] == "0x09"
+        assert mock_node.request_count == requests
+        assert rest_cli.market_index.hits == 2
+
+    def test_miss_at_same_height_skips_listing(self, rest_cli, mock_node):
+        """
+        Test: Verify a repeated miss at an unchanged height only checks the height
+        """
+        assert rest_cli.find_market("MISSING/USDT PERP") is None
+        assert rest_cli.market_index.synced_height == mock_node.height
+        requests = mock_node.request_count
+
+        assert rest_cli.find_market("MISSING/USDT PERP") is None
+        assert mock_node.request_count == requests + 1
+        assert rest_cli.market_index.scans == 1
+
+    def test_new_market_found_after_height_advances(self, rest_cli, mock_node):
+        """
+        Test: Verify a market created after a full scan is found once a block is produced
+        """
+        assert rest_cli.find_market("NEW/USDT PERP") is None
+
+        mock_node.add_market("0xnew", "NEW/USDT PERP")
+        mock_node.produce_block()
+
+        assert rest_cli.find_market("NEW/USDT PERP")["market"]["market_id"] == "0xnew"
+        assert rest_cli.market_index.scans == 2
+
+    def test_query_market_refreshes_state(self, rest_cli, mock_node):
+        """
+        Test: Verify query_market updates the indexed state of a market
+        """
+        rest_cli.find_market("M01/USDT PERP")
+        mock_node.markets["0x01"]["maintenance_margin_ratio"] = "0.050000000000000000"
+
+        rest_cli.query_market("0x01")
+
+        market = rest_cli.find_market("M01/USDT PERP")["market"]
+        assert market["maintenance_margin_ratio"] == "0.050000000000000000"
+
+    def test_get_market_by_ticker_returns_current_state(self, rest_cli, mock_node):
+        """
+        Test: Verify the ticker lookup re-reads an indexed market instead of returning stale fields
+        """
+        rest_cli.find_market("M03/USDT PERP")
+        mock_node.markets["0x03"]["reduce_margin_ratio"] = "0.150000000000000000"
+
+        market = MarketUtils.get_market_by_ticker("M03/USDT PERP")
+
+        assert market["market"]["reduce_margin_ratio"] == "0.150000000000000000"
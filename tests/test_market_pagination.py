@@ -0,0 +1,117 @@
+"""
+Test cases for paginated market listing - streaming markets with early termination.
+"""
+
+import pytest
+import asyncio
+import json
+import logging
+import sys
+
+import market_utils
+from async_cli import AsyncInjectiveCLI
+from injective_cli import InjectiveCLI
+from market_utils import MarketUtils
+from query_transport import RestQueryTransport
+
+
+logger = logging.getLogger(__name__)
+
+
+@pytest.fixture
+def mock_cli(tmp_path, monkeypatch, mock_binary):
+    """
+    CLI against the repo's mock injectived with 7 markets seeded, recording each command it runs.
+    """
+    state_file = tmp_path / "state.json"
+    markets = {f"market_{i}": {"market_id": f"market_{i}", "ticker": f"C{i}/USDT"} for i in range(7)}
+    state_file.write_text(json.dumps({"markets": markets}))
+    monkeypatch.setenv("MOCK_INJECTIVE_STATE_FILE", str(state_file))
+
+    client = InjectiveCLI(binary_path=mock_binary)
+    client.commands = []
+    run_command = client._run_command
+
+    def recording_run_command(cmd, retry_count=None):
+        client.commands.append(cmd)
+        return run_command(cmd, retry_count)
+
+    client._run_command = recording_run_command
+    return client
+
+
+@pytest.mark.client
+@pytest.mark.rest_markets(30, expiry_every=6)
+class TestMarketPagination:
+    """Test iter_markets and get_market_by_ticker."""
+
+    def test_native_pages_by_key(self, rest_cli, mock_node):
+        """
+        Test: Verify every perpetual market is yielded once across key-paged REST requests
+        """
+        tickers = [m["market"]["ticker"] for m in rest_cli.iter_markets(page_limit=10)]
+
+        assert len(tickers) == 25 and len(set(tickers)) == 25
+        assert "M05/USDT PERP" not in tickers
+        assert mock_node.request_count == 3
+
+    def test_native_stops_at_first_match(self, rest_cli, mock_node):
+        """
+        Test: Verify a ticker on the first page is found without fetching later pages
+        """
+        markets = rest_cli.iter_markets(page_limit=10)
+        market = next(m for m in markets if m["market"]["ticker"] == "M03/USDT PERP")
+
+        assert market["market"]["market_id"] == "0x03"
+        assert mock_node.request_count == 1
+
+    def test_cli_pages_by_offset(self, mock_cli, monkeypatch):
+        """
+        Test: Verify injectived is paged with --limit/--offset and stops at the first match
+        """
+        tickers = [m["market"]["ticker"] for m in mock_cli.iter_markets(page_limit=3)]
+        assert tickers == [f"C{i}/USDT" for i in range(7)]
+        pages = [cmd for cmd in mock_cli.commands if "perpetual-markets" in cmd]
+        assert [cmd[-1] for cmd in pages] == ["0", "3", "6"]
+
+        mock_cli.commands.clear()
+        market = next(m for m in mock_cli.iter_markets(page_limit=3) if m["market"]["ticker"] == "C1/USDT")
+        assert market["market"]["market_id"] == "market_1"
+        assert not any("perpetual-markets" in cmd for cmd in mock_cli.commands), "The first page is still cached"
+
+        monkeypatch.setattr(market_utils, "cli", mock_cli)
+        assert MarketUtils.get_market_by_ticker("MISSING/USDT") is None
+
+    def test_falls_back_without_pagination_flags(self, tmp_path):
+        """
+        Test: Verify an injectived without pagination flags is queried once for everything
+        """
+        script = tmp_path / "injectived"
+        script.write_text(
+            f"#!{sys.executable}\n"
+            "import json, sys\n"
+            "if '--limit' in sys.argv:\n"
+            "    sys.stderr.write('Error: unknown flag: --limit')\n"
+            "    sys.exit(1)\n"
+            "print(json.dumps({'markets': [{'market': {'ticker': 'A'}}, {'market': {'ticker': 'B'}}]}))\n"
+        )
+        script.chmod(0o755)
+        client = InjectiveCLI(binary_path=str(script))
+
+        assert [m["market"]["ticker"] for m in client.iter_markets()] == ["A", "B"]
+        assert [m["market"]["ticker"] for m in client.iter_markets(use_cache=False)] == ["A", "B"]
+
+    def test_async_iter_markets(self, mock_node):
+        """
+        Test: Verify the async CLI streams markets page by page
+        """
+        for i in range(5):
+            mock_node.add_market(f"0x{i}", f"A{i}/USDT PERP")
+        client = AsyncInjectiveCLI(binary_path="/nonexistent/injectived",
+                                   transport=RestQueryTransport(mock_node.url))
+
+        async def collect():
+            return [m["market"]["ticker"] async for m in client.iter_markets(page_limit=2)]
+
+        assert asyncio.run(collect()) == [f"A{i}/USDT PERP" for i in range(5)]
+        assert mock_node.request_count == 3
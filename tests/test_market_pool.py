@@ -0,0 +1,154 @@
+"""
+Test cases for the leased market pool behind clean_test_market.
+"""
+
+import pytest
+import logging
+import threading
+import time
+
+from injective_cli import InjectiveCLIError
+from market_pool import MarketPool
+from market_utils import MarketUtils
+
+
+logger = logging.getLogger(__name__)
+
+
+class PoolChain:
+    """
+    Stands in for the MarketUtils launch and RMR helpers the pool uses.
+
+    Launches take launch_time and record their batch sizes.
+    """
+
+    def __init__(self, launch_time: float = 0.0, fail_updates: bool = False):
+        self.launch_time = launch_time
+        self.fail_updates = fail_updates
+        self.rmrs = {}
+        self.batches = []
+        self.updates = []
+
+    def launch_markets(self, markets, timeout=120):
+        time.sleep(self.launch_time)
+        self.batches.append(len(markets))
+        results = {}
+        for market in markets:
+            market_id = f"0x{len(self.rmrs):04x}"
+            self.rmrs[market_id] = market["rmr"]
+            results[market["ticker"]] = {"success": True, "proposal_id": str(len(self.batches)),
+                                         "market_id": market_id, "error": None}
+        return results
+
+    def verify_rmr_value(self, market_id, expected_rmr):
+        return self.rmrs[market_id] == expected_rmr
+
+    def update_market_rmr(self, market_id, new_rmr):
+        self.updates.append(market_id)
+        if self.fail_updates:
+            return False
+        self.rmrs[market_id] = new_rmr
+        return True
+
+
+@pytest.fixture
+def pool_chain(monkeypatch):
+    chain = PoolChain()
+    for name in ("launch_markets", "verify_rmr_value", "update_market_rmr"):
+        monkeypatch.setattr(MarketUtils, name, getattr(chain, name))
+    return chain
+
+
+@pytest.mark.client
+class TestMarketPool:
+    """Test leasing, resetting and growing pooled markets."""
+
+    def test_markets_launched_in_one_batch(self, pool_chain):
+        """
+        Test: Verify the first lease launches a whole batch and later leases reuse it
+        """
+        pool = MarketPool(baseline_rmr=0.1, size=3, worker="gw1")
+        assert pool_chain.batches == []
+
+        markets = [pool.lease() for _ in range(3)]
+
+        assert pool_chain.batches == [3]
+        assert len({market["market_id"] for market in markets}) == 3
+        assert all(market["rmr"] == 0.1 and "GW1" in market["ticker"] for market in markets)
+
+    def test_release_resets_changed_rmr(self, pool_chain):
+        """
+        Test: Verify a released market is reset to its baseline only if a test changed it
+        """
+        pool = MarketPool(baseline_rmr=0.1, size=1)
+        market = pool.lease()
+        pool.release(market)
+        assert pool_chain.updates == []
+
+        market = pool.lease()
+        pool_chain.rmrs[market["market_id"]] = 0.15
+        pool.release(market)
+
+        assert pool_chain.updates == [market["market_id"]]
+        assert pool_chain.rmrs[market["market_id"]] == 0.1
+        assert pool.lease()["market_id"] == market["market_id"]
+        assert pool_chain.batches == [1]
+
+    def test_grows_on_demand(self, pool_chain):
+        """
+        Test: Verify leasing beyond the free markets launches another batch
+        """
+        pool = MarketPool(baseline_rmr=0.1, size=2)
+
+        markets = [pool.lease() for _ in range(3)]
+
+        assert pool_chain.batches == [2, 2]
+        assert len({market["ticker"] for market in markets}) == 3
+        assert len(pool) == 4 and pool.available == 1
+
+    def test_unresettable_market_dropped(self, pool_chain):
+        """
+        Test: Verify a market whose RMR cannot be reset is not leased again
+        """
+        pool_chain.fail_updates = True
+        pool = MarketPool(baseline_rmr=0.1, size=1)
+        market = pool.lease()
+        pool_chain.rmrs[market["market_id"]] = 0.2
+
+        pool.release(market)
+
+        assert len(pool) == 0
+        assert pool.lease()["market_id"] != market["market_id"]
+        with pytest.raises(InjectiveCLIError, match="not leased"):
+            pool.release(market)
+
+    def test_concurrent_leases_share_one_launch(self, pool_chain):
+        """
+        Test: Verify concurrent leases on an empty pool wait for a single launch
+        """
+        pool_chain.launch_time = 0.2
+        pool = MarketPool(baseline_rmr=0.1, size=4)
+        leased = []
+
+        threads = [threading.Thread(target=lambda: leased.append(pool.lease())) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert pool_chain.batches == [4]
+        assert len({market["market_id"] for market in leased}) == 4
+
+    def test_mock_chain_pool(self, mock_chain):
+        """
+        Test: Verify the pool launches, resets and re-leases markets on the mock injectived
+        """
+        pool = MarketPool(baseline_rmr=0.1, size=2, timeout=60)
+
+        market = pool.lease()
+        assert MarketUtils.update_market_rmr(market["market_id"], 0.15)
+        pool.release(market)
+        pool.lease()
+
+        assert MarketUtils.verify_rmr_value(market["market_id"], 0.1)
+        assert pool.launches == 1 and pool.resets == 1
@@ -0,0 +1,248 @@
+"""
+Test cases for voting from several validator keys and deciding proposals from their tally.
+"""
+
+import pytest
+import json
+import logging
+import threading
+import time
+from datetime import datetime, timezone
+from decimal import Decimal
+
+import market_utils
+from clock import current_clock
+from gov_schedule import GovParams, poll_delay, tally_outcome
+from injective_cli import InjectiveCLIError
+from market_utils import MarketUtils
+
+
+logger = logging.getLogger(__name__)
+
+PARAMS = GovParams({"params": {"voting_period": "10s", "quorum": "0.334", "threshold": "0.5",
+                               "veto_threshold": "0.334"}})
+
+
+class ValidatorChain:
+    """
+    Chain with equally weighted validators, tallying proposals after voting_end_time.
+
+    Stands in for InjectiveCLI in MarketUtils. Votes take vote_time to
+    broadcast, and the peak number of votes in flight is recorded.
+    """
+
+    def __init__(self, voting_period: float, validators: int = 3, vote_time: float = 0.2,
+                 block_time: float = 0.05, rejecting=()):
+        self.voting_period = voting_period
+        self.validators = validators
+        self.vote_time = vote_time
+        self.block_time = block_time
+        self.rejecting = set(rejecting)
+        self.proposals = {}
+        self.txs = {}
+        self.voters = []
+        self.status_rounds = 0
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self._lock = threading.Lock()
+
+    def query_gov_params(self):
+        return {"params": {"voting_period": f"{self.voting_period}s"}}
+
+    def create_market_proposal(self, proposal_json, from_key):
+        proposal_id = str(len(self.proposals) + 1)
+        self.proposals[proposal_id] = {"status": "PROPOSAL_STATUS_VOTING_PERIOD", "votes": {},
+                                       "voting_end": current_clock().time() + self.voting_period}
+        txhash = f"SUBMIT{proposal_id}"
+        self.txs[txhash] = {"txhash": txhash, "code": 0, "events": [
+            {"type": "submit_proposal", "attributes": [{"key": "proposal_id", "value": proposal_id}]}
+        ]}
+        return {"txhash": txhash, "code": 0}
+
+    def wait_for_txs(self, txhashes, timeout=None):
+        return {txhash: self.txs[txhash] for txhash in txhashes}
+
+    def wait_for_tx(self, txhash, timeout=None):
+        return self.txs[txhash]
+
+    def vote_proposals(self, proposal_ids, vote, from_key):
+        with self._lock:
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        # Real time, so concurrent votes overlap
+        time.sleep(self.vote_time)
+        with self._lock:
+            self.in_flight -= 1
+            self.voters.append(from_key)
+            for proposal_id in proposal_ids:
+                option = "no" if proposal_id in self.rejecting else vote
+                self.proposals[proposal_id]["votes"][from_key] = option
+            txhash = f"VOTE-{from_key}"
+            self.txs[txhash] = {"txhash": txhash, "code": 0}
+        return {"txhash": txhash, "code": 0}
+
+    def vote_proposal(self, proposal_id, vote, from_key):
+        return self.vote_proposals([proposal_id], vote, from_key)
+
+    def query_staking_pool(self):
+        return {"pool": {"bonded_tokens": str(self.validators * 1000)}}
+
+    def query_tallies(self, proposal_ids):
+        tallies = {}
+        for proposal_id in proposal_ids:
+            votes = list(self.proposals[proposal_id]["votes"].values())
+            tallies[proposal_id] = {"tally": {
+                "yes_count": str(votes.count("yes") * 1000), "no_count": str(votes.count("no") * 1000),
+            }}
+        return tallies
+
+    def query_proposal(self, proposal_id, use_cache=True):
+        return self.query_proposals([proposal_id])[proposal_id]
+
+    def query_proposals(self, proposal_ids, use_cache=True):
+        self.status_rounds += 1
+        results = {}
+        for proposal_id in proposal_ids:
+            proposal = self.proposals[proposal_id]
+            end = datetime.fromtimestamp(proposal["voting_end"], timezone.utc)
+            results[proposal_id] = {"proposal": {
+                "id": proposal_id, "status": proposal["status"],
+                "voting_end_time": end.strftime("%Y-%m-%dT%H:%M:%S.%fZ"),
+            }}
+        return results
+
+    def wait_for_next_block(self, blocks=1, timeout=None):
+        current_clock().sleep(self.block_time)
+        # EndBlocker tallies proposals whose voting period is over
+        for proposal in self.proposals.values():
+            if proposal["status"] == "PROPOSAL_STATUS_VOTING_PERIOD" and current_clock().time() >= proposal["voting_end"]:
+                votes = list(proposal["votes"].values())
+                passed = votes.count("yes") * 2 > len(votes)
+                proposal["status"] = "PROPOSAL_STATUS_PASSED" if passed else "PROPOSAL_STATUS_REJECTED"
+
+
+@pytest.mark.client
+class TestTallyOutcome:
+    """Test deciding a proposal from a partial tally."""
+
+    def test_undecided_without_quorum(self):
+        """
+        Test: Verify a tally below quorum leaves the outcome open
+        """
+        assert tally_outcome({"yes_count": "1000"}, Decimal(3000), PARAMS) is None
+        assert tally_outcome({}, Decimal(3000), PARAMS) is None
+
+    def test_passes_once_remaining_votes_cannot_change_it(self):
+        """
+        Test: Verify a yes majority of all bonded tokens is decided as a pass
+        """
+        assert tally_outcome({"yes_count": "2000"}, Decimal(3000), PARAMS) is True
+        assert tally_outcome({"yes_count": "3000"}, Decimal(3000), PARAMS) is True
+
+    def test_remaining_veto_keeps_it_open(self):
+        """
+        Test: Verify a pass is not decided while the remaining tokens could still veto it
+        """
+        assert tally_outcome({"yes_count": "6000"}, Decimal(10000), PARAMS) is None
+
+    def test_fails_when_threshold_is_out_of_reach(self):
+        """
+        Test: Verify no and veto majorities are decided as failures
+        """
+        assert tally_outcome({"no_count": "2000"}, Decimal(3000), PARAMS) is False
+        assert tally_outcome({"yes_count": "1000", "no_with_veto_count": "1500"}, Decimal(3000), PARAMS) is False
+
+    def test_decided_poll_waits_for_voting_end(self):
+        """
+        Test: Verify a decided proposal is not polled again before its voting end
+        """
+        assert poll_delay(voting_end=100.0, now=60.0, decided=True) == 40.0
+        assert poll_delay(voting_end=100.0, now=100.0, decided=True) is None
+
+
+@pytest.mark.client
+class TestMultiValidatorVoting:
+    """Test MarketUtils proposal flows with several voter keys."""
+
+    def test_votes_are_cast_concurrently(self, monkeypatch):
+        """
+        Test: Verify every voter key votes, all at once
+        """
+        chain = ValidatorChain(voting_period=0.5)
+        monkeypatch.setattr(market_utils, "cli", chain)
+
+        start = current_clock().time()
+        outcomes = MarketUtils.submit_and_pass_proposals(
+            [json.dumps({"n": i}) for i in range(2)], timeout=30, voter_keys=["val", "val2", "val3"]
+        )
+
+        assert all(outcome["success"] for outcome in outcomes), outcomes
+        assert sorted(chain.voters) == ["val", "val2", "val3"]
+        assert chain.peak_in_flight == 3
+        assert current_clock().time() - start < 1.2
+
+    def test_decided_pass_skips_polls(self, monkeypatch):
+        """
+        Test: Verify a proposal decided by its tally is only polled again at voting end
+        """
+        chain = ValidatorChain(voting_period=1.0, vote_time=0)
+        monkeypatch.setattr(market_utils, "cli", chain)
+
+        assert MarketUtils.submit_and_pass_proposal("{}", timeout=30, voter_keys=["val", "val2", "val3"]) == "1"
+        assert chain.status_rounds <= 4
+
+    def test_decided_failure_fails_fast(self, monkeypatch):
+        """
+        Test: Verify a proposal that cannot reach the threshold fails without waiting out voting
+        """
+        chain = ValidatorChain(voting_period=10, vote_time=0, rejecting={"1"})
+        monkeypatch.setattr(market_utils, "cli", chain)
+
+        start = current_clock().time()
+        with pytest.raises(InjectiveCLIError, match="cannot pass"):
+            MarketUtils.submit_and_pass_proposal("{}", timeout=30, voter_keys=["val", "val2"])
+        assert current_clock().time() - start < 1
+
+    def test_decided_failure_leaves_others_pending(self, monkeypatch):
+        """
+        Test: Verify a proposal decided as a failure is reported while the rest still pass
+        """
+        chain = ValidatorChain(voting_period=0.5, vote_time=0, rejecting={"1"})
+        monkeypatch.setattr(market_utils, "cli", chain)
+
+        outcomes = MarketUtils.submit_and_pass_proposals(["{}", "{}"], timeout=30, voter_keys=["val", "val2", "val3"])
+
+        assert not outcomes[0]["success"] and "cannot pass" in outcomes[0]["error"]
+        assert outcomes[1]["success"]
+
+    def test_failed_voter_does_not_block_others(self, monkeypatch):
+        """
+        Test: Verify a vote from one key failing leaves the other keys' votes to carry the proposal
+        """
+        chain = ValidatorChain(voting_period=0.3, vote_time=0)
+        vote_proposals = chain.vote_proposals
+
+        def vote(proposal_ids, option, from_key):
+            if from_key == "val2":
+                raise InjectiveCLIError("key not found")
+            return vote_proposals(proposal_ids, option, from_key)
+
+        chain.vote_proposals = vote
+        monkeypatch.setattr(market_utils, "cli", chain)
+
+        outcomes = MarketUtils.submit_and_pass_proposals(["{}", "{}"], timeout=30, voter_keys=["val", "val2"])
+
+        assert all(outcome["success"] for outcome in outcomes), outcomes
+        assert chain.voters == ["val"]
+
+    def test_mock_chain_tallies_every_voter(self, mock_chain):
+        """
+        Test: Verify the mock injectived counts a yes vote from each voter key
+        """
+        proposal = MarketUtils.create_market_proposal_json("VOTE/USDT PERP", "vote", "usdt", rmr=0.3)
+
+        proposal_id = MarketUtils.submit_and_pass_proposal(proposal, timeout=60, voter_keys=["val", "testcandidate"])
+
+        tally = mock_chain.query_tally(proposal_id)["tally"]
+        assert tally["yes_count"] == "2000000"
+        assert Decimal(mock_chain.query_staking_pool()["pool"]["bonded_tokens"]) > 0
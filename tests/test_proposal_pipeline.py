@@ -0,0 +1,151 @@
+"""
+Test cases for passing several governance proposals together.
+"""
+
+import pytest
+import json
+import logging
+from datetime import datetime, timezone
+
+import market_utils
+from clock import current_clock
+from market_utils import MarketUtils
+
+
+logger = logging.getLogger(__name__)
+
+
+class GovChain:
+    """
+    Chain whose proposals are tallied in the first block after voting_end_time.
+
+    Stands in for InjectiveCLI in MarketUtils. A proposal JSON with
+    "outcome" set to "invalid" is rejected at submission and "no" is voted down.
+    """
+
+    def __init__(self, voting_period: float, block_time: float = 0.05):
+        self.voting_period = voting_period
+        self.block_time = block_time
+        self.proposals = {}
+        self.txs = {}
+        self.vote_txs = 0
+        self.status_rounds = 0
+
+    def query_gov_params(self):
+        return {"params": {"voting_period": f"{self.voting_period}s"}}
+
+    def create_market_proposal(self, proposal_json, from_key):
+        outcome = json.loads(proposal_json).get("outcome")
+        if outcome == "invalid":
+            return {"txhash": "", "code": 13, "raw_log": "insufficient fee"}
+
+        proposal_id = str(len(self.proposals) + 1)
+        self.proposals[proposal_id] = {
+            "id": proposal_id, "status": "PROPOSAL_STATUS_VOTING_PERIOD", "outcome": outcome,
+            "voting_end": current_clock().time() + self.voting_period, "voted": False,
+        }
+        txhash = f"SUBMIT{proposal_id}"
+        self.txs[txhash] = {"txhash": txhash, "code": 0, "events": [
+            {"type": "submit_proposal", "attributes": [{"key": "proposal_id", "value": proposal_id}]}
+        ]}
+        return {"txhash": txhash, "code": 0}
+
+    def wait_for_txs(self, txhashes, timeout=None):
+        return {txhash: self.txs[txhash] for txhash in txhashes}
+
+    def wait_for_tx(self, txhash, timeout=None):
+        return self.txs[txhash]
+
+    def vote_proposals(self, proposal_ids, vote, from_key):
+        self.vote_txs += 1
+        for proposal_id in proposal_ids:
+            self.proposals[proposal_id]["voted"] = True
+        txhash = f"VOTE{self.vote_txs}"
+        self.txs[txhash] = {"txhash": txhash, "code": 0}
+        return {"txhash": txhash, "code": 0}
+
+    def query_staking_pool(self):
+        return {"pool": {"bonded_tokens": "3000"}}
+
+    def query_tallies(self, proposal_ids):
+        # One validator of three has voted, which leaves every outcome open
+        return {proposal_id: {"tally": {"yes_count": "1000" if self.proposals[proposal_id]["voted"] else "0"}}
+                for proposal_id in proposal_ids}
+
+    def query_proposals(self, proposal_ids, use_cache=True):
+        self.status_rounds += 1
+        results = {}
+        for proposal_id in proposal_ids:
+            proposal = self.proposals[proposal_id]
+            end = datetime.fromtimestamp(proposal["voting_end"], timezone.utc)
+            results[proposal_id] = {"proposal": {
+                "id": proposal_id, "status": proposal["status"],
+                "voting_end_time": end.strftime("%Y-%m-%dT%H:%M:%S.%fZ"),
+            }}
+        return results
+
+    def wait_for_next_block(self, blocks=1, timeout=None):
+        current_clock().sleep(self.block_time)
+        # EndBlocker tallies proposals whose voting period is over
+        for proposal in self.proposals.values():
+            if proposal["status"] == "PROPOSAL_STATUS_VOTING_PERIOD" and current_clock().time() >= proposal["voting_end"]:
+                passed = proposal["voted"] and proposal["outcome"] != "no"
+                proposal["status"] = "PROPOSAL_STATUS_PASSED" if passed else "PROPOSAL_STATUS_REJECTED"
+
+
+@pytest.mark.client
+class TestProposalPipeline:
+    """Test MarketUtils.submit_and_pass_proposals."""
+
+    def test_proposals_share_one_voting_period(self, monkeypatch):
+        """
+        Test: Verify N proposals pass in about one voting period with one vote tx
+        """
+        chain = GovChain(voting_period=1.0)
+        monkeypatch.setattr(market_utils, "cli", chain)
+
+        start = current_clock().time()
+        outcomes = MarketUtils.submit_and_pass_proposals([json.dumps({"n": i}) for i in range(4)], timeout=30)
+        elapsed = current_clock().time() - start
+
+        assert [outcome["success"] for outcome in outcomes] == [True] * 4
+        assert [outcome["proposal_id"] for outcome in outcomes] == ["1", "2", "3", "4"]
+        assert 1.0 <= elapsed < 1.6
+        assert chain.vote_txs == 1
+        assert chain.status_rounds <= 8
+
+    def test_per_proposal_outcomes(self, monkeypatch):
+        """
+        Test: Verify failed submissions and rejected proposals do not affect the others
+        """
+        chain = GovChain(voting_period=0.3)
+        monkeypatch.setattr(market_utils, "cli", chain)
+
+        outcomes = MarketUtils.submit_and_pass_proposals(
+            [json.dumps({"outcome": outcome}) for outcome in ("yes", "invalid", "no")], timeout=30
+        )
+
+        assert outcomes[0]["success"] and outcomes[0]["status"] == "PROPOSAL_STATUS_PASSED"
+        assert not outcomes[1]["success"] and "insufficient fee" in outcomes[1]["error"]
+        assert outcomes[1]["proposal_id"] is None
+        assert not outcomes[2]["success"] and outcomes[2]["status"] == "PROPOSAL_STATUS_REJECTED"
+
+    def test_mock_chain_votes_in_one_tx(self, mock_chain, monkeypatch):
+        """
+        Test: Verify the mock injectived passes several proposals with a single multi-message vote
+        """
+        votes = []
+        vote_proposals = mock_chain.vote_proposals
+        monkeypatch.setattr(mock_chain, "vote_proposals",
+                            lambda ids, *args: votes.append(list(ids)) or vote_proposals(ids, *args))
+        monkeypatch.setattr(mock_chain, "vote_proposal", None)
+        proposals = [
+            MarketUtils.create_market_proposal_json(f"PIPE{i}/USDT PERP", f"pipe{i}", "usdt", rmr=0.3)
+            for i in range(3)
+        ]
+
+        outcomes = MarketUtils.submit_and_pass_proposals(proposals, timeout=60)
+
+        assert all(outcome["success"] for outcome in outcomes), outcomes
+        assert votes == [[outcome["proposal_id"] for outcome in outcomes]]
+        assert MarketUtils.wait_for_market("PIPE2/USDT PERP", timeout=5) is not None
@@ -0,0 +1,99 @@
+"""
+Test cases for proposal submission - per-call proposal files safe for concurrent use.
+"""
+
+import pytest
+import asyncio
+import json
+import logging
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+from async_cli import AsyncInjectiveCLI
+from injective_cli import InjectiveCLI, proposal_file
+
+
+logger = logging.getLogger(__name__)
+
+
+@pytest.fixture
+def echo_binary(tmp_path):
+    """
+    Fake injectived that echoes the path and content of the submitted proposal file.
+    """
+    script = tmp_path / "injectived"
+    script.write_text(
+        f"#!{sys.executable}\n"
+        "import json, sys, time\n"
+        "path = sys.argv[sys.argv.index('submit-proposal') + 1]\n"
+        "content = json.load(open(path))\n"
+        "time.sleep(0.2)\n"
+        "print(json.dumps({'path': path, 'content': content, 'code': 0}))\n"
+    )
+    script.chmod(0o755)
+    return str(script)
+
+
+def _proposal(i: int) -> str:
+    return json.dumps({"title": f"Launch TEST{i}/USDT PERP", "messages": [{"ticker": f"TEST{i}"}]}, indent=2)
+
+
+class TestProposalSubmission:
+    """Test suite for proposal payload delivery."""
+
+    @pytest.mark.client
+    def test_proposal_file_is_unique_and_removed(self):
+        """
+        Test: Verify each call gets its own file, removed on exit.
+        """
+        with proposal_file(_proposal(1)) as first, proposal_file(_proposal(2)) as second:
+            assert first != second
+            assert json.load(open(first))["title"] == "Launch TEST1/USDT PERP"
+            assert json.load(open(second))["title"] == "Launch TEST2/USDT PERP"
+
+        assert not os.path.exists(first)
+        assert not os.path.exists(second)
+
+    @pytest.mark.client
+    def test_existing_file_path_passed_through(self, tmp_path):
+        """
+        Test: Verify a proposal given as a file path is used as-is and kept.
+        """
+        path = tmp_path / "proposal.json"
+        path.write_text(_proposal(3))
+
+        with proposal_file(str(path)) as submitted:
+            assert submitted == str(path)
+
+        assert path.exists()
+
+    @pytest.mark.client
+    def test_concurrent_submissions_do_not_collide(self, echo_binary):
+        """
+        Test: Verify parallel submissions each deliver their own proposal.
+        """
+        cli = InjectiveCLI(binary_path=echo_binary)
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(lambda i: cli.create_market_proposal(_proposal(i), "testcandidate"),
+                                    range(8)))
+
+        assert [r["content"]["title"] for r in results] == [f"Launch TEST{i}/USDT PERP" for i in range(8)]
+        assert len({r["path"] for r in results}) == 8
+        assert not any(os.path.exists(r["path"]) for r in results), "Proposal files should be cleaned up"
+
+    @pytest.mark.client
+    @pytest.mark.asyncio
+    async def test_concurrent_async_submissions_do_not_collide(self, echo_binary):
+        """
+        Test: Verify concurrent async submissions each deliver their own proposal.
+        """
+        cli = AsyncInjectiveCLI(binary_path=echo_binary, max_concurrency=8)
+
+        results = await asyncio.gather(*[
+            cli.create_market_proposal(_proposal(i), "testcandidate") for i in range(8)
+        ])
+
+        assert [r["content"]["title"] for r in results] == [f"Launch TEST{i}/USDT PERP" for i in range(8)]
+        assert not any(os.path.exists(r["path"]) for r in results)
@@ -0,0 +1,110 @@
+"""
+Test cases for the block-height-aware query cache in InjectiveCLI.
+"""
+
+import pytest
+import logging
+
+from injective_cli import InjectiveCLI, InjectiveCLIError
+from query_cache import QueryCache
+from query_transport import RestQueryTransport
+
+
+logger = logging.getLogger(__name__)
+
+
+class TestQueryCache:
+    """Test suite for cached market and proposal queries."""
+
+    @pytest.fixture
+    def cached_cli(self, mock_node, monkeypatch):
+        """CLI wrapper with a cache, querying the mock node, that never re-checks height on its own."""
+        monkeypatch.setenv("CACHE_HEIGHT_CHECK_INTERVAL", "3600")
+        transport = RestQueryTransport(mock_node.url)
+        yield InjectiveCLI(binary_path="/nonexistent/injectived", transport=transport, cache=QueryCache())
+        transport.close()
+
+    @pytest.mark.client
+    def test_repeated_queries_hit_cache(self, mock_node, cached_cli):
+        """
+        Test: Verify identical queries within one block are served from cache.
+        """
+        mock_node.add_market("0xabc", "TST/USDT PERP")
+
+        for _ in range(5):
+            assert cached_cli.query_market("0xabc")["market"]["ticker"] == "TST/USDT PERP"
+
+        # One height check plus one market query
+        assert mock_node.request_count == 2
+        stats = cached_cli.cache_stats()
+        assert stats["hits"] == 4 and stats["misses"] == 1
+
+    @pytest.mark.client
+    def test_height_change_invalidates(self, mock_node, cached_cli):
+        """
+        Test: Verify cached state is dropped once the block height advances.
+        """
+        mock_node.add_market("0xabc", "TST/USDT PERP", rmr="0.100000000000000000")
+        cached_cli.query_market("0xabc")
+
+        mock_node.markets["0xabc"]["reduce_margin_ratio"] = "0.150000000000000000"
+        mock_node.height += 1
+        cached_cli.get_latest_block_height()
+
+        market = cached_cli.query_market("0xabc")
+        assert market["market"]["reduce_margin_ratio"] == "0.150000000000000000"
+
+    @pytest.mark.client
+    def test_terminal_proposal_cached_permanently(self, mock_node, cached_cli):
+        """
+        Test: Verify passed proposals survive height changes while open ones do not.
+        """
+        mock_node.add_proposal("1", status="PROPOSAL_STATUS_PASSED")
+        mock_node.add_proposal("2", status="PROPOSAL_STATUS_VOTING_PERIOD")
+        cached_cli.query_proposal("1")
+        cached_cli.query_proposal("2")
+
+        mock_node.height += 1
+        cached_cli.get_latest_block_height()
+        requests_before = mock_node.request_count
+
+        cached_cli.query_proposal("1")
+        assert mock_node.request_count == requests_before, "Passed proposal should stay cached"
+
+        cached_cli.query_proposal("2")
+        assert mock_node.request_count == requests_before + 1, "Open proposal should be refetched"
+
+    @pytest.mark.client
+    def test_own_tx_invalidates_market(self, mock_node, cached_cli):
+        """
+        Test: Verify an admin update from this client drops that market's cached state.
+        """
+        mock_node.add_market("0xabc", "TST/USDT PERP")
+        mock_node.add_market("0xdef", "OTH/USDT PERP")
+        cached_cli.query_market("0xabc")
+        cached_cli.query_market("0xdef")
+
+        # The binary doesn't exist, but invalidation happens whether or not the tx succeeds
+        with pytest.raises(InjectiveCLIError):
+            cached_cli.update_market_admin("0xabc", "0.15", "admin")
+
+        requests_before = mock_node.request_count
+        cached_cli.query_market("0xdef")
+        assert mock_node.request_count == requests_before + 1, "Next query should re-check height"
+
+        cached_cli.query_market("0xabc")
+        assert mock_node.request_count == requests_before + 2, "Updated market should be refetched"
+
+    @pytest.mark.client
+    def test_bypass_per_call(self, mock_node, cached_cli):
+        """
+        Test: Verify use_cache=False always goes to the node and does not count as hit or miss.
+        """
+        mock_node.add_market("0xabc", "TST/USDT PERP")
+
+        for _ in range(3):
+            cached_cli.query_market("0xabc", use_cache=False)
+
+        assert mock_node.request_count == 3
+        assert cached_cli.cache_stats()["hits"] == 0
+        assert cached_cli.cache_stats()["misses"] == 0
@@ -0,0 +1,94 @@
+"""
+Test cases for native query transports - answering CLI queries over the node's REST endpoint.
+"""
+
+import pytest
+import logging
+
+import market_utils
+from injective_cli import InjectiveCLI, InjectiveCLIError
+from market_utils import MarketUtils
+from query_transport import RestQueryTransport, create_query_transport
+
+
+logger = logging.getLogger(__name__)
+
+
+class TestQueryTransport:
+    """Test suite for the REST query transport."""
+
+    @pytest.fixture
+    def rest_cli(self, mock_node):
+        """CLI wrapper whose queries go to the mock node over REST."""
+        transport = RestQueryTransport(mock_node.url)
+        yield InjectiveCLI(binary_path="/nonexistent/injectived", transport=transport)
+        transport.close()
+
+    @pytest.mark.client
+    def test_query_shapes_match_cli(self, mock_node, rest_cli):
+        """
+        Test: Verify REST responses are normalized to the CLI's JSON shapes.
+        """
+        mock_node.add_market("0xabc", "TST/USDT PERP", rmr="0.150000000000000000")
+        mock_node.add_market("0xdef", "TST/USDT EXP", is_perpetual=False)
+        mock_node.add_proposal("7", status="PROPOSAL_STATUS_PASSED")
+
+        market = rest_cli.query_market("0xabc")
+        assert market["market"]["reduce_margin_ratio"] == "0.150000000000000000"
+
+        markets = rest_cli.query_all_markets()
+        tickers = [m["market"]["ticker"] for m in markets["markets"]]
+        assert tickers == ["TST/USDT PERP"], "Only perpetual markets should be listed"
+
+        proposal = rest_cli.query_proposal("7")
+        assert proposal["proposal"]["status"] == "PROPOSAL_STATUS_PASSED"
+
+        assert rest_cli.get_latest_block_height() == mock_node.height
+
+    @pytest.mark.client
+    def test_market_utils_work_unchanged(self, mock_node, rest_cli, monkeypatch):
+        """
+        Test: Verify MarketUtils helpers work on top of the REST transport.
+        """
+        mock_node.add_market("0xabc", "TST/USDT PERP", rmr="0.100000000000000000")
+        monkeypatch.setattr(market_utils, "cli", rest_cli)
+
+        market = MarketUtils.get_market_by_ticker("TST/USDT PERP")
+        assert market["market"]["market_id"] == "0xabc"
+        assert MarketUtils.verify_rmr_value("0xabc", 0.10)
+        assert MarketUtils.get_market_by_ticker("MISSING/USDT PERP") is None
+
+    @pytest.mark.client
+    def test_single_persistent_connection(self, mock_node, rest_cli):
+        """
+        Test: Verify repeated queries reuse one keep-alive connection.
+        """
+        for _ in range(20):
+            rest_cli.get_latest_block_height()
+
+        assert mock_node.request_count == 20
+        assert mock_node.connection_count == 1, "Queries should share one connection"
+
+    @pytest.mark.client
+    def test_not_found_raises_cli_error(self, rest_cli):
+        """
+        Test: Verify node errors surface as InjectiveCLIError, like CLI failures.
+        """
+        with pytest.raises(InjectiveCLIError, match="404"):
+            rest_cli.query_market("0xmissing")
+
+    @pytest.mark.client
+    def test_unsupported_commands_fall_back(self, mock_node):
+        """
+        Test: Verify commands without a REST route are not claimed by the transport.
+        """
+        transport = RestQueryTransport(mock_node.url)
+
+        assert transport.supports(["query", "block"])
+        assert not transport.supports(["tx", "gov", "vote", "1", "yes"])
+        assert not transport.supports(["query", "exchange", "perpetual-markets", "--height", "5"])
+        assert transport.supports(["query", "exchange", "perpetual-markets", "--limit", "5"])
+        assert create_query_transport("cli") is None
+
+        with pytest.raises(ValueError, match="Unknown query backend"):
+            create_query_transport("carrier-pigeon")
@@ -0,0 +1,153 @@
+"""
+Test cases for the CLI retry policy - error classification, jittered backoff and the retry budget.
+"""
+
+import pytest
+import logging
+import random
+import time
+
+from async_cli import AsyncInjectiveCLI
+from injective_cli import InjectiveCLI, InjectiveCLIError
+from retry_policy import RetryPolicy, RetryBudget
+
+
+logger = logging.getLogger(__name__)
+
+
+def _attempts(tmp_path) -> int:
+    return len(list(tmp_path.glob("pid.*")))
+
+
+class TestRetryPolicy:
+    """Test suite for RetryPolicy and RetryBudget."""
+
+    @pytest.mark.client
+    @pytest.mark.parametrize("stderr,transient", [
+        ("Error: testcandidate.info: key not found", False),
+        ("rpc error: code = NotFound desc = market not found", False),
+        ("failed to execute message; message index: 0: invalid reduce margin ratio", False),
+        ("Error: post failed: Post \"http://localhost:26657\": dial tcp: connection refused", True),
+        ("account sequence mismatch, expected 12, got 11: incorrect account sequence", True),
+        ("rpc error: code = Unavailable desc = transport is closing", True),
+        ("something nobody has seen before", True),
+    ])
+    def test_classification(self, stderr, transient):
+        """
+        Test: Verify stderr is classified as transient or permanent.
+        """
+        assert RetryPolicy().is_transient(stderr, 1) is transient
+
+    @pytest.mark.client
+    def test_missing_binary_exit_codes_are_permanent(self):
+        """
+        Test: Verify "command not found" style exit codes are never retried.
+        """
+        policy = RetryPolicy()
+        assert not policy.is_transient("connection refused", 127)
+        assert not policy.is_transient("", 126)
+
+    @pytest.mark.client
+    def test_full_jitter_backoff(self):
+        """
+        Test: Verify backoff is uniform in [0, min(max_delay, base * 2**attempt)].
+        """
+        policy = RetryPolicy(base_delay=1.0, max_delay=4.0, rng=random.Random(7))
+        for attempt in range(6):
+            delays = [policy.backoff(attempt) for _ in range(200)]
+            cap = min(4.0, 2 ** attempt)
+            assert all(0 <= d <= cap for d in delays)
+            assert max(delays) > cap / 2, "Delays should spread across the window"
+
+    @pytest.mark.client
+    def test_per_command_overrides(self):
+        """
+        Test: Verify the longest matching command prefix override applies.
+        """
+        policy = RetryPolicy(overrides={
+            ("tx",): {"retry_on_timeout": False},
+            ("tx", "gov", "vote"): {"max_attempts": 5},
+        })
+
+        vote = policy.for_command(["tx", "gov", "vote", "1", "yes"])
+        assert vote.max_attempts == 5 and vote.retry_on_timeout is True
+
+        submit = policy.for_command(["tx", "gov", "submit-proposal", "p.json"])
+        assert submit.max_attempts == 3 and submit.retry_on_timeout is False
+
+        assert policy.for_command(["query", "block"]) is policy
+
+    @pytest.mark.client
+    def test_budget(self):
+        """
+        Test: Verify the retry budget runs out after max_retries.
+        """
+        budget = RetryBudget(max_retries=2)
+        assert budget.consume() and budget.consume()
+        assert not budget.consume()
+        assert budget.remaining == 0
+
+
+class TestCLIRetries:
+    """Test suite for retry behaviour of the CLI clients."""
+
+    @pytest.mark.client
+    def test_permanent_error_fails_fast(self, fake_binary, tmp_path):
+        """
+        Test: Verify a deterministic failure is attempted once, without backoff.
+        """
+        binary = fake_binary(returncode=1, stderr="Error: nokey.info: key not found")
+        cli = InjectiveCLI(binary_path=binary, retry_budget=RetryBudget(10))
+
+        start = time.monotonic()
+        with pytest.raises(InjectiveCLIError, match="key not found"):
+            cli.get_account_info("nokey")
+
+        assert _attempts(tmp_path) == 1
+        assert time.monotonic() - start < 1
+        assert cli.retry_budget.spent == 0
+
+    @pytest.mark.client
+    def test_transient_error_retried(self, fake_binary, tmp_path):
+        """
+        Test: Verify a transient failure uses every attempt and spends the budget.
+        """
+        binary = fake_binary(returncode=1, stderr="connection refused")
+        cli = InjectiveCLI(binary_path=binary, retry_policy=RetryPolicy(base_delay=0.01),
+                           retry_budget=RetryBudget(10))
+
+        with pytest.raises(InjectiveCLIError, match="connection refused"):
+            cli._run_command(["keys", "show", "val", "--address"])
+
+        assert _attempts(tmp_path) == 3
+        assert cli.retry_budget.spent == 2
+
+    @pytest.mark.client
+    def test_exhausted_budget_stops_retries(self, fake_binary, tmp_path):
+        """
+        Test: Verify no retries happen once the session budget is spent.
+        """
+        binary = fake_binary(returncode=1, stderr="connection refused")
+        cli = InjectiveCLI(binary_path=binary, retry_policy=RetryPolicy(base_delay=0.01),
+                           retry_budget=RetryBudget(1))
+
+        for _ in range(2):
+            with pytest.raises(InjectiveCLIError):
+                cli._run_command(["keys", "show", "val", "--address"])
+
+        # First call: 2 attempts (1 retry), second call: 1 attempt (budget empty)
+        assert _attempts(tmp_path) == 3
+
+    @pytest.mark.client
+    @pytest.mark.asyncio
+    async def test_async_permanent_error_fails_fast(self, fake_binary, tmp_path):
+        """
+        Test: Verify the async client applies the same classification.
+        """
+        binary = fake_binary(returncode=1, stderr="rpc error: code = NotFound desc = market not found")
+        cli = AsyncInjectiveCLI(binary_path=binary, retry_budget=RetryBudget(10))
+
+        with pytest.raises(InjectiveCLIError, match="market not found"):
+            await cli._run_command(["query", "exchange", "perpetual-market-info", "0xabc"])
+
+        assert _attempts(tmp_path) == 1
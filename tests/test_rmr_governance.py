@@ -48,10 +48,7 @@ class TestRMRGovernance:
         logger.info(f"Proposal {proposal_id} passed successfully")
         
         # Wait for market to be available
-        time.sleep(15)
-        
-        # Verify market was created
-        market = MarketUtils.get_market_by_ticker(unique_ticker)
+        market = MarketUtils.wait_for_market(unique_ticker)
         assert market is not None, f"Market {unique_ticker} should exist after governance"
         
         market_id = market.get("market", {}).get("market_id", "")
@@ -114,11 +111,8 @@ class TestRMRGovernance:
         proposal_id = MarketUtils.submit_and_pass_proposal(proposal_json, timeout=120)
         assert proposal_id is not None, "Valid RMR constraint should allow market creation"
         
-        # Wait for market creation
-        time.sleep(15)
-        
-        # Verify market exists and has correct RMR
-        market = MarketUtils.get_market_by_ticker(unique_ticker)
+        # Wait for market creation, then verify it exists and has correct RMR
+        market = MarketUtils.wait_for_market(unique_ticker)
         assert market is not None, "Market should be created with valid RMR constraint"
         
         market_id = market.get("market", {}).get("market_id", "")
@@ -180,10 +174,7 @@ class TestRMRGovernance:
         assert proposal_id is not None, "High precision RMR should be accepted"
         
         # Wait for market creation
-        time.sleep(15)
-        
-        # Verify market exists
-        market = MarketUtils.get_market_by_ticker(unique_ticker)
+        market = MarketUtils.wait_for_market(unique_ticker)
         assert market is not None, "Market should be created with high precision RMR"
         
         market_id = market.get("market", {}).get("market_id", "")
@@ -214,6 +205,7 @@ class TestRMRGovernance:
                 ("valid_low", "LOW")
             ]
             
+            scenarios = []
             for rmr_key, suffix in test_scenarios:
                 timestamp = int(time.time())
                 unique_id = str(uuid.uuid4())[:6]
@@ -228,15 +220,18 @@ class TestRMRGovernance:
                     quote_denom="usdt",
                     rmr=rmr
                 )
+                scenarios.append((ticker, rmr, proposal_json))
+            
+            # Pass all proposals together, in one voting period
+            outcomes = MarketUtils.submit_and_pass_proposals(
+                [proposal_json for _, _, proposal_json in scenarios], timeout=120
+            )
+            
+            for (ticker, rmr, _), outcome in zip(scenarios, outcomes):
+                assert outcome["success"], f"Market {ticker} should be created: {outcome['error']}"
                 
-                proposal_id = MarketUtils.submit_and_pass_proposal(proposal_json, timeout=120)
-                assert proposal_id is not None, f"Market {ticker} should be created"
-                
-                # Wait between creations to avoid conflicts
-                time.sleep(10)
-                
-                # Verify market exists
-                market = MarketUtils.get_market_by_ticker(ticker)
+                # Wait for the market to be created
+                market = MarketUtils.wait_for_market(ticker)
                 assert market is not None, f"Market {ticker} should exist"
                 
                 market_id = market.get("market", {}).get("market_id", "")
@@ -247,13 +242,10 @@ class TestRMRGovernance:
                 })
             
             # Verify all markets have correct RMR values
-            for market_info in markets_created:
-                rmr_correct = MarketUtils.verify_rmr_value(
-                    market_info["market_id"], 
-                    market_info["rmr"]
-                )
-                assert rmr_correct, \
-                    f"Market {market_info['ticker']} should have RMR={market_info['rmr']}"
+            mismatches = MarketUtils.verify_rmr_values(
+                {market_info["market_id"]: market_info["rmr"] for market_info in markets_created}
+            )
+            assert not mismatches, f"Markets should have their launch RMR values: {mismatches}"
             
             logger.info(f"Successfully created {len(markets_created)} markets with different RMR values")
             
@@ -4,7 +4,6 @@ Test cases for RMR market updates - updating existing market RMR values via admi
 
 import pytest
 import logging
-import time
 
 from market_utils import MarketUtils
 from test_config import config
@@ -45,7 +44,7 @@ class TestRMRUpdates:
         logger.info(f"Successfully updated market {market_id} RMR to {new_rmr}")
     
     @pytest.mark.updates
-    def test_rmr_update_persistence(self, clean_test_market, rmr_test_values):
+    def test_rmr_update_persistence(self, clean_test_market, rmr_test_values, clock):
         """
         Test: Verify updated RMR values persist across queries.
         
@@ -64,14 +63,14 @@ class TestRMRUpdates:
         assert update_success, "RMR update should succeed"
         
         # Wait a bit for blockchain state to settle
-        time.sleep(5)
+        clock.sleep(5)
         
         # Query multiple times to verify persistence
         for i in range(3):
             logger.info(f"Verification attempt {i+1}/3")
             rmr_correct = MarketUtils.verify_rmr_value(market_id, new_rmr)
             assert rmr_correct, f"RMR should persist across queries (attempt {i+1})"
-            time.sleep(2)
+            clock.sleep(2)
         
         logger.info("RMR update persistence verified")
     
@@ -167,7 +166,7 @@ class TestRMRUpdates:
         logger.info("High precision RMR update handled correctly")
     
     @pytest.mark.updates
-    def test_multiple_rmr_updates(self, clean_test_market, rmr_test_values):
+    def test_multiple_rmr_updates(self, clean_test_market, rmr_test_values, clock):
         """
         Test: Verify multiple consecutive RMR updates work correctly.
         
@@ -199,7 +198,7 @@ class TestRMRUpdates:
             assert rmr_correct, f"Update {i+1} should set RMR to {rmr_value}"
             
             # Wait between updates
-            time.sleep(3)
+            clock.sleep(3)
         
         logger.info("Multiple RMR updates completed successfully")
     
@@ -234,7 +233,7 @@ class TestRMRUpdates:
         # which is beyond the scope of this basic test suite
     
     @pytest.mark.updates
-    def test_rmr_update_idempotency(self, clean_test_market, rmr_test_values):
+    def test_rmr_update_idempotency(self, clean_test_market, rmr_test_values, clock):
         """
         Test: Verify RMR updates are idempotent.
         
@@ -259,7 +258,7 @@ class TestRMRUpdates:
             rmr_correct = MarketUtils.verify_rmr_value(market_id, target_rmr)
             assert rmr_correct, f"RMR should remain consistent after update {i+1}"
             
-            time.sleep(2)
+            clock.sleep(2)
         
         logger.info("RMR update idempotency verified")
     
@@ -0,0 +1,139 @@
+"""
+Test cases for the account sequence manager - pipelining many txs from one key.
+"""
+
+import pytest
+import json
+import logging
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+from injective_cli import InjectiveCLI
+from sequence_manager import SequenceManager, parse_expected_sequence
+
+
+logger = logging.getLogger(__name__)
+
+
+@pytest.fixture
+def sequenced_binary(tmp_path):
+    """
+    Fake injectived that tracks one account's sequence and rejects txs signed with the wrong one.
+
+    Returns the binary path and a helper to read or modify the fake chain state.
+    """
+    state_file = tmp_path / "chain.json"
+    state_file.write_text(json.dumps({"sequence": 7, "account_queries": 0, "accepted": []}))
+
+    script = tmp_path / "injectived"
+    script.write_text(
+        f"#!{sys.executable}\n"
+        "import json, sys\n"
+        f"state_file = {str(state_file)!r}\n"
+        "state = json.load(open(state_file))\n"
+        "args = sys.argv[1:]\n"
+        "if args[:2] == ['keys', 'show']:\n"
+        "    out = 'inj1sequenced'\n"
+        "elif args[:3] == ['query', 'auth', 'account']:\n"
+        "    state['account_queries'] += 1\n"
+        "    out = {'account': {'base_account': {'account_number': '42', 'sequence': str(state['sequence'])}}}\n"
+        "else:\n"
+        "    got = int(args[args.index('--sequence') + 1])\n"
+        "    assert args[args.index('--account-number') + 1] == '42'\n"
+        "    if got != state['sequence']:\n"
+        "        out = {'code': 32, 'txhash': 'BAD', 'raw_log': f\"account sequence mismatch, expected {state['sequence']}, got {got}: incorrect account sequence\"}\n"
+        "    elif 'reject' in args:\n"
+        "        out = {'code': 13, 'txhash': 'LOWFEE', 'raw_log': 'insufficient fee'}\n"
+        "    else:\n"
+        "        state['sequence'] += 1\n"
+        "        state['accepted'].append(got)\n"
+        "        out = {'code': 0, 'txhash': f'TX{got}'}\n"
+        "json.dump(state, open(state_file, 'w'))\n"
+        "print(out if isinstance(out, str) else json.dumps(out))\n"
+    )
+    script.chmod(0o755)
+
+    class Chain:
+        def read(self):
+            return json.loads(state_file.read_text())
+
+        def bump_sequence(self):
+            state = self.read()
+            state["sequence"] += 1
+            state_file.write_text(json.dumps(state))
+
+    return str(script), Chain()
+
+
+def _pipelined_cli(binary: str) -> InjectiveCLI:
+    cli = InjectiveCLI(binary_path=binary)
+    cli.sequence_manager = SequenceManager(cli.query_account_sequence)
+    return cli
+
+
+class TestSequenceManager:
+    """Test suite for pipelined tx broadcasting."""
+
+    @pytest.mark.client
+    def test_parse_expected_sequence(self):
+        """
+        Test: Verify the expected sequence is read from the node's mismatch error.
+        """
+        error = "account sequence mismatch, expected 12, got 11: incorrect account sequence"
+        assert parse_expected_sequence(error) == 12
+        assert parse_expected_sequence("insufficient fee") is None
+
+    @pytest.mark.client
+    def test_sequences_assigned_locally(self, sequenced_binary):
+        """
+        Test: Verify back-to-back txs get consecutive sequences from a single account query.
+        """
+        binary, chain = sequenced_binary
+        cli = _pipelined_cli(binary)
+
+        results = [cli.update_market_admin(f"0xmarket{i}", "0.1", "testcandidate") for i in range(5)]
+
+        assert [r["txhash"] for r in results] == ["TX7", "TX8", "TX9", "TX10", "TX11"]
+        assert chain.read()["account_queries"] == 1
+
+    @pytest.mark.client
+    def test_resync_after_external_tx(self, sequenced_binary):
+        """
+        Test: Verify a sequence mismatch resyncs to the node's expected sequence and re-signs.
+        """
+        binary, chain = sequenced_binary
+        cli = _pipelined_cli(binary)
+
+        assert cli.vote_proposal("1", "yes", "val")["txhash"] == "TX7"
+        chain.bump_sequence()  # Same key signed a tx elsewhere
+
+        assert cli.vote_proposal("2", "yes", "val")["txhash"] == "TX9"
+        assert chain.read()["accepted"] == [7, 9]
+        assert chain.read()["account_queries"] == 1, "Mismatch errors carry the expected sequence"
+
+    @pytest.mark.client
+    def test_checktx_rejection_keeps_sequence(self, sequenced_binary):
+        """
+        Test: Verify a tx rejected in CheckTx does not use up its sequence.
+        """
+        binary, chain = sequenced_binary
+        cli = _pipelined_cli(binary)
+
+        assert cli.vote_proposal("1", "reject", "val")["code"] == 13
+        assert cli.vote_proposal("1", "yes", "val")["txhash"] == "TX7"
+
+    @pytest.mark.client
+    def test_concurrent_broadcasts_from_one_key(self, sequenced_binary):
+        """
+        Test: Verify concurrent broadcasts from one key never reuse a sequence.
+        """
+        binary, chain = sequenced_binary
+        cli = _pipelined_cli(binary)
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(pool.map(
+                lambda i: cli.update_market_admin(f"0xmarket{i}", "0.1", "testcandidate"), range(6)
+            ))
+
+        assert all(r["code"] == 0 for r in results)
+        assert sorted(chain.read()["accepted"]) == list(range(7, 13))
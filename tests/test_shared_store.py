@@ -0,0 +1,161 @@
+"""
+Test cases for the file-locked store sharing results across xdist workers.
+"""
+
+import pytest
+import logging
+import multiprocessing
+import time
+
+from injective_cli import InjectiveCLI
+from query_cache import QueryCache
+from query_transport import RestQueryTransport
+from shared_store import SharedStore
+
+
+logger = logging.getLogger(__name__)
+
+
+def _slow_compute(directory, counter_path, results):
+    """Worker process body: compute a value slowly, counting computations in a file."""
+    def compute():
+        with open(counter_path, "a") as f:
+            f.write("x")
+        time.sleep(0.3)
+        return {"height": 42}
+
+    results.put(SharedStore(directory).get_or_compute("fixture:injective_node", compute))
+
+
+@pytest.mark.client
+class TestSharedStore:
+    """Test cross-process sharing and single-flight computation."""
+
+    def test_disabled_store_always_computes(self):
+        """
+        Test: Verify a store without a directory computes on every call
+        """
+        store = SharedStore("")
+        calls = []
+
+        for _ in range(3):
+            store.get_or_compute("key", lambda: calls.append(1) or len(calls))
+
+        assert len(calls) == 3
+        assert store.get("key") is None
+
+    def test_value_shared_between_stores(self, tmp_path):
+        """
+        Test: Verify a value computed through one store is read by another on the same directory
+        """
+        first, second = SharedStore(str(tmp_path)), SharedStore(str(tmp_path))
+
+        assert first.get_or_compute("fixture:test_keys", lambda: {"val": "inj1val"}) == {"val": "inj1val"}
+        assert second.get_or_compute("fixture:test_keys", lambda: pytest.fail("recomputed")) == {"val": "inj1val"}
+        assert first.computes == 1 and second.hits == 1
+
+    def test_other_scope_recomputed(self, tmp_path):
+        """
+        Test: Verify a value stored under another scope (block height) is stale
+        """
+        store = SharedStore(str(tmp_path))
+        store.get_or_compute("query:block", lambda: "at 100", scope="100")
+
+        assert store.get("query:block", scope="101") is None
+        assert store.get_or_compute("query:block", lambda: "at 101", scope="101") == "at 101"
+        assert store.get("query:block", scope="101") == "at 101"
+
+    def test_failed_compute_not_stored(self, tmp_path):
+        """
+        Test: Verify an exception reaches the caller and the next caller computes again
+        """
+        store = SharedStore(str(tmp_path))
+
+        def fail():
+            raise RuntimeError("node down")
+
+        with pytest.raises(RuntimeError, match="node down"):
+            store.get_or_compute("fixture:injective_node", fail)
+        assert store.get_or_compute("fixture:injective_node", lambda: {"connected": True}) == {"connected": True}
+
+    def test_single_flight_across_processes(self, tmp_path):
+        """
+        Test: Verify concurrent processes compute a missing value once and all receive it
+        """
+        context = multiprocessing.get_context("fork")
+        results = context.Queue()
+        counter = tmp_path / "computations"
+        processes = [
+            context.Process(target=_slow_compute, args=(str(tmp_path), str(counter), results))
+            for _ in range(4)
+        ]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join(timeout=10)
+
+        assert [results.get(timeout=1) for _ in processes] == [{"height": 42}] * 4
+        assert counter.read_text() == "x"
+
+    def test_cli_queries_shared_at_same_height(self, tmp_path, mock_node, monkeypatch):
+        """
+        Test: Verify a second client reads a cached query from the store instead of the node
+        """
+        monkeypatch.setenv("CACHE_HEIGHT_CHECK_INTERVAL", "3600")
+        mock_node.add_market("0xabc", "TST/USDT PERP")
+        transport = RestQueryTransport(mock_node.url)
+        clients = [
+            InjectiveCLI(binary_path="/nonexistent/injectived", transport=transport, cache=QueryCache(),
+                         shared_store=SharedStore(str(tmp_path)))
+            for _ in range(2)
+        ]
+
+        try:
+            clients[0].query_market("0xabc")
+            requests = mock_node.request_count
+            market = clients[1].query_market("0xabc")
+
+            # Only the second client's height check reaches the node
+            assert market["market"]["ticker"] == "TST/USDT PERP"
+            assert mock_node.request_count == requests + 1
+
+            mock_node.height += 1
+            clients[1].get_latest_block_height()
+            clients[1].query_market("0xabc")
+            assert mock_node.request_count == requests + 3
+            assert clients[1].cache_stats()["shared"]["computes"] == 1
+        finally:
+            transport.close()
+
+    def test_own_invalidation_bypasses_shared_results(self, tmp_path, mock_node, monkeypatch):
+        """
+        Test: Verify a client that changed a market reads it from the node, not another worker's copy
+        """
+        monkeypatch.setenv("CACHE_HEIGHT_CHECK_INTERVAL", "3600")
+        mock_node.add_market("0xabc", "TST/USDT PERP", rmr="0.100000000000000000")
+        transport = RestQueryTransport(mock_node.url)
+        clients = [
+            InjectiveCLI(binary_path="/nonexistent/injectived", transport=transport, cache=QueryCache(),
+                         shared_store=SharedStore(str(tmp_path)))
+            for _ in range(2)
+        ]
+
+        try:
+            clients[0].query_market("0xabc")
+            clients[1].get_latest_block_height()
+            # clients[1] updates the market; the change is visible at the same height
+            clients[1]._invalidate("market:0xabc", "markets")
+            mock_node.markets["0xabc"]["reduce_margin_ratio"] = "0.150000000000000000"
+
+            market = clients[1].query_market("0xabc")
+            assert market["market"]["reduce_margin_ratio"] == "0.150000000000000000"
+
+            # Once the height moves on, the shared store is used again
+            mock_node.height += 1
+            clients[1].get_latest_block_height()
+            clients[0].get_latest_block_height()
+            clients[0].query_market("0xabc")
+            clients[1].query_market("0xabc")
+            assert clients[1].cache_stats()["shared"]["hits"] == 1
+        finally:
+            transport.close()
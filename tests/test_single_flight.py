@@ -0,0 +1,133 @@
+"""
+Test cases for single-flight coalescing of concurrent identical CLI queries.
+"""
+
+import pytest
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from deadline import deadline_scope
+from injective_cli import InjectiveCLI, DeadlineExceeded
+from single_flight import SingleFlight
+
+
+logger = logging.getLogger(__name__)
+
+
+class TestSingleFlight:
+    """Test suite for request coalescing."""
+
+    @pytest.mark.client
+    def test_concurrent_queries_spawn_one_process(self, fake_binary, tmp_path, monkeypatch):
+        """
+        Test: Verify concurrent identical queries share one injectived process.
+        """
+        monkeypatch.setenv("QUERY_CACHE", "false")
+        cli = InjectiveCLI(binary_path=fake_binary(0.5))
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            heights = list(pool.map(lambda _: cli.get_latest_block_height(), range(8)))
+
+        assert heights == [42] * 8
+        assert len(list(tmp_path.glob("pid.*"))) == 1, "Only one process should have been spawned"
+        assert cli.single_flight.stats() == {"executions": 1, "shared": 7}
+
+    @pytest.mark.client
+    def test_followers_get_independent_copies(self):
+        """
+        Test: Verify followers cannot mutate the result seen by other callers.
+        """
+        flight = SingleFlight()
+        release = threading.Event()
+        results = []
+
+        def leader_work():
+            release.wait()
+            return {"markets": []}
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            futures = [pool.submit(flight.do, "key", leader_work) for _ in range(2)]
+            while flight.stats()["shared"] < 1:
+                time.sleep(0.01)
+            release.set()
+            results = [f.result() for f in futures]
+
+        results[0]["markets"].append("mutated")
+        assert results[1]["markets"] == []
+
+    @pytest.mark.client
+    def test_errors_propagate_to_all_callers(self):
+        """
+        Test: Verify a failing execution raises in every coalesced caller, then clears.
+        """
+        flight = SingleFlight()
+        release = threading.Event()
+
+        def failing_work():
+            release.wait()
+            raise RuntimeError("node down")
+
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            futures = [pool.submit(flight.do, "key", failing_work) for _ in range(3)]
+            while flight.stats()["shared"] < 2:
+                time.sleep(0.01)
+            release.set()
+            for future in futures:
+                with pytest.raises(RuntimeError, match="node down"):
+                    future.result()
+
+        # Nothing is left in flight, so the next call executes again
+        assert flight.do("key", lambda: "ok") == "ok"
+        assert flight.stats()["executions"] == 2
+
+    @pytest.mark.client
+    def test_follower_respects_its_deadline(self, fake_binary, monkeypatch):
+        """
+        Test: Verify a follower gives up at its own deadline while the leader keeps running.
+        """
+        monkeypatch.setenv("QUERY_CACHE", "false")
+        cli = InjectiveCLI(binary_path=fake_binary(1.0))
+
+        def follow():
+            with deadline_scope(0.2):
+                cli.get_latest_block_height()
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            leader = pool.submit(cli.get_latest_block_height)
+            while cli.single_flight.stats()["executions"] < 1:
+                time.sleep(0.01)
+            start = time.monotonic()
+            with pytest.raises(DeadlineExceeded):
+                pool.submit(follow).result()
+            assert time.monotonic() - start < 0.8
+            assert leader.result() == 42
+
+    @pytest.mark.client
+    def test_leader_result_not_shared(self):
+        """
+        Test: Verify the leader's result is not the object followers copy from.
+        """
+        flight = SingleFlight()
+        release = threading.Event()
+
+        def leader_work():
+            release.wait()
+            return {"markets": []}
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            leader = pool.submit(flight.do, "key", leader_work)
+            while flight.stats()["executions"] < 1:
+                time.sleep(0.01)
+            calls = list(flight._calls.values())
+            follower = pool.submit(flight.do, "key", leader_work)
+            while flight.stats()["shared"] < 1:
+                time.sleep(0.01)
+            release.set()
+            leader_result = leader.result()
+
+        assert leader_result is not calls[0].result
+        leader_result["markets"].append("mutated")
+        assert calls[0].result == {"markets": []}
+        assert follower.result() == {"markets": []}
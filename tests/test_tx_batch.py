@@ -0,0 +1,116 @@
+"""
+Test cases for multi-message transactions - bulk RMR updates and market launches.
+"""
+
+import pytest
+import logging
+
+from market_utils import MarketUtils
+from tx_batch import plan_batches, merge_unsigned_txs, message_results
+
+
+logger = logging.getLogger(__name__)
+
+
+def _unsigned_tx(market_id: str, fee: str) -> dict:
+    return {
+        "body": {"messages": [{"@type": "/injective.exchange.v1beta1.MsgAdminUpdatePerpetualMarket",
+                               "market_id": market_id}]},
+        "auth_info": {"fee": {"amount": [{"denom": "inj", "amount": fee}], "gas_limit": "200000"}},
+    }
+
+
+@pytest.mark.client
+class TestBatchPlanning:
+    """Test splitting messages into txs."""
+
+    def test_message_cap(self):
+        """
+        Test: Verify batches never exceed the message cap and keep order
+        """
+        batches = plan_batches(list(range(7)), max_messages=3, max_gas=10**9, gas_per_message=1)
+        assert batches == [[0, 1, 2], [3, 4, 5], [6]]
+
+    def test_gas_cap(self):
+        """
+        Test: Verify the gas limit caps messages per batch when it is tighter
+        """
+        batches = plan_batches(list(range(5)), max_messages=25, max_gas=400000, gas_per_message=200000)
+        assert [len(batch) for batch in batches] == [2, 2, 1]
+
+    def test_size_cap(self):
+        """
+        Test: Verify a batch is closed before it exceeds the byte limit
+        """
+        batches = plan_batches(["a" * 40] * 5, max_messages=25, max_gas=10**9, gas_per_message=1,
+                               max_bytes=100, size_of=len)
+        assert [len(batch) for batch in batches] == [2, 2, 1]
+
+    def test_merge_unsigned_txs(self):
+        """
+        Test: Verify merging keeps every message in order, sums fees and sets the gas limit
+        """
+        merged = merge_unsigned_txs([_unsigned_tx("0x1", "100"), _unsigned_tx("0x2", "250")], 400000)
+
+        assert [msg["market_id"] for msg in merged["body"]["messages"]] == ["0x1", "0x2"]
+        assert merged["auth_info"]["fee"]["amount"] == [{"denom": "inj", "amount": "350"}]
+        assert merged["auth_info"]["fee"]["gas_limit"] == "400000"
+
+    def test_message_results(self):
+        """
+        Test: Verify a failed tx blames the named message and reports the rest as reverted
+        """
+        ok = message_results(["a", "b"], {"code": 0, "txhash": "T1", "height": "9"})
+        assert all(result["success"] and result["txhash"] == "T1" for result in ok.values())
+
+        failed = message_results(["a", "b", "c"], {
+            "code": 5, "txhash": "T2",
+            "raw_log": "failed to execute message; message index: 1: invalid reduce margin ratio",
+        })
+        assert not any(result["success"] for result in failed.values())
+        assert "invalid reduce margin ratio" in failed["b"]["error"]
+        assert failed["a"]["error"].startswith("reverted") and failed["c"]["error"].startswith("reverted")
+
+
+@pytest.mark.client
+class TestBulkMarketOperations:
+    """Test bulk launches and RMR updates against the mock chain."""
+
+    def test_launch_and_update_in_batches(self, mock_chain):
+        """
+        Test: Verify markets launched through batched proposals can be updated through batched txs
+        """
+        markets = [
+            {"ticker": f"BATCH{i}/USDT", "base_denom": f"batch{i}", "quote_denom": "usdt", "rmr": 0.3}
+            for i in range(3)
+        ]
+        launched = MarketUtils.launch_markets(markets, max_messages=2, timeout=60)
+
+        assert all(result["success"] for result in launched.values()), launched
+        assert len({result["proposal_id"] for result in launched.values()}) == 2
+        market_ids = [launched[market["ticker"]]["market_id"] for market in markets]
+
+        results = MarketUtils.update_market_rmrs({market_id: 0.25 for market_id in market_ids}, max_messages=2)
+
+        assert all(result["success"] for result in results.values()), results
+        assert len({result["txhash"] for result in results.values()}) == 2
+        assert not MarketUtils.verify_rmr_values({market_id: 0.25 for market_id in market_ids})
+
+    def test_invalid_update_reverts_its_tx(self, mock_chain):
+        """
+        Test: Verify one invalid update fails its whole tx while other txs apply
+        """
+        markets = [
+            {"ticker": f"REVERT{i}/USDT", "base_denom": f"revert{i}", "quote_denom": "usdt", "rmr": 0.3}
+            for i in range(3)
+        ]
+        launched = MarketUtils.launch_markets(markets, timeout=60)
+        first, second, third = [launched[market["ticker"]]["market_id"] for market in markets]
+
+        # IMR defaults to 0.05, so 0.01 is rejected
+        results = MarketUtils.update_market_rmrs({first: 0.2, second: 0.01, third: 0.2}, max_messages=2)
+
+        assert "reverted" in results[first]["error"]
+        assert not results[second]["success"] and "reverted" not in results[second]["error"]
+        assert results[third]["success"]
+        assert not MarketUtils.verify_rmr_values({first: 0.3, third: 0.2})
@@ -0,0 +1,131 @@
+"""
+Test cases for the generate/sign/broadcast tx pipeline.
+"""
+
+import pytest
+import base64
+import json
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+import market_utils
+from block_waiter import BlockWaiter
+from injective_cli import InjectiveCLI
+from market_utils import MarketUtils
+from query_transport import RestQueryTransport
+from tx_pipeline import TxPipeline
+
+
+logger = logging.getLogger(__name__)
+
+
+@pytest.fixture
+def state_file(tmp_path, monkeypatch):
+    """
+    Give the repo's mock injectived a private state file.
+    """
+    path = tmp_path / "state.json"
+    monkeypatch.setenv("MOCK_INJECTIVE_STATE_FILE", str(path))
+    return path
+
+
+@pytest.fixture
+def pipelined_cli(state_file, mock_node, mock_binary):
+    """
+    CLI against the mock injectived that sends every tx through a TxPipeline, counting sign invocations.
+    """
+    mock_node.start_producing(0.05)
+    client = InjectiveCLI(binary_path=mock_binary, block_waiter=BlockWaiter(mock_node.node_url))
+    client.tx_pipeline = TxPipeline(client)
+    client.sign_batches = []
+
+    sign_txs = client.sign_txs
+
+    def counting_sign_txs(txs, from_key, **kwargs):
+        client.sign_batches.append(len(txs))
+        return sign_txs(txs, from_key, **kwargs)
+
+    client.sign_txs = counting_sign_txs
+    yield client
+    client.tx_pipeline.close()
+
+
+@pytest.mark.client
+class TestTxPipeline:
+    """Test batched signing and ordered broadcasting."""
+
+    def test_concurrent_votes_share_sign_invocations(self, pipelined_cli, state_file):
+        """
+        Test: Verify concurrent txs from one key are all accepted with fewer sign invocations than txs
+        """
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(
+                lambda i: pipelined_cli.vote_proposal(str(i), "yes", "val"), range(8)
+            ))
+
+        assert all(result["code"] == 0 for result in results)
+        assert len({result["txhash"] for result in results}) == 8
+        assert sum(pipelined_cli.sign_batches) == 8
+        assert len(pipelined_cli.sign_batches) < 8
+        assert json.loads(state_file.read_text())["sequences"]["val"] == 8
+
+    def test_stale_sequence_is_resigned(self, pipelined_cli, state_file, mock_binary):
+        """
+        Test: Verify a tx signed with a stale sequence is re-signed and accepted
+        """
+        assert pipelined_cli.vote_proposal("1", "yes", "val")["code"] == 0
+
+        # Another client uses the key behind the pipeline's back
+        InjectiveCLI(binary_path=mock_binary).vote_proposal("2", "yes", "val")
+
+        result = pipelined_cli.vote_proposal("3", "yes", "val")
+
+        assert result["code"] == 0
+        assert pipelined_cli.sign_batches == [1, 1, 1]
+        assert json.loads(state_file.read_text())["sequences"]["val"] == 3
+
+    def test_market_flow_through_pipeline(self, pipelined_cli, monkeypatch):
+        """
+        Test: Verify proposal submission, voting and admin updates work through the pipeline
+        """
+        monkeypatch.setattr(market_utils, "cli", pipelined_cli)
+
+        market_id = market_utils.create_test_market("PIPE/USDT", 0.3, timeout=60)
+
+        assert MarketUtils.update_market_rmr(market_id, 0.25)
+        assert MarketUtils.verify_rmr_value(market_id, 0.25)
+
+
+@pytest.mark.client
+class TestNativeBroadcast:
+    """Test broadcasting signed tx bytes over REST."""
+
+    def test_rest_transport_broadcast(self, mock_node):
+        """
+        Test: Verify signed bytes are posted to the tx service and the TxResponse is returned
+        """
+        transport = RestQueryTransport(mock_node.url)
+
+        result = transport.broadcast("c2lnbmVk")
+
+        assert result["code"] == 0 and result["txhash"]
+        assert mock_node.broadcasts == ["c2lnbmVk"]
+
+    def test_pipeline_encodes_and_posts(self, state_file, mock_node, mock_binary):
+        """
+        Test: Verify with a REST transport the pipeline encodes signed txs and posts them in order
+        """
+        mock_node.add_account("inj1validator123456789", account_number=2, sequence=5)
+        client = InjectiveCLI(binary_path=mock_binary, transport=RestQueryTransport(mock_node.url))
+        pipeline = TxPipeline(client)
+        try:
+            futures = [pipeline.submit(["tx", "gov", "vote", str(i), "yes", "--from", "val"], "val")
+                       for i in range(3)]
+            results = [future.result(timeout=60) for future in futures]
+        finally:
+            pipeline.close()
+
+        assert all(result["code"] == 0 for result in results)
+        signed = [json.loads(base64.b64decode(tx_bytes)) for tx_bytes in mock_node.broadcasts]
+        assert [tx["body"]["messages"][0]["proposal_id"] for tx in signed] == ["0", "1", "2"]
+        assert [tx["auth_info"]["signer_infos"][0]["sequence"] for tx in signed] == ["5", "6", "7"]
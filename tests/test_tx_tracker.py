@@ -0,0 +1,118 @@
+"""
+Test cases for transaction inclusion tracking - resolving broadcast txs as soon as they land.
+"""
+
+import pytest
+import logging
+import time
+
+from block_waiter import BlockWaiter
+from injective_cli import InjectiveCLI, InjectiveCLIError
+from query_transport import RestQueryTransport
+from tx_tracker import TxTracker, TxTimeout
+
+
+logger = logging.getLogger(__name__)
+
+
+def _wait_for_subscriber(mock_node, timeout: float = 5.0):
+    deadline = time.monotonic() + timeout
+    while mock_node.subscriber_count == 0 and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+class TestTxTracker:
+    """Test suite for TxTracker."""
+
+    @pytest.mark.client
+    def test_resolves_on_tx_event(self, mock_node):
+        """
+        Test: Verify a tracked tx resolves from its Tx event without waiting for a poll.
+        """
+        tracker = TxTracker(lambda txhash: None, rpc_url=mock_node.url, poll_interval=60)
+        events = [{"type": "submit_proposal", "attributes": [{"key": "proposal_id", "value": "9"}]}]
+
+        try:
+            tracker.track("ABC123")
+            _wait_for_subscriber(mock_node)
+            mock_node.include_tx("ABC123", events=events)
+
+            start = time.monotonic()
+            result = tracker.wait("ABC123", timeout=5)
+            assert time.monotonic() - start < 1
+        finally:
+            tracker.close()
+
+        assert result["code"] == 0
+        assert result["height"] == str(mock_node.height)
+        assert result["events"] == events
+
+    @pytest.mark.client
+    def test_batch_with_mixed_results(self, mock_node):
+        """
+        Test: Verify many pending hashes are tracked at once with their own result codes.
+        """
+        tracker = TxTracker(lambda txhash: None, rpc_url=mock_node.url, poll_interval=60)
+        hashes = [f"HASH{i}" for i in range(5)]
+
+        try:
+            for txhash in hashes:
+                tracker.track(txhash)
+            _wait_for_subscriber(mock_node)
+            for i, txhash in enumerate(hashes):
+                mock_node.include_tx(txhash, code=0 if i % 2 == 0 else 11, raw_log="out of gas" if i % 2 else "")
+
+            results = tracker.wait_all(hashes, timeout=5)
+        finally:
+            tracker.close()
+
+        assert [results[txhash]["code"] for txhash in hashes] == [0, 11, 0, 11, 0]
+        assert tracker.pending_count() == 0
+
+    @pytest.mark.client
+    def test_polls_when_no_event_stream(self):
+        """
+        Test: Verify hashes resolve by polling when there is no websocket (or the tx landed earlier).
+        """
+        included = {"OLD": {"txhash": "OLD", "height": "5", "code": "0", "events": []}}
+        tracker = TxTracker(included.get, rpc_url=None, poll_interval=0.05)
+
+        try:
+            result = tracker.wait("OLD", timeout=2)
+        finally:
+            tracker.close()
+
+        assert result["code"] == 0, "Codes from query tx are normalized to int"
+
+    @pytest.mark.client
+    def test_timeout(self):
+        """
+        Test: Verify a never-included tx raises TxTimeout naming the missing hash.
+        """
+        tracker = TxTracker(lambda txhash: None, rpc_url=None, poll_interval=0.05)
+
+        try:
+            with pytest.raises(TxTimeout, match="LOST"):
+                tracker.wait("LOST", timeout=0.3)
+        finally:
+            tracker.close()
+
+        assert tracker.pending_count() == 0, "Timed-out hashes should stop being polled"
+
+    @pytest.mark.client
+    def test_cli_wait_for_tx(self, mock_node):
+        """
+        Test: Verify InjectiveCLI.wait_for_tx resolves through the REST transport and RPC events.
+        """
+        transport = RestQueryTransport(mock_node.url)
+        cli = InjectiveCLI(transport=transport, block_waiter=BlockWaiter(mock_node.node_url))
+
+        try:
+            mock_node.include_tx("EARLY", code=0)
+            assert cli.wait_for_tx("EARLY", timeout=5)["code"] == 0
+
+            with pytest.raises(InjectiveCLIError, match="not included"):
+                cli.wait_for_tx("NEVER", timeout=0.3)
+        finally:
+            cli.tx_tracker.close()
+            transport.close()
@@ -0,0 +1,113 @@
+"""
+Test cases for per-worker test accounts under pytest-xdist.
+"""
+
+import pytest
+import json
+import logging
+from types import SimpleNamespace
+
+import worker_accounts
+from address_cache import AddressCache
+from market_utils import MarketUtils
+from test_config import config
+from worker_accounts import ADMIN_MSG_TYPE, provision_worker_accounts, use_worker_account
+from tests import conftest
+
+
+logger = logging.getLogger(__name__)
+
+
+@pytest.fixture
+def mock_chain(mock_chain, tmp_path, monkeypatch):
+    """
+    Also point worker_accounts at the mock injectived, recording its commands.
+    """
+    # use_worker_account writes these; monkeypatch restores them after the test
+    monkeypatch.setenv("ADMIN_KEY", config.admin_key)
+    monkeypatch.setenv("ADMIN_GRANTER", "")
+    mock_chain.address_cache = AddressCache(path=str(tmp_path / "addresses.json"))
+    mock_chain.commands = []
+    run_command = mock_chain._run_command
+    mock_chain._run_command = lambda cmd, retry_count=None: mock_chain.commands.append(cmd) or run_command(cmd, retry_count)
+    monkeypatch.setattr(worker_accounts, "cli", mock_chain)
+    return mock_chain
+
+
+@pytest.mark.client
+class TestWorkerAccounts:
+    """Test provisioning worker keys and signing admin updates through authz."""
+
+    def test_provision_funds_and_grants_in_one_tx_each(self, mock_chain):
+        """
+        Test: Verify N worker keys are added, funded in one multi-send and granted in one tx
+        """
+        accounts = provision_worker_accounts(["gw0", "gw1", "gw2"])
+
+        assert [account["key"] for account in accounts.values()] == ["worker_gw0", "worker_gw1", "worker_gw2"]
+        assert len({account["address"] for account in accounts.values()}) == 3
+        assert all(account["granter"] == config.admin_key for account in accounts.values())
+        sends = [cmd for cmd in mock_chain.commands if cmd[:3] == ["tx", "bank", "multi-send"]]
+        assert len(sends) == 1 and all(account["address"] in sends[0] for account in accounts.values())
+        grants = [cmd for cmd in mock_chain.commands if cmd[:3] == ["tx", "authz", "grant"]]
+        assert len(grants) == 3 and all("--generate-only" in cmd and ADMIN_MSG_TYPE in cmd for cmd in grants)
+        assert sum(cmd[:2] == ["tx", "sign-batch"] for cmd in mock_chain.commands) == 1
+
+    def test_existing_keys_reused(self, mock_chain, tmp_path):
+        """
+        Test: Verify provisioning again does not add the worker keys a second time
+        """
+        first = provision_worker_accounts(["gw0", "gw1"])
+        # A fresh address cache, as in a new session, finds the keys in the keyring
+        mock_chain.address_cache = AddressCache(path=str(tmp_path / "fresh.json"))
+
+        second = provision_worker_accounts(["gw0", "gw1"])
+
+        assert second == first
+        assert sum(cmd[:2] == ["keys", "add"] for cmd in mock_chain.commands) == 2
+
+    def test_worker_updates_market_through_authz(self, mock_chain):
+        """
+        Test: Verify a worker key updates a market's RMR by exec-ing the admin's message
+        """
+        proposal = MarketUtils.create_market_proposal_json("WORK/USDT PERP", "work", "usdt", rmr=0.1)
+        MarketUtils.submit_and_pass_proposal(proposal, timeout=60)
+        market_id = MarketUtils.wait_for_market("WORK/USDT PERP", timeout=5)["market"]["market_id"]
+
+        use_worker_account(provision_worker_accounts(["gw0"])["gw0"])
+
+        assert config.admin_key == "worker_gw0"
+        assert MarketUtils.update_market_rmr(market_id, 0.15)
+        exec_cmds = [cmd for cmd in mock_chain.commands if cmd[:3] == ["tx", "authz", "exec"]]
+        assert len(exec_cmds) == 1 and "worker_gw0" in exec_cmds[0]
+
+    def test_ungranted_worker_rejected(self, mock_chain, monkeypatch):
+        """
+        Test: Verify an admin update from a worker without a grant fails on chain
+        """
+        proposal = MarketUtils.create_market_proposal_json("NOGRANT/USDT PERP", "nogrant", "usdt", rmr=0.1)
+        MarketUtils.submit_and_pass_proposal(proposal, timeout=60)
+        market_id = MarketUtils.wait_for_market("NOGRANT/USDT PERP", timeout=5)["market"]["market_id"]
+        mock_chain.add_key("worker_rogue")
+        monkeypatch.setenv("ADMIN_KEY", "worker_rogue")
+        monkeypatch.setenv("ADMIN_GRANTER", "testcandidate")
+
+        assert not MarketUtils.update_market_rmr(market_id, 0.15)
+
+    def test_xdist_hooks_hand_each_worker_its_account(self, monkeypatch):
+        """
+        Test: Verify the controller passes each worker its account and the worker signs as it
+        """
+        accounts = {"gw0": {"key": "worker_gw0", "address": "inj1w0", "granter": "testcandidate"}}
+        monkeypatch.setattr(conftest, "_worker_accounts", accounts)
+        monkeypatch.setenv("ADMIN_KEY", config.admin_key)
+        monkeypatch.setenv("ADMIN_GRANTER", "")
+        node = SimpleNamespace(gateway=SimpleNamespace(id="gw0"), workerinput={})
+        other = SimpleNamespace(gateway=SimpleNamespace(id="gw1"), workerinput={})
+
+        conftest.pytest_configure_node(node)
+        conftest.pytest_configure_node(other)
+        use_worker_account(json.loads(node.workerinput["worker_account"]))
+
+        assert other.workerinput == {}
+        assert config.admin_key == "worker_gw0" and config.admin_granter == "testcandidate"